@@ -42,6 +42,11 @@ py -%targetpyver% -m coverage run -m unittest discover || GOTO :error
 (echo # COVERAGE & echo. ) > "./reports/COVERAGE.md" || GOTO :error
 py -%targetpyver% -m coverage report --format=markdown >> "./reports/COVERAGE.md" || GOTO :error
 
+echo _____BENCHMARK_____
+py -%targetpyver% -m %modulename%.benchmarks --quiet --json "./reports/BENCHMARK.json" --markdown "./reports/BENCHMARK.md" || GOTO :error
+py -%targetpyver% -m %modulename%.benchmarks --memory --quiet --json "./reports/MEMORY.json" --markdown "./reports/MEMORY.md" || GOTO :error
+py -%targetpyver% -m %modulename%.benchmarks --imports --quiet --json "./reports/IMPORTS.json" --markdown "./reports/IMPORTS.md" || GOTO :error
+
 echo _____PIPREQS_____
 py -%targetpyver% -c "from pipreqs.pipreqs import main; main()" --mode gt --debug --force || GOTO :error
 
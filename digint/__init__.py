@@ -6,8 +6,23 @@
      .. include:: ../LICENCE
 """
 
+from importlib import import_module
 from .digint import PositionalBasedIntiger, ExtendedBasedIntiger, digitint
 from .notation_format import NotationFormat
 
 __version__ = "1.0.3.0"
 __all__ = ["PositionalBasedIntiger", "ExtendedBasedIntiger", "digitint", "NotationFormat"]
+
+# the optional subsystems, only imported once they are first used (ie. `digint.benchmarks`),
+# so that importing `digint` itself stays fast
+_LAZY_SUBMODULES = ("aio", "batch", "benchmarks", "benford", "checkdigit", "search", "stats")
+
+
+def __getattr__(name:str):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
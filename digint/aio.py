@@ -0,0 +1,194 @@
+"""
+aio
+
+Holds the asynchronous digit and notation streams of the `digint` module,
+used by `PositionalBasedIntiger.aiter_digits` and `PositionalBasedIntiger.anotate_chunks`.
+
+The digits of a large value are found a block at a time by splitting the value the same way
+`digint.conversion` splits it, by a power of the base and then again for each half,
+except that the halves are visited in order and the event loop is yielded to after every split
+and every block, so no single step holds up the loop for long.
+The largest steps (the splits) can also be run in an executor,
+where they only need the raw intigers, so both thread and process pools can be used.
+Base 1, negative bases and powers of two have their digits found all at once (also optionally
+in an executor) and are then streamed in blocks.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from math import log
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import DigitArray, power, split_divmod, is_power_of_two
+from .conversion import int_to_digits, notation_sign
+from .notation_format import NotationFormat, DEFAULT_FORMAT
+from .errors import NotationError
+
+
+async def _run(executor:Optional[Executor], func:Callable[..., Any], *args:Any) -> Any:
+    # runs a step in the executor when one is given,
+    # otherwise runs it here and then yields to the event loop
+    if executor is not None:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    result = func(*args)
+    await asyncio.sleep(0)
+    return result
+
+
+def _split_at(value:int, base:int, digits:int) -> Tuple[int, int]:
+    # finds the power and splits by it in one step, so both run in the executor when one is given
+    return split_divmod(value, power(base, digits))
+
+
+async def _split_blocks(value:int,
+                        base:int,
+                        count:int,
+                        block:int,
+                        from_msd:bool,
+                        top:bool,
+                        executor:Optional[Executor]
+                        ) -> AsyncIterator[DigitArray]:
+    # the digits of a value `count` blocks long, a block at a time,
+    # where every block other than the top one is padded to its full length
+    if count <= 1:
+        yield int_to_digits(value, base, 0 if top else block)
+        await asyncio.sleep(0)
+        return
+
+    # split at the largest power of two below the count, as `int_to_digits` does
+    half = 1 << ((count - 1).bit_length() - 1)
+    high, low = await _run(executor, _split_at, value, base, half * block)
+    if top and high == 0:
+        # the amount of blocks of the top value is only estimated, so it may be one block short
+        parts:Tuple[Tuple[int, int, bool], ...] = ((low, half, True), )
+    else:
+        parts = ((high, count - half, top), (low, half, False))
+    for part, part_count, part_top in (parts if from_msd else reversed(parts)):
+        async for digits in _split_blocks(part, base, part_count, block,
+                                          from_msd, part_top, executor):
+            yield digits
+
+
+async def digit_blocks(value:int,
+                       base:int,
+                       *,
+                       block:int = 4096,
+                       from_msd:bool = False,
+                       executor:Optional[Executor] = None,
+                       digits:Optional[DigitArray] = None
+                       ) -> AsyncIterator[DigitArray]:
+    """
+    `digit_blocks`
+
+    Asynchronously finds the digits of the given intiger, a block at a time,
+    yielding to the event loop between every block.
+    Each block starts at a place that is a multiple of `block` from the units spot,
+    and holds the digits of the same place values as `int_to_digits(value, base)` would.
+
+    Arguments:
+        value -- The value to find the digits of.
+        base -- The base of the digits.
+
+    Keyword Arguments:
+        block -- The amount of digits in each block. Defaults to 4096.
+        from_msd -- When true, the blocks are given from the greatest place value down,
+            otherwise they start at the units spot. Defaults to False.
+        executor -- When not `None`, the largest steps are run in this executor
+            (ie. a `concurrent.futures.ThreadPoolExecutor` or `ProcessPoolExecutor`).
+            Defaults to `None`.
+        digits -- When not `None`, the already found digits of the value,
+            which are streamed instead. Defaults to `None`.
+
+    Raises:
+        ValueError: Raised when the block is less than 1.
+
+    Yields:
+        The blocks of digit values, each starting at its lowest place value.
+    """
+    if block < 1:
+        raise ValueError("The block must be at least 1", block)
+
+    if digits is None and (base < 2 or is_power_of_two(base)):
+        digits = await _run(executor, int_to_digits, value, base)
+
+    if digits is not None:
+        starts = range(0, len(digits), block)
+        for start in (reversed(starts) if from_msd else starts):
+            yield digits[start:start + block]
+            await asyncio.sleep(0)
+        return
+
+    value = abs(value)
+    if value == 0:
+        return
+    # the digit length is overestimated from the bit length, rather than found exactly,
+    # as finding it takes as long as a split
+    length = int(value.bit_length() * log(2) / log(base)) + 2
+    async for blocked in _split_blocks(value, base, -(-length // block), block,
+                                       from_msd, True, executor):
+        yield blocked
+
+
+async def notation_chunks(value:int,
+                          base:int,
+                          notation_format:NotationFormat = DEFAULT_FORMAT,
+                          *,
+                          block:int = 4096,
+                          executor:Optional[Executor] = None,
+                          digits:Optional[DigitArray] = None
+                          ) -> AsyncIterator[str]:
+    """
+    `notation_chunks`
+
+    Asynchronously notates the given intiger, a chunk at a time,
+    yielding to the event loop between every chunk.
+    Joining the chunks gives the same notation as `digitint(value, base).notate(notation_format)`.
+
+    Arguments:
+        value -- The value to notate.
+        base -- The base to notate the value in.
+
+    Keyword Arguments:
+        notation_format -- The notation format to use. Defaults to `DEFAULT_FORMAT`.
+        block -- The amount of digits notated in each chunk,
+            rounded up to a whole amount of groups when the format splits digits into groups.
+            Defaults to 4096.
+        executor -- When not `None`, the largest steps are run in this executor. Defaults to `None`.
+        digits -- When not `None`, the already found digits of the value. Defaults to `None`.
+
+    Raises:
+        ValueError: Raised when the block is less than 1.
+        NotationError: Raised when a needed sign symbol or digit symbol is not in the format.
+
+    Yields:
+        The chunks of the notation, starting with the sign and the greatest place value.
+    """
+    if block < 1:
+        raise ValueError("The block must be at least 1", block)
+
+    if base == 1:
+        if notation_format.unity is None:
+            raise NotationError("Cannot notate base 1 without a digit for unity")
+        # the sign symbol is found by notating a single unity digit with it
+        sign = notation_format.notate_digits((1, ), (value > 0) - (value < 0))
+        sign = sign[:len(sign) - len(notation_format.unity)]
+        if sign != "":
+            yield sign
+        for start in range(0, abs(value), block):
+            yield notation_format.unity * min(block, abs(value) - start)
+            await asyncio.sleep(0)
+        return
+
+    sign = notation_sign(value, base)
+    joint = ""
+    if notation_format.group_split_symbol is not None and notation_format.group_split_count > 0:
+        joint = notation_format.group_split_symbol
+        block = -(-block // notation_format.group_split_count) * notation_format.group_split_count
+
+    first = True
+    async for blocked in digit_blocks(value, base, block = block, from_msd = True,
+                                      executor = executor, digits = digits):
+        yield (notation_format.notate_digits(blocked, sign) if first
+               else joint + notation_format.notate_digits(blocked, 0))
+        first = False
+    if first:
+        yield notation_format.notate_digits((), sign)
@@ -0,0 +1,657 @@
+"""
+batch
+
+Holds the batch conversions of the `digint` module,
+for notating and parsing many intigers in the same base and notation format at once.
+
+Large batches are split into chunks that are converted across a pool of processes.
+Only the raw intigers (or notations) of each chunk are sent to the processes,
+with the notation format being sent once to each process when it starts
+and referred to by its registered name (see `digint.notation_format.register_format`) afterwards.
+Results are still returned in order as they are found,
+and small batches are converted in the current process, skipping the pool altogether.
+Within a chunk, bases that the builtin `int` and `format` handle are read and written by them,
+and the digits of small values in other bases are found for the whole chunk at once.
+
+Single intigers too large to convert quickly in one process are split the same way
+`digint.conversion` splits them, by a power of the base and then again for each half,
+except that each level of splits is done across the pool,
+and the digits of the final parts are found in separate processes and reassembled in order.
+"""
+
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat, chain, product
+from os import cpu_count
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import power, is_power_of_two, int_digit_length, int_to_digits, digits_to_int
+from .conversion import split_divmod, new_digit_array, negative_base_to_digits, notation_sign
+from .conversion import DigitArray
+from .notation_format import NotationFormat, NotationError, DEFAULT_FORMAT, format_name
+from .tools import submit_in_order
+
+# the largest amount of bits of the values in a chunk that have their digits found together
+_SMALL_BITS:int = 1024
+# the characters marking negative values and splitting notations, past every digit value
+_NEGATIVE_MARK:str = "\u0100"
+_SPLIT_MARK:str = "\u0101"
+# the builtin `format` specification of each base it can notate
+_BUILTIN_FORMATS:Dict[int, str] = {2 : "b", 8 : "o", 10 : "d", 16 : "x"}
+_ASCII_SYMBOLS:str = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# the notation formats used by the chunks converted in this process, by name,
+# as set when a process of the pool starts
+_WORKER_FORMATS:Dict[str, NotationFormat] = {}
+
+
+def _install_formats(notation_formats:Dict[str, NotationFormat]):
+    _WORKER_FORMATS.update(notation_formats)
+
+
+def _resolve_formats(notation_formats:Tuple[Union[str, NotationFormat], ...]
+                     ) -> Tuple[NotationFormat, ...]:
+    return tuple(_WORKER_FORMATS[f] if isinstance(f, str) else f for f in notation_formats)
+
+
+def _notate_value(value:int, base:int, notation_format:NotationFormat) -> str:
+    if base >= 2:
+        return notation_format.notate_digits(int_to_digits(value, base),
+                                             (value > 0) - (value < 0))
+    # only imported here, as base 1 and negative bases have their own rules for notation
+    from .digint import digitint # pylint:disable=import-outside-toplevel
+    return digitint(value, base, notation_format=notation_format).notate()
+
+
+def _parse_value(notated:str, base:int, notation_format:NotationFormat) -> int:
+    if base == 1 and notated == "":
+        return 0
+    digits, sign = notation_format.parse_digits(notated)
+    radix = 2 if base == 1 else abs(base)
+    if len(digits) != 0 and max(digits) >= radix:
+        raise NotationError(f"Digit value '{max(digits)}' is out of range for base {base}")
+    return sign * digits_to_int(digits, base)
+
+
+class _InvalidSymbols(dict):
+    # a `str.translate` table marking every character it does not hold as invalid
+    def __missing__(self, key:int) -> str:
+        return "\0"
+
+
+@lru_cache(maxsize=32)
+def _parse_table(notation_format:NotationFormat, base:int) -> Optional[Dict[int, Optional[str]]]:
+    # when every symbol of the base is a single character, a table translating a notation
+    # into one the builtin `int` reads the same way (marking anything else as invalid)
+    if base < 2 or base > len(_ASCII_SYMBOLS) or len(notation_format) < base:
+        return None
+    symbols = notation_format.value_symbols[:base]
+    signs = (notation_format.negative_symbol, notation_format.positive_symbol,
+             notation_format.group_split_symbol)
+    if any(len(symbol) != 1 for symbol in symbols) \
+        or any(sign is not None and len(sign) != 1 for sign in signs) \
+        or len(set(symbols).union(s for s in signs if s is not None)) \
+            != base + sum(s is not None for s in signs):
+        return None
+    table = _InvalidSymbols((ord(symbol), _ASCII_SYMBOLS[value])
+                            for value, symbol in enumerate(symbols))
+    if notation_format.negative_symbol is not None:
+        table[ord(notation_format.negative_symbol)] = "-"
+    if notation_format.positive_symbol is not None:
+        table[ord(notation_format.positive_symbol)] = "+"
+    if notation_format.group_split_symbol is not None:
+        table[ord(notation_format.group_split_symbol)] = None
+    return table
+
+
+@lru_cache(maxsize=32)
+def _notate_table(notation_format:NotationFormat, base:int) -> Optional[Dict[int, str]]:
+    # when a base is one the builtin `format` notates, and the format's symbols are
+    # single characters with an explicit negative sign and no groups,
+    # a table translating the builtin notation into this format
+    if base not in _BUILTIN_FORMATS or len(notation_format) < base:
+        return None
+    if notation_format.implicit_negative or not notation_format.implicit_positive:
+        return None
+    if notation_format.group_split_symbol is not None or notation_format.negative_symbol is None:
+        return None
+    symbols = notation_format.value_symbols[:base]
+    if any(len(symbol) != 1 for symbol in symbols):
+        return None
+    table = {ord(_ASCII_SYMBOLS[value]) : symbol for value, symbol in enumerate(symbols)}
+    table[ord("-")] = notation_format.negative_symbol
+    return table
+
+
+def _parse_values(notations:List[str], base:int, notation_format:NotationFormat) -> List[int]:
+    table = _parse_table(notation_format, base)
+    if table is not None:
+        # the whole chunk is translated at once, and then read by the builtin `int`,
+        # falling back to reading each notation on its own to find the exact error
+        # the joining newlines are translated to the same mark as any invalid symbol,
+        # so the chunk only splits back into one part per notation when every symbol is valid
+        translated = "\n".join(notations).translate(table).split("\0")
+        if len(translated) == len(notations):
+            try:
+                return [int(n, base) for n in translated]
+            except ValueError:
+                pass
+    return [_parse_value(n, base, notation_format) for n in notations]
+
+
+@lru_cache(maxsize=32)
+def _symbol_table(notation_format:NotationFormat, base:int) -> Optional[Dict[int, str]]:
+    # when the format has an explicit negative sign and no groups,
+    # a table translating each digit value (as a character) into its symbol,
+    # and the negative mark into the negative sign
+    if len(notation_format) < base or notation_format.group_split_symbol is not None:
+        return None
+    if notation_format.implicit_negative or not notation_format.implicit_positive:
+        return None
+    if notation_format.negative_symbol is None:
+        return None
+    table = dict(enumerate(notation_format.value_symbols[:base]))
+    table[ord(_NEGATIVE_MARK)] = notation_format.negative_symbol
+    if any(_SPLIT_MARK in symbol for symbol in table.values()):
+        return None
+    return table
+
+
+@lru_cache(maxsize=32)
+def _digit_table(base:int) -> Tuple[int, List[bytes]]:
+    # the largest power of the base up to 4096, and the digits of every value below it,
+    # starting at the units spot and padded to the power's amount of digits
+    count = 1
+    while base ** (count + 1) <= 1 << 12:
+        count += 1
+    return (base ** count, [bytes(digits[::-1]) for digits in product(range(base), repeat=count)])
+
+
+def _small_digits(values:List[int], base:int) -> Optional[List[bytes]]:
+    # when the base fits in a byte and every value is small, the digits of each value's magnitude
+    # (as `int_to_digits` gives them), found a few digits at a time for every value at once,
+    # rather than one value at a time
+    if base < 2 or base > 256 or len(values) == 0:
+        return None
+    magnitudes = list(map(abs, values))
+    if max(magnitudes).bit_length() > _SMALL_BITS:
+        return None
+    radix, table = _digit_table(base)
+    rows = []
+    quotients:Sequence[int] = magnitudes
+    while any(quotients):
+        quotients, remainders = zip(*map(divmod, quotients, repeat(radix)))
+        rows.append(list(map(table.__getitem__, remainders)))
+    if len(rows) == 0:
+        return [b""] * len(values)
+    return [b"".join(digits).rstrip(b"\0") for digits in zip(*rows)]
+
+
+def _notate_values(values:List[int], base:int, notation_format:NotationFormat) -> List[str]:
+    table = _notate_table(notation_format, base)
+    if table is not None:
+        spec = _BUILTIN_FORMATS[base]
+        try:
+            return "\n".join([format(v, spec) for v in values]).translate(table).split("\n")
+        except ValueError:
+            # the builtin notation of very long decimal values is limited
+            pass
+    digits = _small_digits(values, base)
+    if digits is not None:
+        symbols = _symbol_table(notation_format, base)
+        if symbols is None:
+            return [notation_format.notate_digits(d, (v > 0) - (v < 0))
+                    for d, v in zip(digits, values)]
+        # the digits of every value are notated at once, as characters of their digit values
+        notated = [d[::-1].decode("latin-1") if d else "\0" for d in digits]
+        return _SPLIT_MARK.join([_NEGATIVE_MARK + n if v < 0 else n
+                                 for n, v in zip(notated, values)]
+                                ).translate(symbols).split(_SPLIT_MARK)
+    return [_notate_value(v, base, notation_format) for v in values]
+
+
+# each chunk function takes the notation formats (or their names, in a process of the pool),
+# the bases and the chunk itself, and returns the result of the whole chunk
+
+def _notate_chunk(notation_formats:Tuple[Union[str, NotationFormat], ...],
+                  bases:Tuple[int, ...],
+                  values:List[int]
+                  ) -> List[str]:
+    notation_format, = _resolve_formats(notation_formats)
+    base, = bases
+    return _notate_values(values, base, notation_format)
+
+
+def _parse_chunk(notation_formats:Tuple[Union[str, NotationFormat], ...],
+                 bases:Tuple[int, ...],
+                 notations:List[str]
+                 ) -> List[int]:
+    notation_format, = _resolve_formats(notation_formats)
+    base, = bases
+    return _parse_values(notations, base, notation_format)
+
+
+def _convert_chunk(notation_formats:Tuple[Union[str, NotationFormat], ...],
+                   bases:Tuple[int, ...],
+                   notations:List[str]
+                   ) -> List[str]:
+    notation_format, new_format = _resolve_formats(notation_formats)
+    base, new_base = bases
+    return _notate_values(_parse_values(notations, base, notation_format), new_base, new_format)
+
+
+def _count_chunk(notation_formats:Tuple[Union[str, NotationFormat], ...],
+                 bases:Tuple[int, ...],
+                 notations:List[str]
+                 ) -> Tuple[int, Counter, Counter]:
+    notation_format, = _resolve_formats(notation_formats)
+    base, count_base = bases
+    counts:Counter = Counter()
+    leading:Counter = Counter()
+    values = _parse_values(notations, base, notation_format)
+    digits = _small_digits(values, count_base)
+    if digits is not None:
+        # zero is counted as it is notated, as a single 0 digit
+        zeros = digits.count(b"")
+        counts.update(b"".join(digits))
+        counts[0] += zeros
+        leading.update(d[-1] for d in digits if d)
+        leading[0] += zeros
+        return (len(notations), counts, leading)
+    for value in values:
+        # zero is counted as it is notated, as a single 0 digit
+        digits = int_to_digits(value, count_base) or (0, )
+        counts.update(digits)
+        leading[digits[-1]] += 1
+    return (len(notations), counts, leading)
+
+
+def _check_arguments(base:int, chunk_size:int):
+    if base == 0 or base == -1:
+        raise ValueError("Invalid base", base)
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1", chunk_size)
+
+
+def _run_batch(chunk_func:Callable[[Tuple[Any, ...], Tuple[int, ...], List[Any]], Any],
+               items:Iterable[Any],
+               bases:Tuple[int, ...],
+               notation_formats:Tuple[Optional[NotationFormat], ...],
+               workers:Optional[int],
+               chunk_size:int,
+               threshold:int
+               ) -> Iterator[Any]:
+    # yields the result of each chunk, in order
+    formats = tuple(DEFAULT_FORMAT if f is None else f for f in notation_formats)
+    if workers is None:
+        workers = cpu_count() or 1
+
+    iterator = iter(items)
+    first = list(islice(iterator, threshold)) if workers != 1 else []
+    if workers == 1 or len(first) < threshold:
+        # the whole batch is small enough (or is meant) to convert in the current process
+        if len(first) != 0:
+            yield chunk_func(formats, bases, first)
+        for chunk in iter(lambda: list(islice(iterator, chunk_size)), []):
+            yield chunk_func(formats, bases, chunk)
+        return
+
+    # unregistered formats are still given a name, which is only known to this batch's pool
+    names = tuple(format_name(f) or f"<unregistered {id(f):x}>" for f in formats)
+
+    def chunks() -> Iterator[List[Any]]:
+        for start in range(0, len(first), chunk_size):
+            yield first[start:start + chunk_size]
+        yield from iter(lambda: list(islice(iterator, chunk_size)), [])
+
+    with ProcessPoolExecutor(workers,
+                             initializer = _install_formats,
+                             initargs = (dict(zip(names, formats)), )) as executor:
+        yield from submit_in_order(executor,
+                                   chunk_func,
+                                   ((names, bases, chunk) for chunk in chunks()),
+                                   2 * workers)
+
+
+def notate_many(values:Iterable[int],
+                base:int,
+                notation_format:Optional[NotationFormat] = None,
+                *,
+                workers:Optional[int] = None,
+                chunk_size:int = 1 << 12,
+                threshold:int = 1 << 14
+                ) -> Iterator[str]:
+    """
+    `notate_many`
+
+    Notates many intigers in the same base and notation format,
+    as `digitint(value, base, notation_format).notate()` would.
+
+    Batches of at least `threshold` values are split into chunks of `chunk_size` values
+    which are notated across a pool of processes, while smaller batches are notated
+    in the current process. The values are read as they are needed,
+    so long (or endless) iterables are never held in memory at once.
+
+    Arguments:
+        values -- The intigers to notate.
+        base -- The base to notate them in.
+
+    Keyword Arguments:
+        notation_format -- The notation format to use, where `None` uses `DEFAULT_FORMAT`.
+            Defaults to `None`.
+        workers -- The amount of processes to notate with, where `None` uses one per processor.
+            Notates in the current process when 1. Defaults to `None`.
+        chunk_size -- The amount of values notated at once by each process. Defaults to 4096.
+        threshold -- The amount of values a batch needs before a pool of processes is used.
+            Defaults to 16384.
+
+    Raises:
+        ValueError: Raised when the base is invalid, or the chunk size is less than 1.
+
+    Yields:
+        The notation of each value, in the same order as the values.
+    """
+    _check_arguments(base, chunk_size)
+    return chain.from_iterable(_run_batch(_notate_chunk, values, (base, ), (notation_format, ),
+                                          workers, chunk_size, threshold))
+
+
+def parse_many(notations:Iterable[str],
+               base:int,
+               notation_format:Optional[NotationFormat] = None,
+               *,
+               workers:Optional[int] = None,
+               chunk_size:int = 1 << 12,
+               threshold:int = 1 << 14
+               ) -> Iterator[int]:
+    """
+    `parse_many`
+
+    The inverse of `notate_many`, reads the value of many notations
+    in the same base and notation format.
+
+    Batches of at least `threshold` notations are split into chunks of `chunk_size` notations
+    which are parsed across a pool of processes, while smaller batches are parsed
+    in the current process. The notations are read as they are needed,
+    so long (or endless) iterables are never held in memory at once.
+
+    Arguments:
+        notations -- The notations to parse, each optionally starting with a sign symbol,
+            and optionally split into groups.
+        base -- The base of the notations.
+
+    Keyword Arguments:
+        notation_format -- The notation format of the notations, where `None` uses
+            `DEFAULT_FORMAT`. Defaults to `None`.
+        workers -- The amount of processes to parse with, where `None` uses one per processor.
+            Parses in the current process when 1. Defaults to `None`.
+        chunk_size -- The amount of notations parsed at once by each process. Defaults to 4096.
+        threshold -- The amount of notations a batch needs before a pool of processes is used.
+            Defaults to 16384.
+
+    Raises:
+        ValueError: Raised when the base is invalid, or the chunk size is less than 1.
+        NotationError: Raised when a notation holds a symbol not in the notation format,
+            or a digit that is out of range for the base.
+
+    Yields:
+        The value of each notation, in the same order as the notations.
+    """
+    _check_arguments(base, chunk_size)
+    return chain.from_iterable(_run_batch(_parse_chunk, notations, (base, ), (notation_format, ),
+                                          workers, chunk_size, threshold))
+
+
+def convert_many(notations:Iterable[str],
+                 base:int,
+                 new_base:int,
+                 notation_format:Optional[NotationFormat] = None,
+                 new_format:Optional[NotationFormat] = None,
+                 *,
+                 workers:Optional[int] = None,
+                 chunk_size:int = 1 << 12,
+                 threshold:int = 1 << 14
+                 ) -> Iterator[str]:
+    """
+    `convert_many`
+
+    Converts many notations from one base and notation format into another,
+    as `parse_many` followed by `notate_many` would,
+    but with each chunk parsed and notated in the same process.
+    Converting to the same base with a new format reformats the notations.
+
+    Arguments:
+        notations -- The notations to convert.
+        base -- The base of the notations.
+        new_base -- The base to notate the values in.
+
+    Keyword Arguments:
+        notation_format -- The notation format of the notations, where `None` uses
+            `DEFAULT_FORMAT`. Defaults to `None`.
+        new_format -- The notation format to notate the values in, where `None` uses
+            `DEFAULT_FORMAT`. Defaults to `None`.
+        workers -- The amount of processes to convert with, where `None` uses one per processor.
+            Converts in the current process when 1. Defaults to `None`.
+        chunk_size -- The amount of notations converted at once by each process.
+            Defaults to 4096.
+        threshold -- The amount of notations a batch needs before a pool of processes is used.
+            Defaults to 16384.
+
+    Raises:
+        ValueError: Raised when either base is invalid, or the chunk size is less than 1.
+        NotationError: Raised when a notation holds a symbol not in the notation format,
+            or a digit that is out of range for the base.
+
+    Yields:
+        The new notation of each notation, in the same order as the notations.
+    """
+    _check_arguments(base, chunk_size)
+    _check_arguments(new_base, chunk_size)
+    return chain.from_iterable(_run_batch(_convert_chunk, notations, (base, new_base),
+                                          (notation_format, new_format),
+                                          workers, chunk_size, threshold))
+
+
+def count_digits_many(notations:Iterable[str],
+                      base:int,
+                      notation_format:Optional[NotationFormat] = None,
+                      *,
+                      count_base:Optional[int] = None,
+                      workers:Optional[int] = None,
+                      chunk_size:int = 1 << 12,
+                      threshold:int = 1 << 14
+                      ) -> Tuple[int, Counter, Counter]:
+    """
+    `count_digits_many`
+
+    Counts how often each digit value appears in the values of many notations,
+    along with how often each digit value leads (is the digit of the greatest place value).
+    Zero is counted as a single 0 digit, as it is notated.
+
+    Arguments:
+        notations -- The notations of the values to count the digits of.
+        base -- The base of the notations.
+
+    Keyword Arguments:
+        notation_format -- The notation format of the notations, where `None` uses
+            `DEFAULT_FORMAT`. Defaults to `None`.
+        count_base -- The base to count the digits in, where `None` uses the base of the notations.
+            Defaults to `None`.
+        workers -- The amount of processes to count with, where `None` uses one per processor.
+            Counts in the current process when 1. Defaults to `None`.
+        chunk_size -- The amount of notations counted at once by each process. Defaults to 4096.
+        threshold -- The amount of notations a batch needs before a pool of processes is used.
+            Defaults to 16384.
+
+    Raises:
+        ValueError: Raised when either base is invalid, or the chunk size is less than 1.
+        NotationError: Raised when a notation holds a symbol not in the notation format,
+            or a digit that is out of range for the base.
+
+    Returns:
+        The amount of values, the amount of each digit value across all of them,
+        and the amount of values led by each digit value.
+    """
+    count_base = base if count_base is None else count_base
+    _check_arguments(base, chunk_size)
+    _check_arguments(count_base, chunk_size)
+    total = 0
+    counts:Counter = Counter()
+    leading:Counter = Counter()
+    for chunk_total, chunk_counts, chunk_leading in _run_batch(_count_chunk, notations,
+                                                               (base, count_base),
+                                                               (notation_format, ),
+                                                               workers, chunk_size, threshold):
+        total += chunk_total
+        counts.update(chunk_counts)
+        leading.update(chunk_leading)
+    return (total, counts, leading)
+
+
+def _split_part(value:int, base:int, count:int) -> Tuple[int, int]:
+    # splits at the largest power of two below the count, as `int_to_digits` does
+    return split_divmod(value, power(base, 1 << ((count - 1).bit_length() - 1)))
+
+
+def _parallel_digits(value:int,
+                     base:int,
+                     count:int,
+                     executor:ProcessPoolExecutor,
+                     parts:int,
+                     leaf_digits:int
+                     ) -> DigitArray:
+    # each part is its value, the index of its lowest digit, and its amount of digits
+    pieces:List[Tuple[int, int, int]] = [(value, 0, count)]
+    while len(pieces) < parts:
+        splitting = [p for p in pieces if p[2] > leaf_digits]
+        if len(splitting) == 0:
+            break
+        splits = executor.map(_split_part,
+                              [p[0] for p in splitting],
+                              repeat(base),
+                              [p[2] for p in splitting])
+        split = iter(splits)
+        next_pieces = []
+        for piece in pieces:
+            if piece[2] <= leaf_digits:
+                next_pieces.append(piece)
+                continue
+            high, low = next(split)
+            half = 1 << ((piece[2] - 1).bit_length() - 1)
+            next_pieces.append((low, piece[1], half))
+            next_pieces.append((high, piece[1] + half, piece[2] - half))
+        pieces = next_pieces
+
+    digits = new_digit_array(base, count)
+    results = executor.map(int_to_digits,
+                           [p[0] for p in pieces],
+                           repeat(base),
+                           [p[2] for p in pieces])
+    for (_, start, length), part in zip(pieces, results):
+        digits[start:start + length] = part
+    return digits
+
+
+def parallel_int_to_digits(value:int,
+                           base:int,
+                           length:int = 0,
+                           *,
+                           workers:Optional[int] = None,
+                           threshold:int = 1 << 16
+                           ) -> DigitArray:
+    """
+    `parallel_int_to_digits`
+
+    Finds the same digits as `digint.conversion.int_to_digits`,
+    splitting the conversion of a large intiger across a pool of processes.
+
+    The value is split in half by a power of the base, then each half is split again,
+    with every split of the same level done at once across the pool,
+    until there are a few parts for each process.
+    The digits of each part are then found across the pool, and reassembled in order.
+    Bases that are powers of two (and base 1) are already converted in linear time,
+    so are always converted in the current process.
+
+    Arguments:
+        value -- The value to find the digits of.
+        base -- The base of the digits.
+
+    Keyword Arguments:
+        length -- Ensures that at least the given amount of digits are returned,
+            padding with leading zeros. Defaults to 0.
+        workers -- The amount of processes to convert with, where `None` uses one per processor.
+            Converts in the current process when 1. Defaults to `None`.
+        threshold -- The amount of digits a value needs before a pool of processes is used,
+            which is also the fewest digits a part is split down to. Defaults to 65536.
+
+    Raises:
+        ValueError: Raised when the base is invalid, or the threshold is less than 2.
+
+    Returns:
+        A compact sequence of the digit values, starting at the units spot.
+    """
+    _check_arguments(base, 1)
+    if threshold < 2:
+        raise ValueError("The threshold must be at least 2", threshold)
+    if workers is None:
+        workers = cpu_count() or 1
+
+    radix = abs(base)
+    if workers == 1 or base == 1 or is_power_of_two(radix):
+        return int_to_digits(value, base, length)
+
+    def pooled_digits(value:int, radix:int, count:int) -> DigitArray:
+        # the digits of a non negative value in a positive base, across the pool once long enough
+        if count < threshold:
+            return int_to_digits(value, radix, count)
+        with ProcessPoolExecutor(workers) as executor:
+            return _parallel_digits(value, radix, count, executor, 4 * workers, threshold)
+
+    if base < -1:
+        return negative_base_to_digits(value, radix, length, pooled_digits)
+
+    value = abs(value)
+    digits = pooled_digits(value, radix, int_digit_length(value, radix))
+    if length > len(digits):
+        digits.extend(new_digit_array(base, length - len(digits)))
+    return digits
+
+
+def parallel_notate(value:int,
+                    base:int,
+                    notation_format:Optional[NotationFormat] = None,
+                    *,
+                    workers:Optional[int] = None,
+                    threshold:int = 1 << 16
+                    ) -> str:
+    """
+    `parallel_notate`
+
+    Notates a single large intiger as `digitint(value, base, notation_format).notate()` would,
+    finding its digits across a pool of processes with `parallel_int_to_digits`.
+
+    Arguments:
+        value -- The intiger to notate.
+        base -- The base to notate it in.
+
+    Keyword Arguments:
+        notation_format -- The notation format to use, where `None` uses `DEFAULT_FORMAT`.
+            Defaults to `None`.
+        workers -- The amount of processes to convert with, where `None` uses one per processor.
+            Converts in the current process when 1. Defaults to `None`.
+        threshold -- The amount of digits a value needs before a pool of processes is used,
+            which is also the fewest digits a part is split down to. Defaults to 65536.
+
+    Raises:
+        ValueError: Raised when the base is invalid, or the threshold is less than 2.
+
+    Returns:
+        The notation of the intiger.
+    """
+    _check_arguments(base, 1)
+    if notation_format is None:
+        notation_format = DEFAULT_FORMAT
+    if base == 1:
+        return _notate_value(value, base, notation_format)
+    digits = parallel_int_to_digits(value, base, workers = workers, threshold = threshold)
+    return notation_format.notate_digits(digits, notation_sign(value, base))
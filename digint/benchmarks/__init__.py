@@ -0,0 +1,22 @@
+"""
+benchmarks
+
+Holds the performance benchmarks of the `digint` module,
+timing its opperations across bases and digit lengths.
+
+Run with ``python -m digint.benchmarks``, which writes the results as JSON
+and as a markdown table, and can compare them against a saved baseline.
+Run with ``python -m digint.benchmarks --memory`` to measure memory instead of time,
+or ``python -m digint.benchmarks --imports`` to measure how long importing `digint` takes.
+"""
+
+from .cases import CASES, BenchmarkCase
+from .runner import BASES, DIGIT_LENGTHS, run_benchmarks, save_results, load_results
+from .runner import results_markdown, compare_results
+from .memory import run_memory_benchmarks, memory_markdown, instance_report, traced_allocation
+from .imports import run_import_benchmark, imports_markdown, measure_import
+
+__all__ = ["CASES", "BenchmarkCase", "BASES", "DIGIT_LENGTHS", "run_benchmarks", "save_results",
+           "load_results", "results_markdown", "compare_results", "run_memory_benchmarks",
+           "memory_markdown", "instance_report", "traced_allocation", "run_import_benchmark",
+           "imports_markdown", "measure_import"]
@@ -0,0 +1,124 @@
+"""
+__main__
+
+Used to run the benchmarks from the command line, with ``python -m digint.benchmarks``.
+"""
+
+import sys
+from argparse import ArgumentParser
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .cases import CASES
+from .runner import BASES, DIGIT_LENGTHS, run_benchmarks, save_results, load_results
+from .runner import results_markdown, compare_results, format_seconds
+from .memory import run_memory_benchmarks, memory_markdown, format_bytes
+from .imports import run_import_benchmark, imports_markdown
+
+
+def main(args:Optional[Sequence[str]] = None) -> int:
+    """
+    `main`
+
+    Runs the benchmarks, writes their results and compares them against a baseline if given.
+    With ``--memory``, the memory of each opperation is measured instead of its time,
+    and with ``--imports``, the time importing `digint` takes is measured instead.
+
+    Keyword Arguments:
+        args -- The command line arguments, when `None` uses `sys.argv`. Defaults to `None`.
+
+    Returns:
+        The exit code, 1 when any regressions were found and otherwise 0.
+    """
+    parser = ArgumentParser(prog="python -m digint.benchmarks",
+                            description="Times (or measures the memory of) digint opperations "
+                                        "across bases and digit lengths.")
+    parser.add_argument("--cases", nargs="+", choices=[c.name for c in CASES],
+                        help="the cases to run, defaults to all of them")
+    parser.add_argument("--bases", nargs="+", type=int, default=list(BASES))
+    parser.add_argument("--digits", nargs="+", type=int, default=list(DIGIT_LENGTHS))
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="the amount of measurements to keep the best of")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="seconds per call before longer digit lengths are skipped")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds each measurement runs for at least")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--memory", action="store_true",
+                      help="measure peak and retained memory with tracemalloc instead of time")
+    mode.add_argument("--imports", action="store_true",
+                      help="measure the import time of digint with python -X importtime instead")
+    parser.add_argument("--instances", type=int, default=1000,
+                        help="the amount of instances allocated at once when measuring memory")
+    parser.add_argument("--json",
+                        help="where to write the results as JSON, "
+                             "defaults to ./reports/BENCHMARK.json (or MEMORY.json, IMPORTS.json)")
+    parser.add_argument("--markdown",
+                        help="where to write the results as a markdown table, "
+                             "defaults to ./reports/BENCHMARK.md (or MEMORY.md, IMPORTS.md)")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="a JSON file of earlier results to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="the ratio above which a result is a regression, "
+                             "of time (or peak memory)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="write nothing but the result files (and the exit code)")
+    parsed = parser.parse_args(args)
+
+    report_name = "MEMORY" if parsed.memory else "IMPORTS" if parsed.imports else "BENCHMARK"
+    json_path = parsed.json if parsed.json is not None else f"./reports/{report_name}.json"
+    markdown_path = parsed.markdown if parsed.markdown is not None \
+        else f"./reports/{report_name}.md"
+    metric = "peak" if parsed.memory else "seconds"
+    formatter = format_bytes if parsed.memory else format_seconds
+
+    def progress(result:Dict[str, Any]):
+        if not parsed.quiet:
+            shown = formatter(result[metric]) if result["status"] == "ok" else result["status"]
+            print(f"{result['case']:>20} base {result['base']:<6} "
+                  f"{result['digits']:>8} digits  {shown}", file=sys.stderr)
+
+    cases = [c for c in CASES if c.name in parsed.cases] if parsed.cases else None
+    if parsed.imports:
+        results = run_import_benchmark(repeat=parsed.repeat)
+        markdown = imports_markdown(results)
+    elif parsed.memory:
+        results = run_memory_benchmarks(cases,
+                                        parsed.bases,
+                                        parsed.digits,
+                                        budget=parsed.budget,
+                                        instances=parsed.instances,
+                                        progress=progress)
+        markdown = memory_markdown(results)
+    else:
+        results = run_benchmarks(cases,
+                                 parsed.bases,
+                                 parsed.digits,
+                                 repeat=parsed.repeat,
+                                 budget=parsed.budget,
+                                 minimum=parsed.min_time,
+                                 progress=progress)
+        markdown = results_markdown(results)
+    if json_path:
+        save_results(results, json_path)
+    if markdown_path:
+        with open(markdown_path, "w", encoding="utf-8") as file:
+            file.write(markdown)
+
+    if parsed.compare:
+        compared = compare_results(results,
+                                   load_results(parsed.compare),
+                                   parsed.threshold,
+                                   metric)
+        regressions = [c for c in compared if c["regressed"]]
+        if not parsed.quiet:
+            for c in regressions:
+                where = "" if c["base"] is None else f" base {c['base']} {c['digits']} digits"
+                print(f"REGRESSION {c['case']}{where}: "
+                      f"{formatter(c['baseline'])} -> {formatter(c[metric])} "
+                      f"({c['ratio']:.2f}x)")
+            print(f"{len(regressions)} regressions in {len(compared)} compared results")
+        return 1 if len(regressions) != 0 else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+cases
+
+Holds the benchmarked opperations of `digint.benchmarks`.
+
+Every opperation is set up from a value of the benchmarked digit length in the benchmarked base,
+and each timed call works on a new `digitint` made directly from that value,
+so that digits cached by one call are never reused by the next.
+"""
+
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from ..digint import digitint
+from ..conversion import digits_many, notate_many
+from ..notation_format import NotationFormat, DEFAULT_DIGIT_SYMBOLS
+
+
+GROUPED_FORMAT:NotationFormat = NotationFormat(*tuple(DEFAULT_DIGIT_SYMBOLS),
+                                               undefined_symbol = "?",
+                                               negative_symbol = "-",
+                                               positive_symbol = "+",
+                                               group_split_symbol = ",",
+                                               group_split_count = 3,
+                                               implicit_positive = True
+                                               )
+""" The notation format used when benchmarking grouped notation. """
+
+
+class BenchmarkCase:
+    """
+    `BenchmarkCase`
+
+    A single benchmarked opperation.
+    """
+
+    def __init__(self, name:str, setup:Callable[[int, int, int], Callable[[], Any]]):
+        """
+        `__init__`
+
+        Arguments:
+            name -- The name the opperation is reported under.
+            setup -- Given a value, its base and its digit length,
+                returns the call that is timed. Errors raised by the setup or the call
+                (ie. when the opperation is not supported in the base)
+                are reported rather than timed.
+        """
+        self.name:str = name
+        self.setup:Callable[[int, int, int], Callable[[], Any]] = setup
+
+
+def _construct_int(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base)
+
+
+def _construct_str(value:int, base:int, _:int) -> Callable[[], Any]:
+    notated = str(digitint(value, base))
+    return lambda: digitint(notated, base)
+
+
+def _construct_iterable(value:int, base:int, _:int) -> Callable[[], Any]:
+    # the constructor reads digits starting at the greatest place value
+    digits = list(digitint(value, base))[::-1]
+    return lambda: digitint(digits, base)
+
+
+def _get_digit(value:int, base:int, length:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).get_digit(length // 2)
+
+
+def _set_digit(value:int, base:int, length:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).set_digit(length // 2, 1)
+
+
+def _set_digit_slice(value:int, base:int, length:int) -> Callable[[], Any]:
+    span = max(1, length // 10)
+    index = slice(length // 2, (length // 2) + span)
+    digits = [1] * span
+    return lambda: digitint(value, base).set_digit(index, digits)
+
+
+def _insert(value:int, base:int, length:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).insert(length // 2, 1)
+
+
+def _pop(value:int, base:int, length:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).pop(length // 2)
+
+
+def _rotate(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).digit_rotate_left(1)
+
+
+def _notate(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).notate()
+
+
+def _notate_grouped(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).notate(GROUPED_FORMAT)
+
+
+def _contains(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).contains(1)
+
+
+def _digit_length(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base).digit_length()
+
+
+def _add(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base) + value
+
+
+def _mul(value:int, base:int, _:int) -> Callable[[], Any]:
+    return lambda: digitint(value, base) * value
+
+
+def _floordiv(value:int, base:int, _:int) -> Callable[[], Any]:
+    divisor = (value >> (value.bit_length() // 2)) | 1
+    return lambda: digitint(value, base) // divisor
+
+
+def _digits_many(value:int, base:int, _:int) -> Callable[[], Any]:
+    # the power of two bases share a binary dump, and the powers of the base a conversion
+    bases = (2, 8, 16, base, base ** 2, base ** 3)
+    return lambda: digits_many(value, bases)
+
+
+def _notate_many(value:int, base:int, _:int) -> Callable[[], Any]:
+    bases = (2, 16, base)
+    return lambda: notate_many(value, bases)
+
+
+CASES:Tuple[BenchmarkCase, ...] = (
+    BenchmarkCase("construct_int", _construct_int),
+    BenchmarkCase("construct_str", _construct_str),
+    BenchmarkCase("construct_iterable", _construct_iterable),
+    BenchmarkCase("get_digit", _get_digit),
+    BenchmarkCase("set_digit", _set_digit),
+    BenchmarkCase("set_digit_slice", _set_digit_slice),
+    BenchmarkCase("insert", _insert),
+    BenchmarkCase("pop", _pop),
+    BenchmarkCase("rotate", _rotate),
+    BenchmarkCase("notate", _notate),
+    BenchmarkCase("notate_grouped", _notate_grouped),
+    BenchmarkCase("digits_many", _digits_many),
+    BenchmarkCase("notate_many", _notate_many),
+    BenchmarkCase("contains", _contains),
+    BenchmarkCase("digit_length", _digit_length),
+    BenchmarkCase("add", _add),
+    BenchmarkCase("mul", _mul),
+    BenchmarkCase("floordiv", _floordiv),
+)
+""" Every benchmarked opperation, in the order they are run and reported. """
@@ -0,0 +1,132 @@
+"""
+imports
+
+Holds the import time benchmark of `digint.benchmarks`,
+tracking the output of ``python -X importtime`` for importing the `digint` module.
+
+Each measurement imports the module in a new interpreter, so nothing is already imported,
+and the best time of each imported module across several runs is kept.
+"""
+
+import subprocess
+import sys
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .runner import results_meta, format_seconds
+
+
+def parse_importtime(output:str) -> Dict[str, Tuple[float, float]]:
+    """
+    `parse_importtime`
+
+    Arguments:
+        output -- The output of ``python -X importtime`` (written to stderr).
+
+    Returns:
+        Each imported module mapped to the seconds spent importing it alone,
+        and the seconds spent importing it along with everything it imported.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times[fields[2].strip()] = (int(fields[0]) / 1e6, int(fields[1]) / 1e6)
+    return times
+
+
+def measure_import(module:str = "digint", repeat:int = 5) -> Dict[str, Tuple[float, float]]:
+    """
+    `measure_import`
+
+    Measures the import time of a module with ``python -X importtime``,
+    in a new interpreter for each run.
+
+    Keyword Arguments:
+        module -- The module to import. Defaults to "digint".
+        repeat -- The amount of runs to keep the best time of each imported module from.
+            Defaults to 5.
+
+    Raises:
+        RuntimeError: Raised when the module could not be imported.
+
+    Returns:
+        Each imported module mapped to its best time alone, and its best time
+        along with everything it imported, in seconds.
+    """
+    best:Dict[str, Tuple[float, float]] = {}
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.PIPE,
+                                 universal_newlines=True,
+                                 check=False)
+        if process.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed", process.stderr)
+        for name, times in parse_importtime(process.stderr).items():
+            previous = best.get(name)
+            best[name] = times if previous is None \
+                else (min(previous[0], times[0]), min(previous[1], times[1]))
+    return best
+
+
+def run_import_benchmark(module:str = "digint", repeat:int = 5) -> Dict[str, Any]:
+    """
+    `run_import_benchmark`
+
+    Measures the import time of a module, in the same form as the results of `run_benchmarks`
+    so that they can be saved and compared against a baseline the same way.
+    Each imported submodule of the module is a case, with the base and digit length of `None`.
+
+    Keyword Arguments:
+        module -- The module to import. Defaults to "digint".
+        repeat -- The amount of runs to keep the best time of each imported module from.
+            Defaults to 5.
+
+    Returns:
+        The results, with `seconds` being the best cumulative import time of each submodule
+        and `self_seconds` being the best time of each submodule alone,
+        along with the best cumulative import time of the module itself (`total`).
+    """
+    times = measure_import(module, repeat)
+    results = [{"case" : name,
+                "base" : None,
+                "digits" : None,
+                "seconds" : cumulative,
+                "self_seconds" : alone,
+                "status" : "ok"}
+               for name, (alone, cumulative) in times.items()
+               if name == module or name.startswith(f"{module}.")]
+    return {"meta" : dict(results_meta(), repeat = repeat, module = module),
+            "total" : times[module][1] if module in times else 0.0,
+            "results" : results}
+
+
+def imports_markdown(results:Dict[str, Any]) -> str:
+    """
+    `imports_markdown`
+
+    Arguments:
+        results -- The results to tabulate, as returned by `run_import_benchmark`.
+
+    Returns:
+        A markdown report of the import times, slowest first.
+    """
+    meta = results["meta"]
+    lines = [
+        "# IMPORTS",
+        "",
+        f"digint {meta['digint']} on {meta['implementation']} {meta['python']} "
+        f"({meta['platform']}), {meta['time']}",
+        "",
+        f"Best of {meta['repeat']} imports of `{meta['module']}` in a new interpreter, "
+        f"{format_seconds(results['total'])} in total with every module it imports.",
+        "",
+        "| module | alone | with its imports |",
+        "| --- | ---: | ---: |",
+    ]
+    for result in sorted(results["results"], key=lambda r: r["seconds"], reverse=True):
+        lines.append(f"| {result['case']} | {format_seconds(result['self_seconds'])} | "
+                     f"{format_seconds(result['seconds'])} |")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,313 @@
+"""
+memory
+
+Holds the memory benchmarks of `digint.benchmarks`,
+measuring allocations with `tracemalloc` rather than timing.
+
+For each instance size, the bytes allocated per `digitint` are found by allocating many at once,
+and broken down by attribute (along with the digits it caches once they are used).
+For each benchmark case, the peak memory allocated during a call is found,
+along with the memory still held once its result is discarded (ie. by module level caches).
+"""
+
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from ..digint import digitint
+from ..conversion import power
+from ..notation_format import NotationFormat
+from .cases import CASES, BenchmarkCase
+from .runner import BASES, DIGIT_LENGTHS, benchmark_value, results_meta
+
+# every instance caches its own digits, so instances are only measured up to this digit length
+_INSTANCE_LENGTH_LIMIT:int = 10 ** 4
+
+
+def _deep_size(value:Any, seen:Set[int]) -> int:
+    # the size of a value along with any tuples it holds, counting each object once,
+    # other than notation formats, which are shared between instances
+    if isinstance(value, NotationFormat) or value is None or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_deep_size(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+
+def traced_allocation(func:Callable[[], Any]) -> Tuple[int, int]:
+    """
+    `traced_allocation`
+
+    Traces the memory allocated by a call.
+
+    Arguments:
+        func -- The call to trace.
+
+    Returns:
+        The peak amount of bytes allocated during the call,
+        and the amount of bytes still allocated once its result is discarded.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = func()
+        del result
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - start, max(current - start, 0))
+
+
+def instance_report(base:int, length:int, count:int = 1000) -> Dict[str, Any]:
+    """
+    `instance_report`
+
+    Measures the memory held by `digitint`s of the given base and digit length.
+
+    Arguments:
+        base -- The base of the instances.
+        length -- The digit length of the instances.
+
+    Keyword Arguments:
+        count -- The amount of instances allocated at once to find the bytes of each.
+            Defaults to 1000.
+
+    Returns:
+        The bytes allocated per instance (`bytes`), the bytes per instance once their digits are
+        cached (`cached_bytes`), and the size of each attribute of a single instance
+        (`attributes`, where objects already counted in an earlier attribute
+        and the shared notation format are counted as 0).
+    """
+    value = benchmark_value(base, length)
+
+    def allocate() -> List[digitint]:
+        # each instance holds its own value, as they would when holding separate values
+        return [digitint(value + i, base) for i in range(count)]
+
+    def allocate_cached() -> List[digitint]:
+        instances = allocate()
+        for instance in instances:
+            instance.digit_length()
+            instance.iter_digits()
+        return instances
+
+    # the instances are kept alive until they are measured, unlike in `traced_allocation`
+    sizes = []
+    for func in (allocate, allocate_cached):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            instances = func()
+            sizes.append((tracemalloc.get_traced_memory()[0] - start) // count)
+        finally:
+            tracemalloc.stop()
+        del instances
+
+    instance = allocate_cached()[0]
+    attributes = {"object" : sys.getsizeof(instance), "__dict__" : sys.getsizeof(instance.__dict__)}
+    seen:Set[int] = set()
+    for name, attribute in instance.__dict__.items():
+        attributes[name] = _deep_size(attribute, seen)
+    return {"base" : base,
+            "digits" : length,
+            "bytes" : sizes[0],
+            "cached_bytes" : sizes[1],
+            "attributes" : attributes}
+
+
+def cache_report(bases:Iterable[int], length:int) -> Dict[str, int]:
+    """
+    `cache_report`
+
+    Measures the module level caches once they are filled by converting a value
+    of the given digit length to and from its digits in each of the given bases.
+
+    Arguments:
+        bases -- The bases the caches are filled in.
+        length -- The digit length of the values the caches are filled with.
+
+    Returns:
+        The bytes held by the module level caches, and the amount of values they hold.
+    """
+    power.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        value = None
+        for base in bases:
+            value = digitint(benchmark_value(base, length), base)
+            # the base 1 constructor does not read digits, so its value is given directly
+            digitint(int(value) if base == 1 else list(value.reversed_iter_digits()), base).notate()
+        del value
+        gc.collect()
+        filled = tracemalloc.get_traced_memory()[0]
+        info = power.cache_info() # pylint:disable=no-value-for-parameter
+        power.cache_clear()
+        # the cached powers are measured by how much clearing them frees
+        cleared = filled - tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {"power_cache_entries" : info.currsize,
+            "power_cache_bytes" : max(cleared, 0),
+            "retained_bytes" : max(filled - start, 0)}
+
+
+def run_memory_benchmarks(cases:Optional[Iterable[BenchmarkCase]] = None,
+                          bases:Iterable[int] = BASES,
+                          lengths:Iterable[int] = DIGIT_LENGTHS,
+                          *,
+                          budget:float = 1.0,
+                          instances:int = 1000,
+                          progress:Optional[Callable[[Dict[str, Any]], Any]] = None
+                          ) -> Dict[str, Any]:
+    """
+    `run_memory_benchmarks`
+
+    Measures the memory of every case in every base at every digit length,
+    along with the memory of the instances themselves
+    (at the digit lengths up to 10000, as every instance caches its own digits).
+    Once a call of a case takes longer than the budget in a base, the longer digit lengths
+    of that case and base are skipped, just as they are when timing.
+
+    Keyword Arguments:
+        cases -- When not `None`, the cases to run. Defaults to `None`, running every case.
+        bases -- The bases to run in. Defaults to `BASES`.
+        lengths -- The digit lengths to run at. Defaults to `DIGIT_LENGTHS`.
+        budget -- The time, in seconds, a single call may take before longer digit lengths
+            are skipped. Defaults to 1.0.
+        instances -- The amount of instances allocated at once to find the bytes of each.
+            Defaults to 1000.
+        progress -- When not `None`, called with each case result as it is found.
+            Defaults to `None`.
+
+    Returns:
+        The results, along with information on the environment they were found in.
+        Each case result holds `peak` and `retained` bytes instead of `seconds`.
+    """
+    lengths = sorted(lengths)
+    reports = [instance_report(base, length, instances)
+               for base in bases for length in lengths if length <= _INSTANCE_LENGTH_LIMIT]
+
+    results = []
+    for case in (cases if cases is not None else CASES):
+        for base in bases:
+            over_budget = False
+            for length in lengths:
+                result:Dict[str, Any] = {"case" : case.name,
+                                         "base" : base,
+                                         "digits" : length,
+                                         "peak" : None,
+                                         "retained" : None}
+                if over_budget:
+                    result["status"] = "skipped"
+                else:
+                    try:
+                        func = case.setup(benchmark_value(base, length), base, length)
+                        power.cache_clear()
+                        first = perf_counter()
+                        result["peak"], result["retained"] = traced_allocation(func)
+                        over_budget = (perf_counter() - first) > budget
+                    except Exception as error: # pylint:disable=broad-except
+                        result["status"] = f"unsupported: {type(error).__name__}"
+                    else:
+                        result["status"] = "ok"
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+
+    return {"meta" : dict(results_meta(), budget = budget),
+            "instances" : reports,
+            "caches" : cache_report(bases, lengths[-1]) if len(lengths) != 0 else {},
+            "results" : results}
+
+
+def format_bytes(size:Optional[int]) -> str:
+    """
+    `format_bytes`
+
+    Arguments:
+        size -- The amount of bytes to format, or `None`.
+
+    Returns:
+        The amount with a fitting unit, or `-` when `None`.
+    """
+    if size is None:
+        return "-"
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size} B"
+
+
+def memory_markdown(results:Dict[str, Any]) -> str:
+    """
+    `memory_markdown`
+
+    Arguments:
+        results -- The results to tabulate, as returned by `run_memory_benchmarks`.
+
+    Returns:
+        A markdown report of the instance sizes, caches and the peak and retained memory
+        of each case, with a row for each case and base and a column for each digit length.
+    """
+    meta = results["meta"]
+    lines = [
+        "# MEMORY",
+        "",
+        f"digint {meta['digint']} on {meta['implementation']} {meta['python']} "
+        f"({meta['platform']}), {meta['time']}",
+        "",
+        "## Instances",
+        "",
+        "| base | digits | bytes per instance | with cached digits |",
+        "| ---: | ---: | ---: | ---: |",
+    ]
+    for report in results["instances"]:
+        lines.append(f"| {report['base']} | {report['digits']} | "
+                     f"{format_bytes(report['bytes'])} | {format_bytes(report['cached_bytes'])} |")
+
+    names = list(dict.fromkeys(name for report in results["instances"]
+                               for name in report["attributes"]))
+    lines.extend([
+        "",
+        "Bytes held by each attribute of a single instance with cached digits "
+        "(the shared notation format is not counted).",
+        "",
+        "| attribute | " + " | ".join(f"base {r['base']}, {r['digits']} digits"
+                                      for r in results["instances"]) + " |",
+        "| --- | " + " | ".join("---:" for _ in results["instances"]) + " |",
+    ])
+    for name in names:
+        lines.append(f"| {name} | " + " | ".join(format_bytes(r["attributes"].get(name))
+                                                 for r in results["instances"]) + " |")
+
+    lines.extend(["", "## Caches", ""])
+    lines.extend(f"- {name}: {size}" for name, size in results["caches"].items())
+
+    lengths = sorted(set(r["digits"] for r in results["results"]))
+    rows:Dict[Tuple[str, int], Dict[int, str]] = {}
+    for result in results["results"]:
+        cell = f"{format_bytes(result['peak'])} / {format_bytes(result['retained'])}" \
+            if result["status"] == "ok" else result["status"].split(":")[0]
+        rows.setdefault((result["case"], result["base"]), {})[result["digits"]] = cell
+
+    lines.extend([
+        "",
+        "## Opperations",
+        "",
+        "Peak bytes allocated during a single call / bytes still held after it. "
+        f"Skipped sizes took over {meta['budget']} s at a smaller digit length.",
+        "",
+        "| case | base | " + " | ".join(f"{d} digits" for d in lengths) + " |",
+        "| --- | ---: | " + " | ".join("---:" for _ in lengths) + " |",
+    ])
+    for (case, base), cells in rows.items():
+        row = " | ".join(cells.get(d, "-") for d in lengths)
+        lines.append(f"| {case} | {base} | {row} |")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,286 @@
+"""
+runner
+
+Holds the timing, reporting and comparison of the benchmarks in `digint.benchmarks`.
+
+Results are kept as plain JSON compatible dictionaries, so they can be saved as a baseline
+and compared against later runs.
+"""
+
+import json
+import platform
+from datetime import datetime, timezone
+from random import Random
+from time import perf_counter
+from timeit import Timer
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .. import __version__
+from .cases import CASES, BenchmarkCase
+
+
+BASES:Tuple[int, ...] = (1, 2, 10, 16, 36, 60, 1000)
+""" The bases benchmarked by default. """
+
+DIGIT_LENGTHS:Tuple[int, ...] = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6)
+""" The digit lengths benchmarked by default. """
+
+
+def benchmark_value(base:int, length:int, seed:int = 0) -> int:
+    """
+    `benchmark_value`
+
+    Arguments:
+        base -- The base of the value.
+        length -- The digit length of the value.
+
+    Keyword Arguments:
+        seed -- The seed of the random digits. Defaults to 0.
+
+    Returns:
+        A value with random digits and exactly the given digit length in the given base.
+    """
+    if base == 1:
+        return length
+    return Random(seed).randrange(base ** (length - 1), base ** length)
+
+
+def time_call(func:Callable[[], Any],
+              repeat:int = 3,
+              budget:float = 1.0,
+              minimum:float = 0.2
+              ) -> float:
+    """
+    `time_call`
+
+    Times a call, running it enough times to take at least the minimum time
+    and keeping the best of several measurements.
+    Measurements are not repeated once the call alone takes longer than the budget.
+
+    Arguments:
+        func -- The call to time.
+
+    Keyword Arguments:
+        repeat -- The amount of measurements to keep the best of. Defaults to 3.
+        budget -- The time, in seconds, after which a single call is not repeated.
+            Defaults to 1.0.
+        minimum -- The time, in seconds, each measurement runs for at least. Defaults to 0.2.
+
+    Returns:
+        The best time of a single call, in seconds.
+    """
+    timer = Timer(func)
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < minimum:
+        number *= 10 if elapsed < minimum / 10 else 2
+        elapsed = timer.timeit(number)
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        if best > budget:
+            break
+        best = min(best, timer.timeit(number) / number)
+    return best
+
+
+def run_benchmarks(cases:Optional[Iterable[BenchmarkCase]] = None,
+                   bases:Iterable[int] = BASES,
+                   lengths:Iterable[int] = DIGIT_LENGTHS,
+                   *,
+                   repeat:int = 3,
+                   budget:float = 1.0,
+                   minimum:float = 0.2,
+                   progress:Optional[Callable[[Dict[str, Any]], Any]] = None
+                   ) -> Dict[str, Any]:
+    """
+    `run_benchmarks`
+
+    Times every case in every base at every digit length.
+    Once a case takes longer than the budget in a base, the longer digit lengths
+    of that case and base are skipped, so slow opperations do not stall the whole run.
+
+    Keyword Arguments:
+        cases -- When not `None`, the cases to run. Defaults to `None`, running every case.
+        bases -- The bases to run in. Defaults to `BASES`.
+        lengths -- The digit lengths to run at. Defaults to `DIGIT_LENGTHS`.
+        repeat -- The amount of measurements to keep the best of. Defaults to 3.
+        budget -- The time, in seconds, a single call may take before longer digit lengths
+            are skipped. Defaults to 1.0.
+        minimum -- The time, in seconds, each measurement runs for at least. Defaults to 0.2.
+        progress -- When not `None`, called with each result as it is found. Defaults to `None`.
+
+    Returns:
+        The results, along with information on the environment they were found in.
+    """
+    results = []
+    lengths = sorted(lengths)
+    for case in (cases if cases is not None else CASES):
+        for base in bases:
+            over_budget = False
+            for length in lengths:
+                result:Dict[str, Any] = {"case" : case.name,
+                                         "base" : base,
+                                         "digits" : length,
+                                         "seconds" : None}
+                if over_budget:
+                    result["status"] = "skipped"
+                else:
+                    try:
+                        func = case.setup(benchmark_value(base, length), base, length)
+                        # a first call finds unsupported opperations before they are timed,
+                        # and is kept as the result when it is already over the budget
+                        first = perf_counter()
+                        func()
+                        first = perf_counter() - first
+                    except Exception as error: # pylint:disable=broad-except
+                        result["status"] = f"unsupported: {type(error).__name__}"
+                    else:
+                        result["seconds"] = first if first > budget \
+                            else time_call(func, repeat, budget, minimum)
+                        result["status"] = "ok"
+                        over_budget = result["seconds"] > budget
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+
+    return {
+        "meta" : dict(results_meta(), repeat = repeat, budget = budget),
+        "results" : results,
+    }
+
+
+def results_meta() -> Dict[str, Any]:
+    """
+    `results_meta`
+
+    Returns:
+        Information on the environment results are found in, kept alongside them.
+    """
+    return {
+        "digint" : __version__,
+        "python" : platform.python_version(),
+        "implementation" : platform.python_implementation(),
+        "platform" : platform.platform(),
+        "time" : datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def save_results(results:Dict[str, Any], path:str):
+    """
+    `save_results`
+
+    Arguments:
+        results -- The results to save, as returned by `run_benchmarks`.
+        path -- The path of the JSON file to save to.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+
+
+def load_results(path:str) -> Dict[str, Any]:
+    """
+    `load_results`
+
+    Arguments:
+        path -- The path of the JSON file to load from.
+
+    Returns:
+        The results saved by `save_results`.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def format_seconds(seconds:Optional[float]) -> str:
+    """
+    `format_seconds`
+
+    Arguments:
+        seconds -- The time to format, or `None`.
+
+    Returns:
+        The time with a fitting unit, or `-` when `None`.
+    """
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def results_markdown(results:Dict[str, Any]) -> str:
+    """
+    `results_markdown`
+
+    Arguments:
+        results -- The results to tabulate, as returned by `run_benchmarks`.
+
+    Returns:
+        A markdown report of the results, with a row for each case and base
+        and a column for each digit length.
+    """
+    lengths = sorted(set(r["digits"] for r in results["results"]))
+    rows:Dict[Tuple[str, int], Dict[int, str]] = {}
+    for result in results["results"]:
+        cell = format_seconds(result["seconds"]) if result["status"] == "ok" \
+            else result["status"].split(":")[0]
+        rows.setdefault((result["case"], result["base"]), {})[result["digits"]] = cell
+
+    meta = results["meta"]
+    lines = [
+        "# BENCHMARK",
+        "",
+        f"digint {meta['digint']} on {meta['implementation']} {meta['python']} "
+        f"({meta['platform']}), {meta['time']}",
+        "",
+        "Best time of a single call. Skipped sizes took over "
+        f"{meta['budget']} s at a smaller digit length.",
+        "",
+        "| case | base | " + " | ".join(f"{d} digits" for d in lengths) + " |",
+        "| --- | ---: | " + " | ".join("---:" for _ in lengths) + " |",
+    ]
+    for (case, base), cells in rows.items():
+        row = " | ".join(cells.get(d, "-") for d in lengths)
+        lines.append(f"| {case} | {base} | {row} |")
+    return "\n".join(lines) + "\n"
+
+
+def compare_results(results:Dict[str, Any],
+                    baseline:Dict[str, Any],
+                    threshold:float = 1.25,
+                    metric:str = "seconds"
+                    ) -> List[Dict[str, Any]]:
+    """
+    `compare_results`
+
+    Compares results against a saved baseline,
+    for every case, base and digit length that was measured in both.
+
+    Arguments:
+        results -- The new results.
+        baseline -- The results to compare against.
+
+    Keyword Arguments:
+        threshold -- The ratio of the new measurement to the baseline measurement
+            above which a result is flagged as a regression. Defaults to 1.25.
+        metric -- The measurement compared, ie. "peak" for memory results.
+            Defaults to "seconds".
+
+    Returns:
+        Each compared result with its baseline measurement, its ratio and whether it regressed,
+        greatest ratio first.
+    """
+    previous = {(r["case"], r["base"], r["digits"]) : r.get(metric)
+                for r in baseline["results"] if r.get(metric) is not None}
+    compared = []
+    for result in results["results"]:
+        key = (result["case"], result["base"], result["digits"])
+        if result.get(metric) is None or key not in previous or previous[key] == 0:
+            continue
+        ratio = result[metric] / previous[key]
+        compared.append(dict(result,
+                             baseline = previous[key],
+                             ratio = ratio,
+                             regressed = ratio > threshold))
+    compared.sort(key=lambda c: c["ratio"], reverse=True)
+    return compared
@@ -0,0 +1,231 @@
+"""
+benford
+
+Holds the leading digit analysis used in the `digint` module,
+for finding the distribution of the leading digits of large streams of values in any base,
+such as when checking values against Benford's law.
+
+Values are never turned into digits.
+Instead, every bit length is mapped to the (at most two) digit lengths its values can have,
+along with the powers of the base that reduce those values to their leading digits.
+Each value then only needs a single comparison and division.
+When `numpy` is available, columns of `numpy` intigers are handled all at once,
+estimating the digit lengths with logarithms and correcting them exactly with a table of powers.
+"""
+
+from collections import Counter
+from math import log
+from sys import modules
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import int_digit_length, int_to_digits
+from .notation_format import NotationFormat, DEFAULT_FORMAT
+
+# `numpy` is never imported here, as arrays of it can only be given once it is already imported
+numpy:Any = None # pylint:disable=invalid-name
+
+
+def _is_numpy_array(values:Any) -> bool:
+    global numpy # pylint:disable=global-statement, invalid-name
+    if numpy is None:
+        numpy = modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+class LeadingDigitAnalyzer:
+    """
+    `LeadingDigitAnalyzer`
+
+    Counts the leading digits of streams of intiger values in a set base,
+    building a histogram of the values of the first `digits` digits of each value.
+    Signs are ignored.
+
+    Values of `0` have no leading digits and are only counted in `zeros`,
+    and values with less than `digits` digits are only counted in `short`.
+
+    Analyzers can be updated as values arrive, and analyzers of the same base and amount of digits
+    can be merged, so separate parts of a stream can be counted separately (ie. across processes)
+    and then combined.
+    """
+
+    def __init__(self, base:int = 10, digits:int = 1):
+        """
+        `__init__`
+
+        Keyword Arguments:
+            base -- The base to find the leading digits in. Defaults to 10.
+            digits -- The amount of leading digits to count together. Defaults to 1.
+
+        Raises:
+            ValueError: Raised when the base is less than 2, or `digits` is less than 1.
+        """
+        if base < 2:
+            raise ValueError("Invalid base", base)
+        if digits < 1:
+            raise ValueError("At least one leading digit is needed", digits)
+
+        self.base:int = base
+        self.digits:int = digits
+        self.counts:Counter = Counter()
+        self.zeros:int = 0
+        self.short:int = 0
+        # bit lengths mapped to the smallest value with the longer of the possible digit lengths,
+        # and the divisors for values below and at or above it (`None` for values that are short)
+        self.__places:Dict[int, Tuple[int, Optional[int], Optional[int]]] = {}
+
+    def __place(self, bit_length:int) -> Tuple[int, Optional[int], Optional[int]]:
+        # every value of this bit length has either the digit length of its smallest value,
+        # or one more digit once it reaches the next power of the base
+        length = int_digit_length(1 << (bit_length - 1), self.base)
+        shorter = self.base ** (length - self.digits) if length >= self.digits else None
+        longer = self.base ** (length + 1 - self.digits) if length + 1 >= self.digits else None
+        place = (self.base ** length, shorter, longer)
+        self.__places[bit_length] = place
+        return place
+
+    def update(self, values:Iterable[SupportsInt]) -> 'LeadingDigitAnalyzer':
+        """
+        `update`
+
+        Counts the leading digits of more values.
+
+        Arguments:
+            values -- The values to count, any iterable of intigers
+                (including compact digit arrays, `digitint`s and `numpy` intiger arrays).
+
+        Returns:
+            This analyzer, to allow for chaining.
+        """
+        array:Any = values
+        if _is_numpy_array(array) and array.dtype.kind in "iu":
+            if self.base ** self.digits <= (1 << 63):
+                self.__update_numpy(array)
+                return self
+            values = array.tolist()
+
+        places = self.__places
+        counts:Counter = Counter()
+        zeros = 0
+        short = 0
+        for value in values:
+            value = abs(int(value))
+            if value == 0:
+                zeros += 1
+                continue
+            bit_length = value.bit_length()
+            place = places.get(bit_length)
+            if place is None:
+                place = self.__place(bit_length)
+            divisor = place[2] if value >= place[0] else place[1]
+            if divisor is None:
+                short += 1
+            else:
+                counts[value // divisor] += 1
+
+        self.counts.update(counts)
+        self.zeros += zeros
+        self.short += short
+        return self
+
+    def __update_numpy(self, values:Any):
+        if values.dtype.kind == "u":
+            values = values.astype(numpy.uint64).ravel()
+        else:
+            # the absolute value of the smallest int64 wraps around to itself,
+            # which is then read correctly as unsigned
+            values = numpy.abs(values.astype(numpy.int64).ravel()).astype(numpy.uint64)
+
+        nonzero = values != 0
+        self.zeros += int(values.size - numpy.count_nonzero(nonzero))
+        values = values[nonzero]
+        if values.size == 0:
+            return
+
+        powers_list = [1]
+        while powers_list[-1] * self.base < (1 << 64):
+            powers_list.append(powers_list[-1] * self.base)
+        powers = numpy.array(powers_list, dtype=numpy.uint64)
+        last = len(powers_list) - 1
+
+        # estimate the exponent of the leading place with logarithms, then correct it exactly
+        exponents = numpy.floor(numpy.log(values.astype(numpy.float64)) / log(self.base))
+        exponents = numpy.clip(exponents.astype(numpy.int64), 0, last)
+        exponents -= (values < powers[exponents]).astype(numpy.int64)
+        exponents = numpy.clip(exponents, 0, last)
+        above = numpy.minimum(exponents + 1, last)
+        exponents += ((exponents < last) & (values >= powers[above])).astype(numpy.int64)
+
+        long_enough = exponents >= (self.digits - 1)
+        self.short += int(values.size - numpy.count_nonzero(long_enough))
+        values = values[long_enough]
+        exponents = exponents[long_enough]
+        leading = values // powers[exponents - (self.digits - 1)]
+
+        found, found_counts = numpy.unique(leading, return_counts=True)
+        self.counts.update(dict(zip(found.tolist(), found_counts.tolist())))
+
+    def merge(self, other:'LeadingDigitAnalyzer') -> 'LeadingDigitAnalyzer':
+        """
+        `merge`
+
+        Adds the counts of another analyzer to this one.
+
+        Arguments:
+            other -- The analyzer to merge, must use the same base and amount of digits.
+
+        Raises:
+            ValueError: Raised when the analyzers do not use the same base and amount of digits.
+
+        Returns:
+            This analyzer, to allow for chaining.
+        """
+        if other.base != self.base or other.digits != self.digits:
+            raise ValueError("Only analyzers of the same base and amount of digits can be merged")
+        self.counts.update(other.counts)
+        self.zeros += other.zeros
+        self.short += other.short
+        return self
+
+    @property
+    def total(self) -> int:
+        """
+        `total`
+
+        The amount of values with counted leading digits.
+        """
+        return sum(self.counts.values())
+
+    def frequencies(self) -> Dict[int, float]:
+        """
+        `frequencies`
+
+        Returns:
+            The leading digit values mapped to the fraction of counted values they lead.
+        """
+        total = self.total
+        return {leading : count / total for leading, count in sorted(self.counts.items())}
+
+    def expected(self) -> Dict[int, float]:
+        """
+        `expected`
+
+        Returns:
+            Every possible leading digit value mapped to the fraction of values it would lead
+            if the values followed Benford's law, `log(1 + 1 / leading, base)`.
+        """
+        low = self.base ** (self.digits - 1)
+        return {leading : log(1 + (1 / leading), self.base)
+                for leading in range(low, low * self.base)}
+
+    def notated(self, notation_format:NotationFormat = DEFAULT_FORMAT) -> Dict[str, int]:
+        """
+        `notated`
+
+        Arguments:
+            notation_format -- The notation format to notate the leading digits with.
+                Defaults to `DEFAULT_FORMAT`.
+
+        Returns:
+            The counts, keyed by the notation of the leading digits instead of their value.
+        """
+        return {notation_format.notate_digits(int_to_digits(leading, self.base), 0) : count
+                for leading, count in sorted(self.counts.items())}
@@ -0,0 +1,559 @@
+"""
+checkdigit
+
+Holds the check digit schemes used in the `digint` module,
+for computing and verifying the check digits of codes such as account numbers, IBANs and ISBNs,
+one at a time or in batches.
+
+Every scheme is driven by lookup tables that are built once.
+Weighted sum schemes hold a table per position of the contribution each digit value makes,
+which lets a single long code be summed a whole position class at a time with `bytes.translate`,
+and a batch of codes in a `numpy` digit matrix be summed with a single lookup.
+Table driven schemes (Damm and Verhoeff) step a whole batch through their tables
+one column at a time.
+
+Codes are given as intigers, `PositionalBasedIntiger`s or sequences of digit values
+starting at the units spot (where the check digit is), like the rest of the `digint` module.
+As intigers have no leading zeros, `length` may be given for schemes where leading zeros matter.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from math import gcd
+from sys import modules
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import DigitArray, int_to_digits, digits_to_int, int_digit_length
+from .digint import PositionalBasedIntiger
+
+# `numpy` is never imported here, as arrays of it can only be given once it is already imported
+numpy:Any = None # pylint:disable=invalid-name
+
+
+def _is_numpy_array(values:Any) -> bool:
+    global numpy # pylint:disable=global-statement, invalid-name
+    if numpy is None:
+        numpy = modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+CheckedValue = Union[int, PositionalBasedIntiger, Sequence[int]]
+""" @private """
+
+
+def _value_digits(value:CheckedValue, base:int, length:int = 0) -> DigitArray:
+    if isinstance(value, (int, PositionalBasedIntiger)):
+        return int_to_digits(int(value), base, length)
+    if len(value) < length:
+        return list(value) + ([0] * (length - len(value)))
+    return cast(DigitArray, value)
+
+
+def _digit_matrices(values:Any, base:int, length:int = 0) -> Iterator[Tuple[Any, Any]]:
+    # the rows of each value's digits starting at the units spot, as `(rows, matrix)` pairs
+    # of the indices of the values and their matrix, grouped by the digit length of each value
+    # (or `length` when longer), as leading zeros change the check digits of some schemes
+    if values.ndim == 2:
+        matrix = values.astype(numpy.int64)
+        if matrix.shape[1] < length:
+            matrix = numpy.pad(matrix, ((0, 0), (0, length - matrix.shape[1])))
+        yield (numpy.arange(matrix.shape[0]), matrix)
+        return
+
+    values = numpy.abs(values.astype(numpy.int64))
+    count = int_digit_length(int(values.max()), base) if values.size != 0 else 0
+    powers = numpy.array([base ** i for i in range(count)], dtype=numpy.int64)
+    digits = (values[:, None] // powers[None, :]) % base
+    lengths = numpy.maximum((values[:, None] >= powers[None, :]).sum(axis=1), length)
+    for row_length in numpy.unique(lengths).tolist():
+        rows = numpy.nonzero(lengths == row_length)[0]
+        matrix = digits[rows, :row_length]
+        if row_length > count:
+            matrix = numpy.pad(matrix, ((0, 0), (0, row_length - count)))
+        yield (rows, matrix)
+
+
+def _fits_matrix(values:Any) -> bool:
+    # whether a batch can be put in a `numpy.int64` matrix without wrapping
+    if values.dtype.kind not in "iu":
+        return False
+    if values.ndim != 1 or values.size == 0:
+        return True
+    return int(values.max()) < (1 << 63) and int(values.min()) > -(1 << 63)
+
+
+class CheckDigitScheme(ABC):
+    """
+    `CheckDigitScheme`
+
+    The base of every check digit scheme, computing and verifying check digits
+    of single codes or batches of codes.
+    Batches given as `numpy` intiger arrays (either an array of values,
+    or a matrix with a row of digits for each code starting at the units spot)
+    are processed without working through each code or digit separately,
+    a group of codes of the same digit length at a time.
+    Arrays of values too large for `numpy.int64` are worked through one code at a time instead.
+    """
+
+    base:int = 10
+    check_length:int = 1
+
+    @abstractmethod
+    def _compute_digits(self, digits:DigitArray) -> int:
+        ...
+
+    def _verify_digits(self, digits:DigitArray) -> bool:
+        return self._compute_digits(digits[self.check_length:]) \
+            == digits_to_int(digits[:self.check_length], self.base)
+
+    def _compute_matrix(self, matrix:Any) -> Any:
+        return numpy.array([self._compute_digits(row.tolist()) for row in matrix])
+
+    def _verify_matrix(self, matrix:Any) -> Any:
+        checks = numpy.zeros(matrix.shape[0], dtype=numpy.int64)
+        for i in range(self.check_length - 1, -1, -1):
+            checks = (checks * self.base) + matrix[:, i]
+        return self._compute_matrix(matrix[:, self.check_length:]) == checks
+
+    def compute(self, value:CheckedValue, length:int = 0) -> int:
+        """
+        `compute`
+
+        Computes the check digit (or digits) of a code.
+
+        Arguments:
+            value -- The code without its check digit.
+
+        Keyword Arguments:
+            length -- The amount of digits in the code, padding it with leading zeros.
+                Defaults to 0.
+
+        Returns:
+            The value of the check digit (or digits).
+        """
+        return self._compute_digits(_value_digits(value, self.base, length))
+
+    def verify(self, value:CheckedValue, length:int = 0) -> bool:
+        """
+        `verify`
+
+        Verifies the check digit (or digits) of a code.
+
+        Arguments:
+            value -- The code, with its check digit in the units spot.
+
+        Keyword Arguments:
+            length -- The amount of digits in the code (including the check digit),
+                padding it with leading zeros. Defaults to 0.
+
+        Returns:
+            True if the check digit matches the rest of the code.
+        """
+        digits = _value_digits(value, self.base, max(length, self.check_length))
+        return self._verify_digits(digits)
+
+    def compute_many(self, values:Iterable[CheckedValue], length:int = 0) -> Sequence[int]:
+        """
+        `compute_many`
+
+        Computes the check digits of a batch of codes, like `compute`.
+
+        Arguments:
+            values -- The codes without their check digits.
+
+        Keyword Arguments:
+            length -- The amount of digits in every code, padding them with leading zeros.
+                Defaults to 0.
+
+        Returns:
+            The check digits, as a `numpy` array when given a `numpy` array.
+        """
+        if _is_numpy_array(values):
+            array_values = cast(Any, values)
+            if not _fits_matrix(array_values):
+                return numpy.array([self.compute(v, length) for v in array_values.tolist()],
+                                   dtype=numpy.int64)
+            checks = numpy.zeros(len(array_values), dtype=numpy.int64)
+            for rows, matrix in _digit_matrices(array_values, self.base, length):
+                checks[rows] = self._compute_matrix(matrix)
+            return checks
+        return [self.compute(v, length) for v in values]
+
+    def verify_many(self, values:Iterable[CheckedValue], length:int = 0) -> Sequence[bool]:
+        """
+        `verify_many`
+
+        Verifies the check digits of a batch of codes, like `verify`.
+
+        Arguments:
+            values -- The codes, each with its check digit in the units spot.
+
+        Keyword Arguments:
+            length -- The amount of digits in every code (including the check digit),
+                padding them with leading zeros. Defaults to 0.
+
+        Returns:
+            Whether each check digit matches, as a `numpy` array when given a `numpy` array.
+        """
+        if _is_numpy_array(values):
+            array_values = cast(Any, values)
+            if not _fits_matrix(array_values):
+                return numpy.array([self.verify(v, length) for v in array_values.tolist()],
+                                   dtype=bool)
+            valid = numpy.zeros(len(array_values), dtype=bool)
+            length = max(length, self.check_length)
+            for rows, matrix in _digit_matrices(array_values, self.base, length):
+                valid[rows] = self._verify_matrix(matrix)
+            return valid
+        return [self.verify(v, length) for v in values]
+
+
+class WeightedSumScheme(CheckDigitScheme):
+    """
+    `WeightedSumScheme`
+
+    Inherits `CheckDigitScheme`
+
+    A check digit scheme where each digit is multiplied by the weight of its position,
+    optionally transformed, and summed, with the check digit chosen to make the sum
+    a multiple of the modulus. This covers the Luhn, ISBN, EAN and most mod 11 schemes,
+    and any in-house scheme of the same kind.
+
+    The weights start at the digit next to the check digit and repeat for longer codes.
+    Check digits may be as large as `modulus - 1`, such as the 10 (notated `X`) of ISBN-10.
+    """
+
+    def __init__(self,
+                 modulus:int,
+                 weights:Sequence[int],
+                 *,
+                 base:int = 10,
+                 check_weight:int = 1,
+                 transform:Optional[Callable[[int], int]] = None
+                 ):
+        """
+        `__init__`
+
+        Arguments:
+            modulus -- The modulus the weighted sum must be a multiple of.
+            weights -- The weights of each position, starting next to the check digit.
+
+        Keyword Arguments:
+            base -- The base of the digits of the codes. Defaults to 10.
+            check_weight -- The weight of the check digit itself. Defaults to 1.
+            transform -- When not `None`, applied to each weighted digit before it is summed
+                (ie. summing the digits of each product for Luhn). Defaults to `None`.
+
+        Raises:
+            ValueError: Raised when no weights are given,
+                or the check weight has no inverse for the modulus.
+        """
+        if len(weights) == 0:
+            raise ValueError("At least one weight is needed")
+        if gcd(check_weight, modulus) != 1:
+            raise ValueError("The check weight must have an inverse for the modulus", check_weight)
+
+        self.base = base
+        self.modulus:int = modulus
+        self.check_weight:int = check_weight
+        # the multiplier that turns the weighted check digit back into the check digit
+        self.inverse:int = next(i for i in range(modulus) if (check_weight * i) % modulus == 1) \
+            if modulus != 1 else 0
+        # for each position, the contribution of every digit value to the sum
+        self.tables:Tuple[Tuple[int, ...], ...] = tuple(
+            tuple((transform(w * d) if transform is not None else w * d) % modulus
+                  for d in range(base))
+            for w in weights
+        )
+        # the same tables as bytes, for summing compact digits with `bytes.translate`
+        self.byte_tables:Optional[Tuple[bytes, ...]] = tuple(
+            bytes(t) + bytes(256 - base) for t in self.tables
+        ) if base <= 256 and modulus <= 256 else None
+
+    def _weighted_sum(self, digits:DigitArray) -> int:
+        period = len(self.tables)
+        if self.byte_tables is not None and isinstance(digits, array) and digits.typecode == "B":
+            packed = digits.tobytes()
+            return sum(sum(packed[i::period].translate(self.byte_tables[i]))
+                       for i in range(min(period, len(packed))))
+        tables = self.tables
+        return sum(tables[i % period][d] for i, d in enumerate(digits))
+
+    @override
+    def _compute_digits(self, digits:DigitArray) -> int:
+        return (-self._weighted_sum(digits) * self.inverse) % self.modulus
+
+    @override
+    def _verify_digits(self, digits:DigitArray) -> bool:
+        if len(digits) == 0:
+            return False
+        total = self._weighted_sum(digits[1:]) + (self.check_weight * digits[0])
+        return total % self.modulus == 0
+
+    def __position_tables(self, count:int) -> Any:
+        period = len(self.tables)
+        tables = [self.tables[i % period] for i in range(count)]
+        return numpy.array(tables, dtype=numpy.int64).reshape(count, self.base)
+
+    @override
+    def _compute_matrix(self, matrix:Any) -> Any:
+        tables = self.__position_tables(matrix.shape[1])
+        total = tables[numpy.arange(matrix.shape[1])[None, :], matrix].sum(axis=1)
+        return (-total * self.inverse) % self.modulus
+
+    @override
+    def _verify_matrix(self, matrix:Any) -> Any:
+        payload = matrix[:, 1:]
+        tables = self.__position_tables(payload.shape[1])
+        total = tables[numpy.arange(payload.shape[1])[None, :], payload].sum(axis=1)
+        return (total + (self.check_weight * matrix[:, 0])) % self.modulus == 0
+
+
+class Mod97Scheme(CheckDigitScheme):
+    """
+    `Mod97Scheme`
+
+    Inherits `CheckDigitScheme`
+
+    The ISO 7064 MOD 97-10 scheme used by IBANs, with two check digits chosen so that
+    the whole code leaves a remainder of 1 when divided by 97.
+    Codes holding letters (such as IBANs) must first be converted to their numeric form.
+    """
+
+    check_length = 2
+
+    @override
+    def compute(self, value:CheckedValue, length:int = 0) -> int:
+        if isinstance(value, (int, PositionalBasedIntiger)):
+            return 98 - ((abs(int(value)) * 100) % 97)
+        return super().compute(value, length)
+
+    @override
+    def verify(self, value:CheckedValue, length:int = 0) -> bool:
+        if isinstance(value, (int, PositionalBasedIntiger)):
+            return abs(int(value)) % 97 == 1
+        return super().verify(value, length)
+
+    @override
+    def _compute_digits(self, digits:DigitArray) -> int:
+        return 98 - ((digits_to_int(digits, 10) * 100) % 97)
+
+    @override
+    def _compute_matrix(self, matrix:Any) -> Any:
+        remainder = numpy.zeros(matrix.shape[0], dtype=numpy.int64)
+        for i in range(matrix.shape[1] - 1, -1, -1):
+            remainder = ((remainder * 10) + matrix[:, i]) % 97
+        return 98 - ((remainder * 100) % 97)
+
+
+class TableScheme(CheckDigitScheme):
+    """
+    `TableScheme`
+
+    Inherits `CheckDigitScheme`
+
+    The base of check digit schemes that step through a table for every digit,
+    such as the Damm and Verhoeff schemes, where the check digit is valid
+    when the final step ends at 0.
+    """
+
+    # whether the digits are stepped through starting at the greatest place value
+    from_greatest:bool = True
+
+    # the next state from the current state, digit and position (counted from the check digit)
+    @abstractmethod
+    def _step(self, state:int, digit:int, position:int) -> int:
+        ...
+
+    # the same as `_step` for every row of a batch at once
+    @abstractmethod
+    def _step_matrix(self, state:Any, digits:Any, position:int) -> Any:
+        ...
+
+    # the check digit that makes the final step end at 0, from the state before it
+    @abstractmethod
+    def _check_from(self, state:int) -> int:
+        ...
+
+    def __run(self, digits:DigitArray, offset:int) -> int:
+        state = 0
+        positions = range(len(digits))
+        for i in (reversed(positions) if self.from_greatest else positions):
+            state = self._step(state, digits[i], i + offset)
+        return state
+
+    def __run_matrix(self, matrix:Any, offset:int) -> Any:
+        state = numpy.zeros(matrix.shape[0], dtype=numpy.int64)
+        positions = range(matrix.shape[1])
+        for i in (reversed(positions) if self.from_greatest else positions):
+            state = self._step_matrix(state, matrix[:, i], i + offset)
+        return state
+
+    @override
+    def _compute_digits(self, digits:DigitArray) -> int:
+        return self._check_from(self.__run(digits, 1))
+
+    @override
+    def _verify_digits(self, digits:DigitArray) -> bool:
+        return self.__run(digits, 0) == 0
+
+    @override
+    def _compute_matrix(self, matrix:Any) -> Any:
+        state = self.__run_matrix(matrix, 1)
+        return numpy.array(self._check_table(), dtype=numpy.int64)[state]
+
+    @override
+    def _verify_matrix(self, matrix:Any) -> Any:
+        return self.__run_matrix(matrix, 0) == 0
+
+    def _check_table(self) -> Tuple[int, ...]:
+        return tuple(self._check_from(s) for s in range(self.base))
+
+
+class DammScheme(TableScheme):
+    """
+    `DammScheme`
+
+    Inherits `TableScheme`
+
+    The Damm scheme, which steps through a totally anti-symmetric quasigroup
+    from the greatest place value down, catching every single digit error
+    and every adjacent transposition.
+    """
+
+    TABLE:Tuple[Tuple[int, ...], ...] = (
+        (0, 3, 1, 7, 5, 9, 8, 6, 4, 2),
+        (7, 0, 9, 2, 1, 5, 4, 8, 6, 3),
+        (4, 2, 0, 6, 8, 7, 1, 3, 5, 9),
+        (1, 7, 5, 0, 9, 8, 3, 4, 2, 6),
+        (6, 1, 2, 3, 0, 4, 5, 9, 7, 8),
+        (3, 6, 7, 4, 2, 0, 9, 5, 8, 1),
+        (5, 8, 6, 9, 7, 2, 0, 1, 3, 4),
+        (8, 9, 4, 5, 3, 6, 2, 0, 1, 7),
+        (9, 4, 3, 8, 6, 1, 7, 2, 0, 5),
+        (2, 5, 8, 1, 4, 3, 6, 7, 9, 0),
+    )
+
+    @override
+    def _step(self, state:int, digit:int, position:int) -> int:
+        return self.TABLE[state][digit]
+
+    @override
+    def _step_matrix(self, state:Any, digits:Any, position:int) -> Any:
+        return numpy.array(self.TABLE, dtype=numpy.int64)[state, digits]
+
+    @override
+    def _check_from(self, state:int) -> int:
+        # the diagonal of the table is all 0s, so the state itself ends at 0
+        return state
+
+
+class VerhoeffScheme(TableScheme):
+    """
+    `VerhoeffScheme`
+
+    Inherits `TableScheme`
+
+    The Verhoeff scheme, which steps through the dihedral group D5
+    from the units spot up, permuting each digit by its position.
+    As each position permutes `0` differently, leading zeros change the check digit,
+    so `length` should be given for codes that may have them.
+    """
+
+    from_greatest = False
+    MULTIPLY:Tuple[Tuple[int, ...], ...] = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        (1, 2, 3, 4, 0, 6, 7, 8, 9, 5),
+        (2, 3, 4, 0, 1, 7, 8, 9, 5, 6),
+        (3, 4, 0, 1, 2, 8, 9, 5, 6, 7),
+        (4, 0, 1, 2, 3, 9, 5, 6, 7, 8),
+        (5, 9, 8, 7, 6, 0, 4, 3, 2, 1),
+        (6, 5, 9, 8, 7, 1, 0, 4, 3, 2),
+        (7, 6, 5, 9, 8, 2, 1, 0, 4, 3),
+        (8, 7, 6, 5, 9, 3, 2, 1, 0, 4),
+        (9, 8, 7, 6, 5, 4, 3, 2, 1, 0),
+    )
+    PERMUTE:Tuple[Tuple[int, ...], ...] = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        (1, 5, 7, 6, 2, 8, 3, 0, 9, 4),
+        (5, 8, 0, 3, 7, 9, 6, 1, 4, 2),
+        (8, 9, 1, 6, 0, 4, 3, 5, 2, 7),
+        (9, 4, 5, 3, 1, 2, 6, 8, 7, 0),
+        (4, 2, 8, 6, 5, 7, 3, 9, 0, 1),
+        (2, 7, 9, 3, 8, 0, 6, 4, 1, 5),
+        (7, 0, 4, 6, 9, 1, 3, 2, 5, 8),
+    )
+    INVERSE:Tuple[int, ...] = (0, 4, 3, 2, 1, 5, 6, 7, 8, 9)
+
+    @override
+    def _step(self, state:int, digit:int, position:int) -> int:
+        return self.MULTIPLY[state][self.PERMUTE[position % 8][digit]]
+
+    @override
+    def _step_matrix(self, state:Any, digits:Any, position:int) -> Any:
+        permuted = numpy.array(self.PERMUTE[position % 8], dtype=numpy.int64)[digits]
+        return numpy.array(self.MULTIPLY, dtype=numpy.int64)[state, permuted]
+
+    @override
+    def _check_from(self, state:int) -> int:
+        return self.INVERSE[state]
+
+
+def _digit_sum_product(product:int) -> int:
+    # the Luhn scheme sums the digits of each doubled digit
+    return (product // 10) + (product % 10)
+
+
+SCHEMES:Dict[str, CheckDigitScheme] = {
+    "luhn" : WeightedSumScheme(10, (2, 1), transform=_digit_sum_product),
+    "isbn10" : WeightedSumScheme(11, tuple(range(2, 11))),
+    "ean13" : WeightedSumScheme(10, (3, 1)),
+    "mod11" : WeightedSumScheme(11, tuple(range(2, 8))),
+    "mod97" : Mod97Scheme(),
+    "damm" : DammScheme(),
+    "verhoeff" : VerhoeffScheme(),
+}
+""" The registered check digit schemes, by name. """
+
+
+def register_scheme(name:str, scheme:CheckDigitScheme, replace:bool = False) -> CheckDigitScheme:
+    """
+    `register_scheme`
+
+    Registers a check digit scheme under a name, so it can be looked up with `get_scheme`.
+
+    Arguments:
+        name -- The name of the scheme.
+        scheme -- The scheme to register (ie. a `WeightedSumScheme` for a in-house scheme).
+
+    Keyword Arguments:
+        replace -- When true, replaces any scheme already registered under the name.
+            Defaults to False.
+
+    Raises:
+        ValueError: Raised when a scheme is already registered under the name.
+
+    Returns:
+        The registered scheme.
+    """
+    if name in SCHEMES and not replace:
+        raise ValueError("A check digit scheme is already registered under this name", name)
+    SCHEMES[name] = scheme
+    return scheme
+
+
+def get_scheme(name:str) -> CheckDigitScheme:
+    """
+    `get_scheme`
+
+    Arguments:
+        name -- The name of the scheme.
+
+    Raises:
+        ValueError: Raised when no scheme is registered under the name.
+
+    Returns:
+        The check digit scheme registered under the name.
+    """
+    if name not in SCHEMES:
+        raise ValueError("No check digit scheme is registered under this name", name)
+    return SCHEMES[name]
@@ -0,0 +1,799 @@
+"""
+conversion
+
+Holds the functions used to convert intiger values to and from sequences of digit values,
+in any base, for the `digint` module.
+
+Conversions between values and digits are done by repeatedly splitting the value
+(or the digits) in half by a power of the base, which avoids the quadratic cost of
+finding each digit one at a time.
+Splitting a large value uses a recursive division (after Burnikel and Ziegler),
+as the builtin division of large intigers takes quadratic time before Python 3.12.
+Bases that are powers of two are instead converted directly from the binary representation.
+Negative bases are converted through their positive counterpart,
+by offsetting the value so that every digit in an odd place can be complemented.
+"""
+
+from array import array
+from functools import lru_cache
+from math import gcd, log
+from sys import byteorder, version_info
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .notation_format import NotationFormat, DEFAULT_FORMAT
+
+
+DigitArray = MutableSequence[int]
+""" @private """
+
+# the amount of digits at which a value is no longer split, and is converted one digit at a time
+_LEAF_DIGITS:int = 64
+# the amount of decimal digits at which a value is converted using the builtin `str` instead,
+# kept well under the default limit of `sys.set_int_max_str_digits`
+_DECIMAL_LEAF_DIGITS:int = 1024
+_TYPECODES:Tuple[Tuple[str, int], ...] = tuple((t, 1 << (array(t).itemsize * 8)) for t in "BHILQ")
+_ASCII_SYMBOLS:bytes = b"0123456789abcdefghijklmnopqrstuvwxyz"
+_FROM_ASCII:bytes = bytes.maketrans(_ASCII_SYMBOLS, bytes(range(len(_ASCII_SYMBOLS))))
+_TO_ASCII:bytes = bytes.maketrans(bytes(range(len(_ASCII_SYMBOLS))), _ASCII_SYMBOLS)
+_POWER_OF_TWO_FORMATS:Dict[int, str] = {1 : "b", 3 : "o", 4 : "x"}
+# how many digits a hinted leading place may be from the estimate and still be corrected from
+_PLACE_HINT_DISTANCE:int = 8
+# the widths of power of two digits that fit evenly into a byte
+_REVERSIBLE_WIDTHS:Tuple[int, ...] = (1, 2, 4, 8)
+# the bit length of divisors at which the builtin division is used rather than being split,
+# or `None` when the builtin division of large intigers is already fast (from Python 3.12)
+_DIVISION_LEAF_BITS:Optional[int] = 4096 if version_info < (3, 12) else None
+
+
+# for a width of power of two digits that fits evenly into a byte,
+# each byte mapped to the byte with the order of its digits reversed
+# only built once needed, as building every table slows down importing
+@lru_cache(maxsize=None)
+def _reversed_bytes(width:int) -> bytes:
+    return bytes(sum(((d >> (i * width)) & ((1 << width) - 1)) << (8 - width - (i * width))
+                     for i in range(8 // width))
+                 for d in range(256))
+
+
+@lru_cache(maxsize=128)
+def power(base:int, exponent:int) -> int:
+    """
+    `power`
+
+    A cached `base ** exponent`.
+    Intended for the powers used to split values in half, which are reused often.
+
+    Arguments:
+        base -- The base of the power.
+        exponent -- The exponent of the power.
+
+    Returns:
+        `base ** exponent`.
+    """
+    return base ** exponent
+
+
+def _divide_two_by_one(dividend:int, divisor:int, bits:int) -> Tuple[int, int]:
+    # divides a value of up to `2 * bits` bits by a divisor of `bits` bits,
+    # where the quotient is known to fit in `bits` bits
+    if _DIVISION_LEAF_BITS is None or bits <= _DIVISION_LEAF_BITS:
+        return divmod(dividend, divisor)
+    odd = bits & 1
+    if odd:
+        dividend <<= 1
+        divisor <<= 1
+        bits += 1
+    half = bits >> 1
+    mask = (1 << half) - 1
+    divisor_high, divisor_low = divisor >> half, divisor & mask
+    quotient_high, remainder = _divide_three_by_two(dividend >> bits, (dividend >> half) & mask,
+                                                    divisor, divisor_high, divisor_low, half)
+    quotient_low, remainder = _divide_three_by_two(remainder, dividend & mask,
+                                                   divisor, divisor_high, divisor_low, half)
+    if odd:
+        remainder >>= 1
+    return ((quotient_high << half) | quotient_low, remainder)
+
+
+def _divide_three_by_two(dividend_high:int,
+                         dividend_low:int,
+                         divisor:int,
+                         divisor_high:int,
+                         divisor_low:int,
+                         bits:int
+                         ) -> Tuple[int, int]:
+    # divides `(dividend_high << bits) | dividend_low` by the divisor of `2 * bits` bits,
+    # estimating the quotient from the high half of the divisor, then correcting it
+    if dividend_high >> bits == divisor_high:
+        quotient = (1 << bits) - 1
+        remainder = dividend_high - (divisor_high << bits) + divisor_high
+    else:
+        quotient, remainder = _divide_two_by_one(dividend_high, divisor_high, bits)
+    remainder = ((remainder << bits) | dividend_low) - (quotient * divisor_low)
+    while remainder < 0:
+        quotient -= 1
+        remainder += divisor
+    return (quotient, remainder)
+
+
+def split_divmod(value:int, divisor:int) -> Tuple[int, int]:
+    """
+    `split_divmod`
+
+    The same as `divmod` for a non negative value and positive divisor,
+    but in subquadratic time for large divisors, by recursively splitting the division in half
+    (as described by Burnikel and Ziegler).
+    From Python 3.12, the builtin `divmod` already does this, so it is used instead.
+
+    Arguments:
+        value -- The non negative value to divide.
+        divisor -- The positive value to divide by.
+
+    Returns:
+        The quotient and remainder.
+    """
+    bits = divisor.bit_length()
+    if _DIVISION_LEAF_BITS is None or bits <= _DIVISION_LEAF_BITS:
+        return divmod(value, divisor)
+
+    # the value is divided one block of the divisor's bit length at a time, from the highest
+    mask = (1 << bits) - 1
+    blocks = []
+    while value != 0:
+        blocks.append(value & mask)
+        value >>= bits
+    quotients = []
+    remainder = 0
+    for block in reversed(blocks):
+        quotient, remainder = _divide_two_by_one((remainder << bits) | block, divisor, bits)
+        quotients.append(quotient)
+    quotient = 0
+    for block in quotients:
+        quotient = (quotient << bits) | block
+    return (quotient, remainder)
+
+
+def is_power_of_two(value:int) -> bool:
+    """
+    `is_power_of_two`
+
+    Returns:
+        `True` if the given value is a positive power of two (including `1`).
+    """
+    return value > 0 and value & (value - 1) == 0
+
+
+def integer_log(value:int, base:int) -> Optional[int]:
+    """
+    `integer_log`
+
+    Finds the exact intiger logarithm of the given value, if one exists.
+
+    Arguments:
+        value -- The value to find the logarithm of.
+        base -- The base of the logarithm.
+
+    Returns:
+        The exponent `k` where `base ** k == value` and `k >= 1`, otherwise `None`.
+    """
+    if abs(base) < 2 or value in (0, 1, -1):
+        return None
+    k = 0
+    current = 1
+    while abs(current) < abs(value):
+        current *= base
+        k += 1
+    return k if current == value else None
+
+
+def digit_typecode(base:int) -> Optional[str]:
+    """
+    `digit_typecode`
+
+    Arguments:
+        base -- The base of the digits to be stored.
+
+    Returns:
+        The smallest `array` typecode that can hold any digit value of the given base,
+        or `None` if the digits would not fit in any typecode.
+    """
+    radix = max(abs(base), 2)
+    for typecode, limit in _TYPECODES:
+        if radix <= limit:
+            return typecode
+    return None
+
+
+def new_digit_array(base:int, length:int = 0) -> DigitArray:
+    """
+    `new_digit_array`
+
+    Arguments:
+        base -- The base of the digits to be stored.
+
+    Keyword Arguments:
+        length -- The amount of zero digits the array starts with. Defaults to 0.
+
+    Returns:
+        A compact (`array`) sequence of zeros able to hold any digit of the given base,
+        or a `list` when the base is too large for any `array` typecode.
+    """
+    typecode = digit_typecode(base)
+    if typecode is None:
+        return [0] * length
+    digits = array(typecode)
+    digits.frombytes(bytes(length * digits.itemsize))
+    return digits
+
+
+def leading_place(value:int,
+                  base:int,
+                  hint:Optional[Tuple[int, int]] = None
+                  ) -> Tuple[int, int]:
+    """
+    `leading_place`
+
+    Finds the digit length of the given value, along with the place value of its leading digit.
+    Estimated from the bit length and then corrected exactly,
+    rather than counted one digit at a time.
+
+    Arguments:
+        value -- The value to find the leading place of.
+        base -- The base to use, must be at least 2.
+
+    Keyword Arguments:
+        hint -- A `(length, place)` pair found earlier for a value of a similar length
+            in the same base, which is corrected from instead of finding a new power when close.
+            Defaults to `None`.
+
+    Returns:
+        A tuple of the digit length and `base ** (length - 1)`,
+        or `(0, 0)` when the value is 0.
+    """
+    value = abs(value)
+    if value == 0:
+        return (0, 0)
+    if is_power_of_two(base):
+        width = base.bit_length() - 1
+        length = -(-value.bit_length() // width)
+        return (length, 1 << (width * (length - 1)))
+    if value < base:
+        return (1, 1)
+
+    estimate = int((value.bit_length() - 1) * log(2) / log(base))
+    if hint is not None and hint[0] > 0 and abs(hint[0] - 1 - estimate) <= _PLACE_HINT_DISTANCE:
+        estimate, place = hint[0] - 1, hint[1]
+    else:
+        place = base ** estimate
+    while place > value:
+        estimate -= 1
+        place //= base
+    while place * base <= value:
+        estimate += 1
+        place *= base
+    return (estimate + 1, place)
+
+
+def int_digit_length(value:int, base:int) -> int:
+    """
+    `int_digit_length`
+
+    Similar to `int.bit_length`, but relitive to the given base.
+    Estimated from the bit length and then corrected exactly,
+    rather than counted one digit at a time.
+
+    Arguments:
+        value -- The value to find the digit length of.
+        base -- The base to use.
+
+    Returns:
+        The minimum necessary amount of digits needed to display the value in full.
+        A value of 0 will always have no digits.
+    """
+    if base < -1:
+        return len(int_to_digits(value, base))
+    if base == 1:
+        return abs(value)
+    return leading_place(value, base)[0]
+
+
+def _power_of_two_to_digits(value:int, base:int, length:int) -> DigitArray:
+    width = base.bit_length() - 1
+    if width == 8:
+        return array("B", value.to_bytes(length, "little"))
+    if width in _POWER_OF_TWO_FORMATS:
+        notated = format(value, _POWER_OF_TWO_FORMATS[width]).encode("ascii")
+        return array("B", notated[::-1].translate(_FROM_ASCII))
+
+    digits = new_digit_array(base)
+    if width in (16, 32, 64) and isinstance(digits, array) and digits.itemsize * 8 == width:
+        digits.frombytes(value.to_bytes(length * digits.itemsize, "little"))
+        if byteorder != "little":
+            digits.byteswap()
+    else:
+        notated = format(value, "b")
+        notated = notated.zfill(length * width)
+        digits.extend(int(notated[i - width:i], 2) for i in range(len(notated), 0, -width))
+    return digits
+
+
+def _fill_digits(digits:DigitArray, value:int, start:int, count:int, base:int):
+    if base == 10 and count <= _DECIMAL_LEAF_DIGITS:
+        notated = str(value).encode("ascii")[::-1].translate(_FROM_ASCII)
+        digits[start:start + len(notated)] = array("B", notated)
+        return
+
+    if count <= _LEAF_DIGITS:
+        for i in range(start, start + count):
+            if value == 0:
+                break
+            value, digits[i] = divmod(value, base)
+        return
+
+    # split at the largest power of two below the count, so the same powers are reused
+    half = 1 << ((count - 1).bit_length() - 1)
+    high, low = split_divmod(value, power(base, half))
+    _fill_digits(digits, low, start, half, base)
+    _fill_digits(digits, high, start + half, count - half, base)
+
+
+def _negative_base_offset(radix:int, length:int) -> int:
+    # the largest digit in every odd place below `length` (rounded down to even) in base `radix`,
+    # adding this to a value lets its digits in base `-radix` be read from base `radix`
+    length -= length % 2
+    return (radix * (power(radix, length) - 1)) // (radix + 1)
+
+
+def _complement_odd_digits(digits:DigitArray, radix:int):
+    odd = digits[1::2]
+    if isinstance(odd, array) and odd.typecode == "B":
+        table = bytes((radix - 1 - d) % 256 for d in range(256))
+        digits[1::2] = array("B", odd.tobytes().translate(table))
+    else:
+        complemented = [radix - 1 - d for d in odd]
+        digits[1::2] = array(odd.typecode, complemented) if isinstance(odd, array) else complemented
+
+
+def negative_base_to_digits(value:int,
+                            radix:int,
+                            length:int = 0,
+                            to_digits:Optional[Callable[[int, int, int], DigitArray]] = None
+                            ) -> DigitArray:
+    """
+    `negative_base_to_digits`
+
+    Finds the digits of the given intiger in the negative base `-radix`,
+    by offsetting the value so that its digits can be read from the positive base `radix`,
+    then complementing every digit in an odd place.
+
+    Arguments:
+        value -- The value to find the digits of.
+        radix -- The absolute value of the negative base, at least 2.
+
+    Keyword Arguments:
+        length -- Ensures that at least the given amount of digits are returned,
+            padding with leading zeros. Defaults to 0.
+        to_digits -- When not `None`, used in place of `int_to_digits` to find the digits
+            of the (non negative) offset value in the positive base,
+            called as `to_digits(value, radix, length)`. Defaults to `None`.
+
+    Returns:
+        A compact sequence of the digit values, starting at the units spot.
+    """
+    count = int_digit_length(value, radix) + 2
+    count += count % 2
+    offset = _negative_base_offset(radix, count)
+    if to_digits is None and is_power_of_two(radix):
+        digits = int_to_digits((value + offset) ^ offset, radix)
+    else:
+        digits = (to_digits or int_to_digits)(value + offset, radix, count)
+        _complement_odd_digits(digits, radix)
+        while len(digits) != 0 and digits[-1] == 0:
+            digits.pop()
+
+    if length > len(digits):
+        digits.extend(new_digit_array(radix, length - len(digits)))
+    return digits
+
+
+def notation_sign(value:int, base:int) -> int:
+    """
+    `notation_sign`
+
+    The sign notated along with the digits `int_to_digits` finds for the given intiger,
+    as given to `NotationFormat.notate_digits`.
+    Every value has its own digits in a negative base, so no sign is notated in one.
+
+    Arguments:
+        value -- The value being notated.
+        base -- The base the value is notated in.
+
+    Returns:
+        -1 for negative values, 1 for positive values and 0 for zero, or 0 in a negative base.
+    """
+    if base < 0:
+        return 0
+    return (value > 0) - (value < 0)
+
+
+def int_to_digits(value:int, base:int, length:int = 0) -> DigitArray:
+    """
+    `int_to_digits`
+
+    Finds all the digits of the absolute value of the given intiger.
+    In a negative base, every value has its own digits without needing a sign,
+    so the digits of the value itself are found instead.
+
+    Arguments:
+        value -- The value to find the digits of.
+        base -- The base of the digits.
+
+    Keyword Arguments:
+        length -- Ensures that at least the given amount of digits are returned,
+            padding with leading zeros. Defaults to 0.
+
+    Returns:
+        A compact sequence of the digit values, starting at the units spot.
+    """
+    if base < -1:
+        return negative_base_to_digits(value, -base, length)
+
+    value = abs(value)
+    count = int_digit_length(value, base)
+
+    if base == 1:
+        digits = array("B", b"\x01" * count)
+    elif is_power_of_two(base) and count != 0:
+        digits = _power_of_two_to_digits(value, base, count)
+    else:
+        digits = new_digit_array(base, count)
+        if count != 0:
+            _fill_digits(digits, value, 0, count, base)
+
+    if length > len(digits):
+        digits.extend(new_digit_array(base, length - len(digits)))
+    return digits
+
+
+def _combine_digits(digits:Sequence[int], start:int, count:int, base:int) -> int:
+    if count <= _LEAF_DIGITS:
+        value = 0
+        for i in range(start + count - 1, start - 1, -1):
+            value = (value * base) + digits[i]
+        return value
+
+    half = 1 << ((count - 1).bit_length() - 1)
+    high = _combine_digits(digits, start + half, count - half, base)
+    return (high * power(base, half)) + _combine_digits(digits, start, half, base)
+
+
+def _combine_ascii(notated:bytes, start:int, count:int, base:int) -> int:
+    if count <= _DECIMAL_LEAF_DIGITS:
+        return int(notated[start:start + count][::-1], base)
+
+    half = 1 << ((count - 1).bit_length() - 1)
+    high = _combine_ascii(notated, start + half, count - half, base)
+    return (high * power(base, half)) + _combine_ascii(notated, start, half, base)
+
+
+def digits_to_int(digits:Sequence[int], base:int) -> int:
+    """
+    `digits_to_int`
+
+    The inverse of `int_to_digits`, combines a sequence of digits into a single intiger.
+
+    Arguments:
+        digits -- The digit values, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The value of the digits.
+    """
+    if len(digits) == 0:
+        return 0
+    if base == 1:
+        return sum(digits)
+    if base < -1:
+        radix = -base
+        offset = _negative_base_offset(radix, len(digits))
+        if is_power_of_two(radix):
+            return (digits_to_int(digits, radix) ^ offset) - offset
+        complemented = new_digit_array(radix)
+        complemented.extend(digits)
+        _complement_odd_digits(complemented, radix)
+        return digits_to_int(complemented, radix) - offset
+
+    packed = None
+    if isinstance(digits, (bytes, bytearray)):
+        packed = bytes(digits)
+    elif isinstance(digits, array) and digits.typecode == "B":
+        packed = digits.tobytes()
+
+    if packed is not None:
+        if base == 256:
+            return int.from_bytes(packed, "little")
+        if base <= len(_ASCII_SYMBOLS):
+            notated = packed.translate(_TO_ASCII)
+            if is_power_of_two(base):
+                return int(notated[::-1], base)
+            return _combine_ascii(notated, 0, len(notated), base)
+
+    if is_power_of_two(base):
+        width = base.bit_length() - 1
+        return int("".join(format(d, f"0{width}b") for d in reversed(digits)), 2)
+
+    return _combine_digits(digits, 0, len(digits), base)
+
+
+def reverse_int_digits(value:int, base:int, length:int = 0) -> int:
+    """
+    `reverse_int_digits`
+
+    Reverses the order of the digits of the given value,
+    the same as notating it, reversing the notation and reading it back (keeping the sign).
+    Trailing zeros become leading zeros, and so are dropped.
+
+    Bases that are powers of two and fit evenly into a byte are reversed a byte at a time,
+    while other bases are reversed through their digits.
+
+    Arguments:
+        value -- The value to reverse the digits of.
+        base -- The base of the digits.
+
+    Keyword Arguments:
+        length -- Treats the value as having at least the given amount of digits,
+            so that its leading zeros become trailing zeros when reversed. Defaults to 0.
+
+    Returns:
+        The value of the reversed digits.
+    """
+    if base == 1:
+        return value
+    if base < -1:
+        digits = int_to_digits(value, base, length)
+        digits.reverse()
+        return digits_to_int(digits, base)
+
+    sign = -1 if value < 0 else 1
+    value = abs(value)
+    count = max(int_digit_length(value, base), length)
+    width = base.bit_length() - 1
+    if is_power_of_two(base) and width in _REVERSIBLE_WIDTHS:
+        size = -(-(count * width) // 8)
+        packed = value.to_bytes(size, "little").translate(_reversed_bytes(width))
+        # the padding up to a whole byte ends up below the reversed digits
+        return sign * (int.from_bytes(packed, "big") >> ((size * 8) - (count * width)))
+
+    digits = int_to_digits(value, base, count)
+    digits.reverse()
+    return sign * digits_to_int(digits, base)
+
+
+def repunit(base:int, length:int) -> int:
+    """
+    `repunit`
+
+    Finds the value with the given amount of digits that are all `1`,
+    so that any run of a single repeated digit is that digit multiplied by a repunit.
+
+    Arguments:
+        base -- The base of the digits, must not be 1.
+        length -- The amount of digits.
+
+    Returns:
+        The value of `length` digits of `1`, `(base ** length - 1) // (base - 1)`.
+    """
+    return (power(base, length) - 1) // (base - 1)
+
+
+def counted_digits_to_int(counted:Iterable[Tuple[int, int]], base:int) -> int:
+    """
+    `counted_digits_to_int`
+
+    Combines runs of repeated digits into a single intiger,
+    using a single multiplication per run rather than one per digit.
+
+    Arguments:
+        counted -- Pairs of a digit value and the amount of times it is repeated,
+            starting at the greatest place value.
+        base -- The base of the digits, must not be 1.
+
+    Returns:
+        The value of the digits.
+    """
+    value = 0
+    for digit, count in counted:
+        if count > 0:
+            value = (value * power(base, count)) + (digit * repunit(base, count))
+    return value
+
+
+def regroup_digits(digits:Sequence[int], base:int, new_base:int) -> DigitArray:
+    """
+    `regroup_digits`
+
+    Converts digits between two bases where one base is an intiger power of the other,
+    by grouping (or splitting) blocks of digits rather than converting the whole value.
+
+    Arguments:
+        digits -- The digit values, starting at the units spot.
+        base -- The base of the given digits.
+        new_base -- The base to convert the digits to.
+
+    Raises:
+        ValueError: Raised when neither base is an intiger power of the other.
+
+    Returns:
+        The digits in the new base, starting at the units spot, without any leading zeros.
+    """
+    regrouped = new_digit_array(new_base)
+
+    if new_base == base:
+        regrouped.extend(digits)
+    elif integer_log(new_base, base) is not None:
+        size = cast(int, integer_log(new_base, base))
+        digits = list(digits) + ([0] * (-len(digits) % size))
+        places = tuple(base ** i for i in range(size))
+        blocks = zip(*(digits[i::size] for i in range(size)))
+        regrouped.extend(sum(d * p for d, p in zip(block, places)) for block in blocks)
+    elif integer_log(base, new_base) is not None:
+        size = cast(int, integer_log(base, new_base))
+        blocks = {}
+        for d in digits:
+            if d not in blocks:
+                blocks[d] = int_to_digits(d, new_base, size)
+            regrouped.extend(blocks[d])
+    else:
+        raise ValueError(f"Neither base {base} nor {new_base} is a power of the other")
+
+    while len(regrouped) != 0 and regrouped[-1] == 0:
+        regrouped.pop()
+    return regrouped
+
+
+def _integer_root(value:int, degree:int) -> int:
+    root = 1 << -(-value.bit_length() // degree)
+    while True:
+        estimate = (((degree - 1) * root) + (value // (root ** (degree - 1)))) // degree
+        if estimate >= root:
+            return root
+        root = estimate
+
+
+def base_root(base:int) -> Tuple[int, int]:
+    """
+    `base_root`
+
+    Finds the smallest base that the given base is an intiger power of.
+
+    Arguments:
+        base -- The base to find the root of. Must be at least 2.
+
+    Returns:
+        A tuple of the root and the exponent, where `root ** exponent == base`.
+    """
+    for degree in range(base.bit_length(), 1, -1):
+        root = _integer_root(base, degree)
+        if root > 1 and root ** degree == base:
+            return (root, degree)
+    return (base, 1)
+
+
+def _split_bytes(packed:bytes, width:int) -> DigitArray:
+    # splits each byte into `8 // width` digits, using a translation table per digit
+    digits = bytearray(len(packed) * (8 // width))
+    mask = (1 << width) - 1
+    for i in range(8 // width):
+        table = bytes(((b >> (i * width)) & mask) for b in range(256))
+        digits[i::8 // width] = packed.translate(table)
+    return array("B", digits)
+
+
+def _binary_digits_many(value:int, bases:Iterable[int]) -> Dict[int, DigitArray]:
+    # all the power of two bases are found from the same little endian byte dump of the value
+    packed = value.to_bytes(-(-value.bit_length() // 8), "little")
+    results = {}
+    bits:Optional[DigitArray] = None
+    for base in bases:
+        width = base.bit_length() - 1
+        digits:DigitArray
+        if width in (1, 2, 4):
+            digits = _split_bytes(packed, width)
+        elif width == 8:
+            digits = array("B", packed)
+        elif width in (16, 32, 64) and digit_typecode(base) is not None:
+            digits = new_digit_array(base)
+            size = cast(array, digits).itemsize
+            cast(array, digits).frombytes(packed + bytes(-len(packed) % size))
+            if byteorder != "little":
+                cast(array, digits).byteswap()
+        else:
+            if bits is None:
+                bits = _split_bytes(packed, 1)
+            digits = regroup_digits(bits, 2, base)
+        while len(digits) != 0 and digits[-1] == 0:
+            digits.pop()
+        results[base] = digits
+    return results
+
+
+def digits_many(value:int, bases:Iterable[int]) -> Dict[int, DigitArray]:
+    """
+    `digits_many`
+
+    Finds the digits of the absolute value of the given intiger in several bases at once,
+    sharing as much of the work between the bases as possible.
+    All power of two bases are found from a single binary dump of the value,
+    and bases that are powers of a common root (ie. 3, 9 and 27, or 10 and 1000)
+    are regrouped from a single conversion in that root.
+
+    Arguments:
+        value -- The value to find the digits of.
+        bases -- The bases to find the digits in.
+
+    Returns:
+        A `dict` of each base to the digits of the value in that base, starting at the units spot.
+    """
+    value = abs(value)
+    results:Dict[int, DigitArray] = {}
+    binary:List[int] = []
+    roots:Dict[int, List[int]] = {}
+
+    for base in bases:
+        if base in results or base in binary:
+            continue
+        if base < 2:
+            results[base] = int_to_digits(value, base)
+        elif is_power_of_two(base):
+            binary.append(base)
+        else:
+            roots.setdefault(base_root(base)[0], []).append(base)
+
+    results.update(_binary_digits_many(value, binary))
+
+    for root, members in roots.items():
+        exponents = [cast(int, integer_log(base, root)) for base in members]
+        shared_exponent = exponents[0]
+        for exponent in exponents[1:]:
+            shared_exponent = gcd(shared_exponent, exponent)
+        shared_base = root ** shared_exponent
+        shared = int_to_digits(value, shared_base)
+        for base in members:
+            if base == shared_base:
+                results[base] = shared
+            else:
+                results[base] = regroup_digits(shared, shared_base, base)
+
+    return results
+
+
+def notate_many(value:int,
+                bases:Iterable[int],
+                formats:Union[None, NotationFormat, Iterable[Optional[NotationFormat]]] = None
+                ) -> Dict[int, str]:
+    """
+    `notate_many`
+
+    Notates the given intiger in several bases at once,
+    sharing the digit conversion work between bases as `digits_many` does.
+
+    Arguments:
+        value -- The value to notate.
+        bases -- The bases to notate the value in.
+
+    Keyword Arguments:
+        formats -- The notation format to use for every base, or an iterable of formats
+            matching each of the given bases. `None` will use `DEFAULT_FORMAT`. Defaults to `None`.
+
+    Returns:
+        A `dict` of each base to the notation of the value in that base.
+    """
+    bases = tuple(bases)
+    if formats is None or isinstance(formats, NotationFormat):
+        formats = (formats, ) * len(bases)
+    notation_formats = {}
+    for base, notation_format in zip(bases, formats):
+        notation_formats[base] = DEFAULT_FORMAT if notation_format is None else notation_format
+
+    sign = (value > 0) - (value < 0)
+    return {base : notation_formats[base].notate_digits(digits, sign)
+            for base, digits in digits_many(value, bases).items()}
@@ -0,0 +1,316 @@
+"""
+digitwise
+
+Holds the carry-less digit-wise arithmetic functions used in the `digint` module,
+the base-N generalisations of the bitwise opperations.
+
+Instead of working through the digits one at a time,
+the digits of each value are packed into fixed width lanes of a single intiger,
+each lane wide enough to hold any digit plus one guard bit.
+Every lane is then worked on at once with a handful of whole intiger opperations,
+where the guard bits stop any lane from carrying or borrowing into the next.
+"""
+
+from array import array
+from itertools import zip_longest
+from re import finditer
+from sys import byteorder
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import DigitArray, new_digit_array
+
+
+# lane widths (in bits) mapped to a matching array typecode
+_LANE_TYPECODES:Dict[int, str] = {array(t).itemsize * 8 : t for t in "QLIHB"}
+
+
+def _lane_width(base:int) -> Optional[int]:
+    for width in sorted(_LANE_TYPECODES):
+        if base <= (1 << (width - 1)):
+            return width
+    return None
+
+
+def _pack(digits:Sequence[int], count:int, width:int) -> int:
+    typecode = _LANE_TYPECODES[width]
+    if not isinstance(digits, array) or digits.typecode != typecode:
+        digits = array(typecode, digits)
+    if byteorder != "little":
+        digits = array(typecode, digits)
+        digits.byteswap()
+    packed = digits.tobytes() + bytes((count - len(digits)) * (width // 8))
+    return int.from_bytes(packed, "little")
+
+
+def _unpack(packed:int, count:int, width:int, base:int) -> DigitArray:
+    lanes = array(_LANE_TYPECODES[width])
+    lanes.frombytes(packed.to_bytes(count * (width // 8), "little"))
+    if byteorder != "little":
+        lanes.byteswap()
+    digits = new_digit_array(base)
+    if isinstance(digits, array) and digits.typecode == lanes.typecode:
+        return lanes
+    digits.extend(iter(lanes))
+    return digits
+
+
+def _lane_constants(count:int, width:int) -> Tuple[int, int]:
+    # a 1 in the lowest bit of every lane, and a 1 in the guard (highest) bit of every lane
+    ones = ((1 << (width * count)) - 1) // ((1 << width) - 1)
+    return (ones, ones << (width - 1))
+
+
+def _reduce_lanes(packed:int, base:int, count:int, width:int) -> int:
+    # subtracts the base from every lane holding a value in `[base, 2 * base)`
+    ones, guards = _lane_constants(count, width)
+    shifted = packed + (ones * ((1 << (width - 1)) - base))
+    overflowed = (shifted & guards) >> (width - 1)
+    return packed - (overflowed * base)
+
+
+def _compare_lanes(a:int, b:int, count:int, width:int) -> int:
+    # a full lane mask for every lane where `a` is greater than or equal to `b`
+    guards = _lane_constants(count, width)[1]
+    greater_equal = ((a + guards - b) & guards) >> (width - 1)
+    return greater_equal * ((1 << width) - 1)
+
+
+def digitwise_add(a:Sequence[int], b:Sequence[int], base:int) -> DigitArray:
+    """
+    `digitwise_add`
+
+    Adds each digit of `b` to the digit in the same place in `a`, modulo the base,
+    without carrying to the next digit.
+    The base-N generalisation of `xor`, also known as the nim-sum.
+
+    Arguments:
+        a -- The first digits, starting at the units spot.
+        b -- The second digits, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The resulting digits, starting at the units spot.
+        As long as the longest of the given digits.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        digits = new_digit_array(base)
+        digits.extend((x + y) % base for x, y in zip_longest(a, b, fillvalue=0))
+        return digits
+    packed = _pack(a, count, width) + _pack(b, count, width)
+    return _unpack(_reduce_lanes(packed, base, count, width), count, width, base)
+
+
+def digitwise_sub(a:Sequence[int], b:Sequence[int], base:int) -> DigitArray:
+    """
+    `digitwise_sub`
+
+    Subtracts each digit of `b` from the digit in the same place in `a`, modulo the base,
+    without borrowing from the next digit.
+    The inverse of `digitwise_add`.
+
+    Arguments:
+        a -- The digits to subtract from, starting at the units spot.
+        b -- The digits to subtract, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The resulting digits, starting at the units spot.
+        As long as the longest of the given digits.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        digits = new_digit_array(base)
+        digits.extend((x - y) % base for x, y in zip_longest(a, b, fillvalue=0))
+        return digits
+    ones = _lane_constants(count, width)[0]
+    packed = _pack(a, count, width) + ((ones * base) - _pack(b, count, width))
+    return _unpack(_reduce_lanes(packed, base, count, width), count, width, base)
+
+
+def digitwise_min(a:Sequence[int], b:Sequence[int], base:int) -> DigitArray:
+    """
+    `digitwise_min`
+
+    Takes the smaller of the digits in each place of `a` and `b`.
+    The base-N generalisation of `and`.
+
+    Arguments:
+        a -- The first digits, starting at the units spot.
+        b -- The second digits, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The resulting digits, starting at the units spot.
+        As long as the longest of the given digits.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        digits = new_digit_array(base)
+        digits.extend(min(x, y) for x, y in zip_longest(a, b, fillvalue=0))
+        return digits
+    packed_a = _pack(a, count, width)
+    packed_b = _pack(b, count, width)
+    mask = _compare_lanes(packed_a, packed_b, count, width)
+    packed = (packed_b & mask) | (packed_a - (packed_a & mask))
+    return _unpack(packed, count, width, base)
+
+
+def digitwise_max(a:Sequence[int], b:Sequence[int], base:int) -> DigitArray:
+    """
+    `digitwise_max`
+
+    Takes the larger of the digits in each place of `a` and `b`.
+    The base-N generalisation of `or`.
+
+    Arguments:
+        a -- The first digits, starting at the units spot.
+        b -- The second digits, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The resulting digits, starting at the units spot.
+        As long as the longest of the given digits.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        digits = new_digit_array(base)
+        digits.extend(max(x, y) for x, y in zip_longest(a, b, fillvalue=0))
+        return digits
+    packed_a = _pack(a, count, width)
+    packed_b = _pack(b, count, width)
+    mask = _compare_lanes(packed_a, packed_b, count, width)
+    packed = (packed_a & mask) | (packed_b - (packed_b & mask))
+    return _unpack(packed, count, width, base)
+
+
+def digitwise_mul(a:Sequence[int], scalar:int, base:int) -> DigitArray:
+    """
+    `digitwise_mul`
+
+    Multiplies each digit of `a` by the given scalar, modulo the base,
+    without carrying to the next digit.
+
+    Arguments:
+        a -- The digits, starting at the units spot.
+        scalar -- The value to multiply each digit by.
+        base -- The base of the digits.
+
+    Returns:
+        The resulting digits, starting at the units spot.
+    """
+    scalar %= base
+    if isinstance(a, array) and a.typecode == "B" and base <= 256:
+        table = bytes((d * scalar) % base for d in range(256))
+        return array("B", a.tobytes().translate(table))
+
+    digits = new_digit_array(base)
+    if base <= (1 << 16):
+        table = [(d * scalar) % base for d in range(base)]
+        digits.extend(map(table.__getitem__, a))
+    else:
+        digits.extend((d * scalar) % base for d in a)
+    return digits
+
+
+def _differing_lanes(a:int, b:int, count:int, width:int) -> int:
+    # a 1 in the lowest bit of every lane where `a` and `b` differ
+    differing = a ^ b
+    folded = differing
+    for shift in range(1, width):
+        folded |= differing >> shift
+    return folded & _lane_constants(count, width)[0]
+
+
+def _lane_runs(lanes:int, width:int) -> Tuple[slice, ...]:
+    indicators = format(lanes, "b")[::-1][::width]
+    return tuple(slice(m.start(), m.end(), 1) for m in finditer("1+", indicators))
+
+
+def lane_distance(a:int, b:int, width:int) -> int:
+    """
+    `lane_distance`
+
+    Counts the lanes that differ between two intigers
+    split into lanes (digits) of the given amount of bits.
+
+    Arguments:
+        a -- The first intiger, must not be negative.
+        b -- The second intiger, must not be negative.
+        width -- The amount of bits in each lane.
+
+    Returns:
+        The amount of differing lanes.
+    """
+    count = -(-max(a.bit_length(), b.bit_length()) // width)
+    return bin(_differing_lanes(a, b, count, width)).count("1")
+
+
+def lane_diff(a:int, b:int, width:int) -> Tuple[slice, ...]:
+    """
+    `lane_diff`
+
+    Finds the runs of lanes that differ between two intigers
+    split into lanes (digits) of the given amount of bits.
+
+    Arguments:
+        a -- The first intiger, must not be negative.
+        b -- The second intiger, must not be negative.
+        width -- The amount of bits in each lane.
+
+    Returns:
+        A tuple of slices (each with a `step` of 1) of the differing lane indexes.
+    """
+    count = -(-max(a.bit_length(), b.bit_length()) // width)
+    return _lane_runs(_differing_lanes(a, b, count, width), width)
+
+
+def digitwise_distance(a:Sequence[int], b:Sequence[int], base:int) -> int:
+    """
+    `digitwise_distance`
+
+    The digit-wise Hamming distance, counts the places where the digits of `a` and `b` differ.
+    The shorter of the digits is treated as having leading zeros.
+
+    Arguments:
+        a -- The first digits, starting at the units spot.
+        b -- The second digits, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The amount of differing digits.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        return sum(x != y for x, y in zip_longest(a, b, fillvalue=0))
+    packed = _differing_lanes(_pack(a, count, width), _pack(b, count, width), count, width)
+    return bin(packed).count("1")
+
+
+def digitwise_diff(a:Sequence[int], b:Sequence[int], base:int) -> Tuple[slice, ...]:
+    """
+    `digitwise_diff`
+
+    Finds the runs of places where the digits of `a` and `b` differ.
+    The shorter of the digits is treated as having leading zeros.
+
+    Arguments:
+        a -- The first digits, starting at the units spot.
+        b -- The second digits, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        A tuple of slices (each with a `step` of 1) of the differing digit indexes,
+        in the same form as `tools.iter_to_slices`.
+    """
+    count = max(len(a), len(b))
+    width = _lane_width(base)
+    if width is None:
+        indicators = "".join("1" if x != y else "0" for x, y in zip_longest(a, b, fillvalue=0))
+        return tuple(slice(m.start(), m.end(), 1) for m in finditer("1+", indicators))
+    packed = _differing_lanes(_pack(a, count, width), _pack(b, count, width), count, width)
+    return _lane_runs(packed, width)
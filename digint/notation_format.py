@@ -1,21 +1,34 @@
 """
 notation_format
 
-Defines the `NotationFromat` type, a dataclass that holds key information about notating numbers.
+Defines the `NotationFromat` type, a record that holds key information about notating numbers.
 Also provides a pre defined `DEFAULT_FORMAT`, a common notation formating.
 """
 
-from dataclasses import FrozenInstanceError, dataclass, asdict
-from string import digits, ascii_uppercase, ascii_lowercase
+from array import array
 from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .errors import NotationError
+
+
+# the fields of a notation format, in the order they are compared, hashed, represented and pickled
+_FIELDS:Tuple[str, ...] = ("value_symbols",
+                           "undefined_symbol",
+                           "positive_symbol",
+                           "negative_symbol",
+                           "radix_point_symbol",
+                           "group_split_symbol",
+                           "group_split_count",
+                           "implicit_positive",
+                           "implicit_negative")
 
 
-@dataclass(init=False)
 class NotationFormat(SequenceABC, HashableABC):
     """
     `NotationFormat`
 
-    A dataclass that holds common notation formating information.
+    A record that holds common notation formating information.
+    Compared, hashed and represented by its fields like a dataclass,
+    without importing `dataclasses` (which is slow to import) to do so.
     """
 
     value_symbols:Tuple[str, ...] = tuple()
@@ -51,10 +64,27 @@ class NotationFormat(SequenceABC, HashableABC):
         self.implicit_positive:bool = implicit_positive
         self.implicit_negative:bool = implicit_negative
 
+        # maps each byte sized digit value to its symbol, for use with `str.translate`
+        self.__symbol_table:Dict[int, str] = dict(enumerate(value_symbols[:256]))
+        if undefined_symbol is not None:
+            for i in range(len(self.__symbol_table), 256):
+                self.__symbol_table[i] = undefined_symbol
+
+        # maps each symbol to its value (the first, when a symbol is repeated), for parsing
+        # along with the same for `str.translate` when every symbol is a single byte sized value
+        self.__values:Dict[str, int] = {}
+        for value, symbol in enumerate(value_symbols):
+            self.__values.setdefault(symbol, value)
+        self.__value_table:Optional[Dict[int, str]] = None
+        if len(value_symbols) <= 256 and all(len(symbol) == 1 for symbol in value_symbols):
+            self.__value_table = {ord(symbol) : chr(value)
+                                  for symbol, value in self.__values.items()}
+
         self.__frozen = True
 
     def __setattribute__(self, name: str, value: Any):
         if self.__frozen:
+            from dataclasses import FrozenInstanceError # pylint:disable=import-outside-toplevel
             raise FrozenInstanceError(value, name, self)
         return super().__setattr__(name, value)
 
@@ -120,6 +150,133 @@ class NotationFormat(SequenceABC, HashableABC):
         else:
             return self.value_symbols[index]
 
+    def notate_digits(self, digit_values:Sequence[int], sign:int = 1) -> str:
+        """
+        `notate_digits`
+
+        Notates a sequence of digit values using this format.
+        Digits stored as bytes (or in a byte sized `array`)
+        are notated in bulk instead of one digit at a time.
+
+        Arguments:
+            `digit_values` -- The digit values, starting at the units spot.
+                When empty, the value is notated as a single 0 digit.
+
+        Keyword Arguments:
+            `sign` -- The sign of the value being notated, `-1`, `0` or `1`. Defaults to 1.
+
+        Raises:
+            NotationError: Raised when a needed sign symbol is not set,
+                or when a digit has no symbol in this format.
+
+        Returns:
+            The final notation of the digits.
+        """
+        relevant_sign = ""
+        if sign < 0 and not self.implicit_negative:
+            if self.negative_symbol is None:
+                raise NotationError("Explicit negative values require a negative symbol")
+            relevant_sign = self.negative_symbol
+        elif sign > 0 and not self.implicit_positive:
+            if self.positive_symbol is None:
+                raise NotationError("Explicit positive values require a positive symbol")
+            relevant_sign = self.positive_symbol
+
+        if len(digit_values) == 0:
+            digit_values = (0, )
+
+        packed:Optional[bytes] = None
+        if isinstance(digit_values, (bytes, bytearray)):
+            packed = bytes(digit_values)
+        elif isinstance(digit_values, array) and digit_values.typecode == "B":
+            packed = digit_values.tobytes()
+
+        notated:Union[str, List[str]]
+        if packed is not None:
+            largest = max(packed)
+            if largest not in self.__symbol_table:
+                raise NotationError(
+                    f"Could not find digit for {largest} in current notation format"
+                )
+            notated = packed[::-1].decode("latin-1")
+        else:
+            notated = []
+            for value in reversed(digit_values):
+                symbol = self.get_digit(value)
+                if symbol is None:
+                    raise NotationError(
+                        f"Could not find digit for {value} in current notation format"
+                    )
+                notated.append(symbol)
+
+        group_joint = "" if self.group_split_symbol is None else self.group_split_symbol
+        group_count = self.group_split_count
+        if group_joint != "" and group_count > 0:
+            first = (len(notated) % group_count) or group_count
+            starts = [0] + list(range(first, len(notated), group_count))
+        else:
+            starts = [0]
+        spans = zip(starts, starts[1:] + [len(notated)])
+
+        if isinstance(notated, str):
+            table = self.__symbol_table
+            return relevant_sign + group_joint.join(notated[i:j].translate(table) for i, j in spans)
+        return relevant_sign + group_joint.join("".join(notated[i:j]) for i, j in spans)
+
+    def parse_digits(self, notated:str) -> Tuple[Sequence[int], int]:
+        """
+        `parse_digits`
+
+        The inverse of `notate_digits`,
+        reads the digit values and sign of a notation in this format.
+        Notations of single character symbols are read in bulk instead of one symbol at a time.
+
+        Arguments:
+            `notated` -- The notation to read, optionally starting with a sign symbol,
+                and optionally split into groups.
+
+        Raises:
+            NotationError: Raised when the notation has no digits,
+                or holds a symbol that is not in this format.
+
+        Returns:
+            The digit values, starting at the units spot,
+            and the sign of the notation (`-1` or `1`, where unsigned notations are positive).
+        """
+        sign = 1
+        if self.negative_symbol and notated.startswith(self.negative_symbol):
+            sign = -1
+            notated = notated[len(self.negative_symbol):]
+        elif self.positive_symbol and notated.startswith(self.positive_symbol):
+            notated = notated[len(self.positive_symbol):]
+
+        if self.group_split_symbol:
+            notated = notated.replace(self.group_split_symbol, "")
+
+        if len(notated) == 0:
+            raise NotationError("Cannot parse a notation without any digits")
+
+        if self.__value_table is not None:
+            unknown = set(notated).difference(self.__values)
+            if len(unknown) != 0:
+                raise NotationError(f"Given symbol '{min(unknown)}' not found in notation format")
+            return (notated.translate(self.__value_table).encode("latin-1")[::-1], sign)
+
+        # symbols of several characters are matched longest first
+        lengths = sorted(set(len(symbol) for symbol in self.__values), reverse=True)
+        digits:List[int] = []
+        i = len(notated)
+        while i > 0:
+            for length in lengths:
+                value = self.__values.get(notated[max(i - length, 0):i])
+                if value is not None:
+                    digits.append(value)
+                    i -= length
+                    break
+            else:
+                raise NotationError(f"Given symbol '{notated[i - 1]}' not found in notation format")
+        return (digits, sign)
+
     def __len__(self):
         return len(self.value_symbols)
 
@@ -149,11 +306,43 @@ class NotationFormat(SequenceABC, HashableABC):
     __copy__ = copy
     __deepcopy__ = copy
 
+    def _fields(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in _FIELDS)
+
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        # the formats held by this module are pickled by reference, so they are never duplicated
+        for name in _SHARED_FORMATS:
+            if globals().get(name) is self:
+                return name
+        return (_unpickle_format, (self._fields(), ))
+
     def __hash__(self) -> int:
-        return hash(asdict(self))
+        return hash(self._fields())
+
+    def __eq__(self, other:object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == cast(NotationFormat, other)._fields()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _FIELDS)
+        return f"{type(self).__qualname__}({fields})"
 
 
-DEFAULT_DIGIT_SYMBOLS:LiteralString = digits + ascii_uppercase + ascii_lowercase
+# the names of the formats held by this module, which are pickled by reference
+_SHARED_FORMATS:Tuple[str, ...] = ("DEFAULT_FORMAT", )
+
+
+def _unpickle_format(fields:Tuple[Any, ...]) -> NotationFormat:
+    value_symbols, *options = fields
+    return NotationFormat(*value_symbols, **dict(zip(_FIELDS[1:], options)))
+
+
+# the same as `string.digits + string.ascii_uppercase + string.ascii_lowercase`,
+# without importing `string` (which compiles a regular expression when imported)
+DEFAULT_DIGIT_SYMBOLS:LiteralString = "0123456789" \
+                                      "ABCDEFGHIJKLMNOPQRSTUVWXYZ" \
+                                      "abcdefghijklmnopqrstuvwxyz"
 DEFAULT_FORMAT:NotationFormat = NotationFormat(*tuple(DEFAULT_DIGIT_SYMBOLS),
                                                undefined_symbol = "?",
                                                negative_symbol = "-",
@@ -161,3 +350,71 @@ DEFAULT_FORMAT:NotationFormat = NotationFormat(*tuple(DEFAULT_DIGIT_SYMBOLS),
                                                radix_point_symbol = ".",
                                                implicit_positive = True
                                                )
+
+
+FORMATS:Dict[str, NotationFormat] = {"default" : DEFAULT_FORMAT}
+""" The registered notation formats, by name. """
+
+
+def register_format(name:str,
+                    notation_format:NotationFormat,
+                    replace:bool = False
+                    ) -> NotationFormat:
+    """
+    `register_format`
+
+    Registers a notation format under a name, so it can be looked up with `get_format`
+    (ie. so that it can be referred to by name when working across processes).
+
+    Arguments:
+        name -- The name of the format.
+        notation_format -- The format to register.
+
+    Keyword Arguments:
+        replace -- When true, replaces any format already registered under the name.
+            Defaults to False.
+
+    Raises:
+        ValueError: Raised when a format is already registered under the name.
+
+    Returns:
+        The registered format.
+    """
+    if name in FORMATS and not replace:
+        raise ValueError("A notation format is already registered under this name", name)
+    FORMATS[name] = notation_format
+    return notation_format
+
+
+def get_format(name:str) -> NotationFormat:
+    """
+    `get_format`
+
+    Arguments:
+        name -- The name of the format.
+
+    Raises:
+        ValueError: Raised when no format is registered under the name.
+
+    Returns:
+        The notation format registered under the name.
+    """
+    if name not in FORMATS:
+        raise ValueError("No notation format is registered under this name", name)
+    return FORMATS[name]
+
+
+def format_name(notation_format:NotationFormat) -> Optional[str]:
+    """
+    `format_name`
+
+    Arguments:
+        notation_format -- The format to find the name of.
+
+    Returns:
+        The name the exact format is registered under, or `None` when it is not registered.
+    """
+    for name, registered in FORMATS.items():
+        if registered is notation_format:
+            return name
+    return None
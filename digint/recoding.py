@@ -0,0 +1,227 @@
+"""
+recoding
+
+Holds the signed digit recodings used in the `digint` module,
+such as the non-adjacent form (NAF), the width-w non-adjacent form (wNAF)
+and balanced digits (ie. balanced ternary), along with the reconstruction of their values.
+
+Each recoding is found with a handful of whole intiger opperations, rather than digit by digit.
+The non-adjacent form is read directly from the bits of `3 * value` and `value`,
+the width-w non-adjacent form only stops at its non-zero digits,
+and balanced digits are the regular digits of the value offset by the largest digit in every place.
+"""
+
+from array import array
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .conversion import DigitArray, int_to_digits, digits_to_int, int_digit_length
+from .conversion import power, repunit
+
+
+# signed typecodes, paired with the largest magnitude they can hold
+_SIGNED_TYPECODES:Tuple[Tuple[str, int], ...] = tuple(
+    (t, (1 << (array(t).itemsize * 8 - 1)) - 1) for t in "bhilq"
+)
+# the amount of digits at which signed digits are no longer split, and are combined one at a time
+_LEAF_DIGITS:int = 64
+_SIGNED_BYTES:bytes = bytes.maketrans(bytes((144, 145, 146)), bytes((0, 1, 255)))
+# for each bit, a table mapping bytes to the ascii digit of that bit
+_BIT_PLANES:Tuple[bytes, ...] = tuple(
+    bytes(((d >> plane) & 1) + 48 for d in range(256)) for plane in range(8)
+)
+
+
+def _signed_digit_array(largest:int, length:int = 0) -> DigitArray:
+    for typecode, limit in _SIGNED_TYPECODES:
+        if largest <= limit:
+            digits = array(typecode)
+            digits.frombytes(bytes(length * digits.itemsize))
+            return digits
+    return [0] * length
+
+
+def naf(value:int) -> DigitArray:
+    """
+    `naf`
+
+    Finds the non-adjacent form of the given value,
+    the base 2 signed digit representation (using `-1`, `0` and `1`)
+    where no two adjacent digits are non-zero.
+    This has the fewest non-zero digits of any base 2 signed digit representation.
+
+    Arguments:
+        value -- The value to recode.
+
+    Returns:
+        A compact sequence of the signed digit values, starting at the units spot.
+    """
+    magnitude = abs(value)
+    tripled = magnitude * 3
+    positive = (tripled & ~magnitude) >> 1
+    negative = (~tripled & magnitude) >> 1
+    if value < 0:
+        positive, negative = negative, positive
+
+    digits = array("b")
+    length = max(positive.bit_length(), negative.bit_length())
+    if length == 0:
+        return digits
+
+    # each bit is spread into its own byte by notating it, and the ascii digits of
+    # the positive and doubled negative bits are added together without any carries
+    positive_bits = format(positive, f"0{length}b").encode("ascii")[::-1]
+    negative_bits = format(negative, f"0{length}b").encode("ascii")[::-1]
+    combined = int.from_bytes(positive_bits, "little")
+    combined += int.from_bytes(negative_bits, "little") * 2
+    digits.frombytes(combined.to_bytes(length, "little").translate(_SIGNED_BYTES))
+    return digits
+
+
+def wnaf(value:int, width:int) -> DigitArray:
+    """
+    `wnaf`
+
+    Finds the width-w non-adjacent form of the given value,
+    the base 2 signed digit representation where every non-zero digit is odd,
+    less than `2 ** (width - 1)` in magnitude,
+    and is followed by at least `width - 1` zero digits.
+    A `width` of 2 is the same as `naf`.
+
+    Arguments:
+        value -- The value to recode.
+        width -- The window width, must be at least 2.
+
+    Raises:
+        ValueError: Raised when the width is less than 2.
+
+    Returns:
+        A compact sequence of the signed digit values, starting at the units spot.
+    """
+    if width < 2:
+        raise ValueError("The window width must be at least 2", width)
+
+    sign = -1 if value < 0 else 1
+    magnitude = abs(value)
+    length = magnitude.bit_length()
+    window = 1 << width
+    digits = _signed_digit_array(window >> 1, length + 1)
+    if length == 0:
+        return digits[:0]
+
+    bits = format(magnitude, "b").encode("ascii")[::-1] + (b"0" * width)
+    index = 0
+    carry = 0
+    while True:
+        # skip straight to the next place that will hold a non-zero digit,
+        # zeros without a carry and ones with a carry both leave a zero digit
+        index = bits.find(b"1" if carry == 0 else b"0", index)
+        if index == -1 or index >= length + 1:
+            break
+        low = (int(bits[index:index + width][::-1], 2) + carry) % window
+        if low >= (window >> 1):
+            digits[index] = (low - window) * sign
+            carry = 1
+        else:
+            digits[index] = low * sign
+            carry = 0
+        index += width
+
+    while len(digits) != 0 and digits[-1] == 0:
+        digits.pop()
+    return digits
+
+
+def balanced_digits(value:int, base:int) -> DigitArray:
+    """
+    `balanced_digits`
+
+    Finds the balanced digits of the given value, such as balanced ternary,
+    where each digit is in the range `[-(base - 1) / 2, (base - 1) / 2]`.
+    Every value (positive or negative) has its own balanced digits without needing a sign.
+
+    Arguments:
+        value -- The value to recode.
+        base -- The base of the digits, must be an odd base of at least 3.
+
+    Raises:
+        ValueError: Raised when the base is not odd or is less than 3.
+
+    Returns:
+        A compact sequence of the signed digit values, starting at the units spot.
+    """
+    if base < 3 or base % 2 == 0:
+        raise ValueError("Balanced digits need an odd base of at least 3", base)
+
+    half = (base - 1) // 2
+    length = int_digit_length(value, base) + 1
+    # offsetting by the largest balanced digit in every place
+    # makes every balanced digit a regular digit
+    offset = repunit(base, length) * half
+    shifted = int_to_digits(value + offset, base, length)
+
+    if isinstance(shifted, array) and shifted.typecode == "B":
+        digits = array("b")
+        table = bytes((d - half) & 0xFF for d in range(256))
+        digits.frombytes(shifted.tobytes().translate(table))
+    else:
+        digits = _signed_digit_array(half)
+        digits.extend(d - half for d in shifted)
+
+    while len(digits) != 0 and digits[-1] == 0:
+        digits.pop()
+    return digits
+
+
+def _binary_planes(packed:bytes) -> int:
+    # the value of unsigned base 2 digits stored as bytes, combined one bit plane at a time
+    value = 0
+    for plane, table in enumerate(_BIT_PLANES):
+        notated = packed.translate(table)
+        if b"1" in notated:
+            value += int(notated[::-1], 2) << plane
+    return value
+
+
+def _combine_signed(digits:Sequence[int], start:int, count:int, base:int) -> int:
+    if count <= _LEAF_DIGITS:
+        value = 0
+        for i in range(start + count - 1, start - 1, -1):
+            value = (value * base) + digits[i]
+        return value
+
+    half = 1 << ((count - 1).bit_length() - 1)
+    high = _combine_signed(digits, start + half, count - half, base)
+    return (high * power(base, half)) + _combine_signed(digits, start, half, base)
+
+
+def signed_digits_to_int(digits:Sequence[int], base:int) -> int:
+    """
+    `signed_digits_to_int`
+
+    The inverse of the recodings, combines a sequence of signed digits into a single intiger.
+    Digits are not required to be within the base, so any recoding may be reconstructed.
+
+    Arguments:
+        digits -- The signed digit values, starting at the units spot.
+        base -- The base of the digits.
+
+    Returns:
+        The value of the digits.
+    """
+    if len(digits) == 0:
+        return 0
+
+    if isinstance(digits, array) and digits.typecode == "b":
+        packed = digits.tobytes()
+        if base == 2:
+            positive = packed.translate(bytes(d if d < 128 else 0 for d in range(256)))
+            negative = packed.translate(bytes(256 - d if d >= 128 else 0 for d in range(256)))
+            return _binary_planes(positive) - _binary_planes(negative)
+
+        half = (base - 1) // 2
+        if base <= 256 and -half <= min(digits) and max(digits) <= base - 1 - half:
+            table = bytes((d + half) & 0xFF for d in range(256))
+            shifted = array("B")
+            shifted.frombytes(packed.translate(table))
+            return digits_to_int(shifted, base) - (repunit(base, len(digits)) * half)
+
+    return _combine_signed(digits, 0, len(digits), base)
@@ -0,0 +1,268 @@
+"""
+search
+
+Holds the searches over ranges of intigers used in the `digint` module,
+for finding the values whose digits hold some property in one or more bases at once,
+such as being palindromic in both base 2 and base 10.
+
+Candidates are never converted to digits from scratch one after another.
+Palindromes are generated directly, by counting through the digits of their first half
+and adding the place values each changed digit (and its mirror) holds,
+and digit sums are kept up to date the same way as a range is counted through.
+Ranges may also be split into chunks that are searched across a pool of processes,
+with the results still returned in order as they are found.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from .tools import submit_in_order
+from .conversion import power, int_to_digits, int_digit_length, reverse_int_digits
+
+
+def _palindrome_places(base:int, length:int) -> List[int]:
+    # for each digit of the first half, starting at the middle,
+    # the place value it holds in the palindrome added to the place value of its mirror
+    half = (length + 1) // 2
+    places = []
+    for i in range(half):
+        high = power(base, (length // 2) + i)
+        low = power(base, half - 1 - i)
+        places.append(high + low if high != low else high)
+    return places
+
+
+def _first_palindrome(first:int, base:int, length:int) -> int:
+    # the palindrome of the given digit length with the given first half
+    value = first * power(base, length // 2)
+    return value + reverse_int_digits(first // power(base, length % 2), base, length // 2)
+
+
+def _palindrome_chunks(base:int, start:int, stop:int, size:int) -> Iterator[Tuple[int, int]]:
+    # splits a range into smaller ranges that each hold up to `size` palindromes,
+    # by splitting the first halves of each digit length into ranges of `size` first halves
+    length = max(int_digit_length(start, base), 1)
+    chunk_start = start
+    while chunk_start < stop:
+        half = (length + 1) // 2
+        first = max(chunk_start // power(base, length - half), power(base, half - 1))
+        if first + size >= power(base, half):
+            chunk_stop = power(base, length)
+            length += 1
+        else:
+            chunk_stop = _first_palindrome(first + size, base, length)
+        chunk_stop = min(chunk_stop, stop)
+        yield (chunk_start, chunk_stop)
+        chunk_start = chunk_stop
+
+
+def palindromes(base:int, start:int = 0, stop:Optional[int] = None) -> Iterator[int]:
+    """
+    `palindromes`
+
+    Generates every palindrome in the given base (every value whose digits read the same
+    in both directions) within a range, in increasing order.
+    The value 0, having no digits, is counted as a palindrome.
+
+    Arguments:
+        base -- The base the values are palindromes in, must be at least 2.
+
+    Keyword Arguments:
+        start -- The lowest value to generate. Defaults to 0.
+        stop -- When not `None`, values at or above this are not generated. Defaults to `None`.
+
+    Raises:
+        ValueError: Raised when the base is less than 2.
+
+    Yields:
+        The palindromes, in increasing order.
+    """
+    if base < 2:
+        raise ValueError("Invalid base", base)
+
+    start = max(start, 0)
+    if start == 0:
+        if stop is None or stop > 0:
+            yield 0
+        start = 1
+
+    top = base - 1
+    length = int_digit_length(start, base)
+    while stop is None or power(base, length - 1) < stop:
+        half = (length + 1) // 2
+        first = max(start // power(base, length - half), power(base, half - 1))
+        digits = list(int_to_digits(first, base, half))
+        value = _first_palindrome(first, base, length)
+        places = _palindrome_places(base, length)
+
+        while True:
+            if stop is not None and value >= stop:
+                return
+            if value >= start:
+                yield value
+
+            i = 0
+            while i < half and digits[i] == top:
+                digits[i] = 0
+                value -= top * places[i]
+                i += 1
+            if i == half:
+                break
+            digits[i] += 1
+            value += places[i]
+        length += 1
+
+
+def digit_sums(base:int, start:int, stop:int) -> Iterator[Tuple[int, int]]:
+    """
+    `digit_sums`
+
+    Counts through a range of values, keeping the sum of their digits up to date as it goes.
+
+    Arguments:
+        base -- The base of the digits, must be at least 2.
+        start -- The first value, must not be negative.
+        stop -- Values at or above this are not counted.
+
+    Raises:
+        ValueError: Raised when the base is less than 2, or the start is negative.
+
+    Yields:
+        Each value in the range, paired with the sum of its digits.
+    """
+    if base < 2:
+        raise ValueError("Invalid base", base)
+    if start < 0:
+        raise ValueError("The start of the range cannot be negative", start)
+
+    top = base - 1
+    digits = list(int_to_digits(start, base))
+    total = sum(digits)
+    for value in range(start, stop):
+        yield (value, total)
+        i = 0
+        while i < len(digits) and digits[i] == top:
+            digits[i] = 0
+            total -= top
+            i += 1
+        if i == len(digits):
+            digits.append(1)
+        else:
+            digits[i] += 1
+        total += 1
+
+
+def is_palindrome_in(value:int, base:int) -> bool:
+    """
+    `is_palindrome_in`
+
+    Arguments:
+        value -- The value to check.
+        base -- The base to check the digits of the value in.
+
+    Returns:
+        True if the digits of the value read the same in both directions in the given base.
+    """
+    return reverse_int_digits(value, base) == value
+
+
+def palindromic_in(value:int, bases:Iterable[int]) -> bool:
+    """
+    `palindromic_in`
+
+    Arguments:
+        value -- The value to check.
+        bases -- The bases to check the digits of the value in.
+
+    Returns:
+        True if the value is a palindrome in every one of the given bases.
+    """
+    return all(reverse_int_digits(value, base) == value for base in bases)
+
+
+def digit_sum(value:int, base:int) -> int:
+    """
+    `digit_sum`
+
+    Arguments:
+        value -- The value to sum the digits of.
+        base -- The base of the digits.
+
+    Returns:
+        The sum of the digits of the absolute value in the given base.
+    """
+    return sum(int_to_digits(value, base))
+
+
+def _search_chunk(predicate:Callable[[int], bool],
+                  start:int,
+                  stop:int,
+                  palindrome_base:Optional[int]
+                  ) -> List[int]:
+    candidates = palindromes(palindrome_base, start, stop) \
+        if palindrome_base is not None else range(start, stop)
+    return [v for v in candidates if predicate(v)]
+
+
+def search_range(predicate:Callable[[int], bool],
+                 start:int,
+                 stop:int,
+                 *,
+                 palindrome_base:Optional[int] = None,
+                 workers:Optional[int] = 1,
+                 chunk_size:int = 1 << 16
+                 ) -> Iterator[int]:
+    """
+    `search_range`
+
+    Searches a range of values for the ones that meet a condition.
+    When `palindrome_base` is given only the palindromes in that base are tested,
+    as they are generated directly rather than found by testing every value.
+
+    When searching across more than one process,
+    the range is split into chunks of `chunk_size` values which are searched separately
+    (or when only palindromes are tested, chunks of up to `chunk_size` palindromes),
+    so the predicate must be able to be pickled
+    (ie. a module level function, or a `functools.partial` of one).
+
+    Arguments:
+        predicate -- The condition each found value meets.
+        start -- The lowest value to search.
+        stop -- Values at or above this are not searched.
+
+    Keyword Arguments:
+        palindrome_base -- When not `None`, only palindromes in this base are tested.
+            Defaults to `None`.
+        workers -- The amount of processes to search with, where `None` uses one per processor.
+            Searches in the current process when 1. Defaults to 1.
+        chunk_size -- The amount of values (or palindromes) searched at once by each process.
+            Defaults to 65536.
+
+    Raises:
+        ValueError: Raised when the chunk size is less than 1.
+
+    Yields:
+        The values that meet the condition, in increasing order.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1", chunk_size)
+
+    if workers == 1:
+        candidates = palindromes(palindrome_base, start, stop) \
+            if palindrome_base is not None else range(start, stop)
+        for v in candidates:
+            if predicate(v):
+                yield v
+        return
+
+    if workers is None:
+        workers = cpu_count() or 1
+    chunks = _palindrome_chunks(palindrome_base, start, stop, chunk_size) \
+        if palindrome_base is not None \
+        else ((s, min(s + chunk_size, stop)) for s in range(start, stop, chunk_size))
+    with ProcessPoolExecutor(workers) as executor:
+        for found in submit_in_order(executor,
+                                     _search_chunk,
+                                     ((predicate, s, e, palindrome_base) for s, e in chunks),
+                                     2 * workers):
+            yield from found
@@ -0,0 +1,267 @@
+"""
+stats
+
+Holds the opt-in instrumentation of the hot paths used in the `digint` module,
+for finding which internal opperations a slow workload is spending its calls (and time) in.
+
+Nothing is instrumented until `enable` is called.
+Rather than checking whether instrumentation is enabled on every call,
+`enable` swaps counting (and optionally timing) versions in place of the hot paths themselves,
+and `disable` swaps the originals back, so instrumentation costs nothing while disabled.
+
+Counts are kept per process, and are not thread safe.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from . import conversion, tools, recoding, search, batch, aio
+from . import digint as _digint
+from .digint import PositionalBasedIntiger, ExtendedBasedIntiger
+from .userint import ExtendedUserInt
+
+COUNTS:Counter = Counter()
+"""
+`COUNTS`
+
+The amount of calls made to each instrumented hot path (and cache hits and misses)
+since instrumentation was last enabled or reset.
+"""
+
+TIMES:Dict[str, float] = {}
+"""
+`TIMES`
+
+The total seconds spent in each instrumented hot path since instrumentation was last enabled
+or reset, only kept when enabled with `timing`.
+"""
+
+# the methods instrumented on each class, keyed by the name they are counted under
+_METHODS:Tuple[Tuple[str, str], ...] = (("_get_single_digit", "get_single_digit"),
+                                        ("_mask_value_continuous", "mask_value_continuous"),
+                                        ("digit_length", "digit_length"),
+                                        ("notate", "notate"))
+
+# the functions instrumented, the module they are defined in, and every module that imports them
+_FUNCTIONS:Tuple[Tuple[str, Any, Tuple[Any, ...]], ...] = (
+    ("power", conversion, (conversion, _digint, recoding, search, batch, aio)),
+    ("split_divmod", conversion, (conversion, batch, aio)),
+    ("absindex", tools, (tools, _digint)),
+)
+
+# every swapped out attribute as `(owner, name, original)`, so they can be swapped back
+_swapped:List[Tuple[Any, str, Any]] = []
+
+# how deep each hot path currently is, so that overrides calling `super()` are only counted once
+_depth:Counter = Counter()
+
+
+def is_enabled() -> bool:
+    """
+    `is_enabled`
+
+    Returns:
+        True if instrumentation is currently enabled.
+    """
+    return len(_swapped) != 0
+
+
+def _swap(owner:Any, name:str, replacement:Any):
+    _swapped.append((owner, name, owner.__dict__[name] if isinstance(owner, type)
+                     else getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _instrumented(func:Callable, stat:str, timing:bool) -> Callable:
+    if not timing:
+        @wraps(func)
+        def counted(*args, **kwargs):
+            if _depth[stat] == 0:
+                COUNTS[stat] += 1
+            _depth[stat] += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _depth[stat] -= 1
+        return counted
+
+    @wraps(func)
+    def timed(*args, **kwargs):
+        if _depth[stat] != 0:
+            return func(*args, **kwargs)
+        COUNTS[stat] += 1
+        _depth[stat] += 1
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            TIMES[stat] = TIMES.get(stat, 0.0) + (perf_counter() - start)
+            _depth[stat] -= 1
+    return timed
+
+
+def _instrumented_power(func:Callable, timing:bool) -> Callable:
+    counted = _instrumented(func, "power", timing)
+    cache_info = getattr(func, "cache_info")
+
+    @wraps(func)
+    def cached(base:int, exponent:int) -> int:
+        hits = cache_info().hits
+        result = counted(base, exponent)
+        COUNTS["power_cache_hits" if cache_info().hits != hits
+               else "power_cache_misses"] += 1
+        return result
+    return cached
+
+
+def _instrumented_digits(func:Callable, timing:bool) -> Callable:
+    counted = _instrumented(func, "digits", timing)
+
+    @wraps(func)
+    def cached(self:PositionalBasedIntiger):
+        cache = self._digit_cache # pylint:disable=protected-access
+        hit = cache is not None and cache[0] is self.x and cache[1] == self.base
+        COUNTS["digit_cache_hits" if hit else "digit_cache_misses"] += 1
+        return counted(self)
+    return cached
+
+
+def _instrumented_x(prop:property, timing:bool) -> property:
+    setter = _instrumented(cast(Callable, prop.fset), "x_writes", timing)
+
+    # the callback is timed separately from the write itself,
+    # by swapping a timed version in for the length of the write
+    def instrumented_set(self:ExtendedUserInt, value:int):
+        callback = self.on_changed
+        if not callable(callback):
+            setter(self, value)
+            return
+        wrapped = _instrumented(callback, "on_changed", timing)
+        self.on_changed = wrapped
+        try:
+            setter(self, value)
+        finally:
+            if self.on_changed is wrapped:
+                self.on_changed = callback
+
+    return property(prop.fget, instrumented_set, prop.fdel, prop.__doc__)
+
+
+def enable(timing:bool = False):
+    """
+    `enable`
+
+    Enables instrumentation, resetting all counts and times.
+    When already enabled, the instrumentation is swapped for the given `timing`.
+
+    Keyword Arguments:
+        timing -- When True, the time spent in each hot path is also kept in `TIMES`.
+            This adds a lot more overhead than counting alone. Defaults to False.
+    """
+    if is_enabled():
+        disable()
+    reset()
+
+    for cls in (PositionalBasedIntiger, ExtendedBasedIntiger):
+        for name, stat in _METHODS:
+            if name not in cls.__dict__:
+                continue
+            original = cls.__dict__[name]
+            replacement = _instrumented(original, stat, timing)
+            # aliases (ie. `__len__` of `digit_length`) are swapped along with the method
+            for alias, value in list(cls.__dict__.items()):
+                if value is original:
+                    _swap(cls, alias, replacement)
+
+    _swap(PositionalBasedIntiger, "_digits",
+          _instrumented_digits(PositionalBasedIntiger.__dict__["_digits"], timing))
+    _swap(ExtendedUserInt, "x", _instrumented_x(ExtendedUserInt.__dict__["x"], timing))
+
+    for name, source, modules in _FUNCTIONS:
+        original = getattr(source, name)
+        replacement = _instrumented_power(original, timing) if name == "power" \
+            else _instrumented(original, name, timing)
+        for module in modules:
+            _swap(module, name, replacement)
+
+
+def disable():
+    """
+    `disable`
+
+    Disables instrumentation, swapping back the original hot paths.
+    Counts and times are kept until the next `reset` or `enable`.
+    """
+    while len(_swapped) != 0:
+        owner, name, original = _swapped.pop()
+        setattr(owner, name, original)
+    _depth.clear()
+
+
+def reset():
+    """
+    `reset`
+
+    Resets all counts and times.
+    """
+    COUNTS.clear()
+    TIMES.clear()
+
+
+@contextmanager
+def collecting(timing:bool = False) -> Iterator[Counter]:
+    """
+    `collecting`
+
+    A context manager that enables instrumentation for the length of the block,
+    disabling it afterwards.
+
+    Keyword Arguments:
+        timing -- When True, the time spent in each hot path is also kept in `TIMES`.
+            Defaults to False.
+
+    Yields:
+        `COUNTS`, which holds the counts once the block ends.
+    """
+    enable(timing)
+    try:
+        yield COUNTS
+    finally:
+        disable()
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """
+    `snapshot`
+
+    Returns:
+        A copy of the current counts and times, as `{"counts" : {...}, "seconds" : {...}}`.
+    """
+    return {"counts" : dict(sorted(COUNTS.items())), "seconds" : dict(sorted(TIMES.items()))}
+
+
+def prometheus_text(prefix:str = "digint") -> str:
+    """
+    `prometheus_text`
+
+    Formats the current counts and times in the Prometheus text exposition format.
+
+    Keyword Arguments:
+        prefix -- The prefix of the metric names. Defaults to "digint".
+
+    Returns:
+        The metrics, as `<prefix>_calls_total` and `<prefix>_seconds_total` counters
+        labeled by hot path.
+    """
+    lines = [f"# HELP {prefix}_calls_total Calls made to digint hot paths.",
+             f"# TYPE {prefix}_calls_total counter"]
+    lines.extend(f'{prefix}_calls_total{{path="{stat}"}} {count}'
+                 for stat, count in sorted(COUNTS.items()))
+    if len(TIMES) != 0:
+        lines.append(f"# HELP {prefix}_seconds_total Seconds spent in digint hot paths.")
+        lines.append(f"# TYPE {prefix}_seconds_total counter")
+        lines.extend(f'{prefix}_seconds_total{{path="{stat}"}} {seconds!r}'
+                     for stat, seconds in sorted(TIMES.items()))
+    return "\n".join(lines) + "\n"
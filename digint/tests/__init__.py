@@ -7,3 +7,13 @@ Contains all tests.
 from .digint_tests import *
 from .user_int_tests import *
 from .tools_tests import *
+from .conversion_tests import *
+from .benford_tests import *
+from .search_tests import *
+from .checkdigit_tests import *
+from .benchmarks_tests import *
+from .complexity_tests import *
+from .stats_tests import *
+from .batch_tests import *
+from .aio_tests import *
+from .main_tests import *
@@ -0,0 +1,153 @@
+"""
+aio_tests
+
+Holds test cases that specifically test the asynchronous streams defined in `aio`,
+and the `aiter_digits` and `anotate_chunks` methods that use them.
+"""
+
+import asyncio
+from time import perf_counter
+from unittest import TestCase, main
+from random import randrange
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from ..digint import digitint
+from ..aio import digit_blocks
+from ..conversion import int_to_digits, power
+from ..notation_format import NotationFormat, DEFAULT_FORMAT
+
+BASES = (1, 2, 3, 10, 16, 36, -2, -10)
+
+
+async def collect(iterator):
+    """
+    `collect`
+
+    Gathers everything given by an asynchronous iterator into a list.
+    """
+    return [x async for x in iterator]
+
+
+class AsyncStreamTests(TestCase):
+    """
+    `AsyncStreamTests`
+
+    Tests that the asynchronous digit and notation streams match their synchronous counterparts.
+    """
+
+    def test_digit_blocks(self):
+        """
+        `test_digit_blocks`
+
+        Tests that every block holds the digits of its place values, in either order.
+        """
+        for base in BASES:
+            value = randrange(0, 100) if base == 1 else randrange(-(10 ** 2000), 10 ** 2000)
+            block = randrange(1, 200)
+            expected = list(int_to_digits(value, base))
+            blocks = asyncio.run(collect(digit_blocks(value, base, block=block)))
+            self.assertTrue(all(len(b) == block for b in blocks[:-1]))
+            self.assertEqual([d for b in blocks for d in b], expected)
+            blocks = asyncio.run(collect(digit_blocks(value, base, block=block, from_msd=True)))
+            self.assertEqual([d for b in reversed(blocks) for d in b], expected)
+
+        self.assertEqual(asyncio.run(collect(digit_blocks(0, 10))), [])
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(digit_blocks(10, 10, block=0)))
+
+    def test_aiter_digits(self):
+        """
+        `test_aiter_digits`
+
+        Tests that the digits iterated asynchronously match `iter_digits`.
+        """
+        for base in BASES:
+            for _ in range(5):
+                value = randrange(-100, 100) if base == 1 \
+                    else randrange(-(10 ** randrange(1, 2000)), 10 ** 2000)
+                number = digitint(value, base)
+                at_least = randrange(0, 50)
+                digits = asyncio.run(collect(number.aiter_digits(at_least,
+                                                                 block=randrange(1, 200))))
+                self.assertEqual(digits, list(number.iter_digits(at_least)))
+
+    def test_anotate_chunks(self):
+        """
+        `test_anotate_chunks`
+
+        Tests that joining the chunks notated asynchronously matches `notate`,
+        including with formats that split digits into groups.
+        """
+        grouped = NotationFormat(*DEFAULT_FORMAT.value_symbols,
+                                 negative_symbol="-",
+                                 positive_symbol="+",
+                                 group_split_symbol="_",
+                                 group_split_count=3)
+        for base in BASES:
+            for _ in range(5):
+                value = randrange(-100, 100) if base == 1 \
+                    else randrange(-(10 ** randrange(1, 2000)), 10 ** 2000)
+                number = digitint(value, base)
+                block = randrange(1, 200)
+                chunks = asyncio.run(collect(number.anotate_chunks(block=block)))
+                self.assertEqual("".join(chunks), number.notate())
+                if base != 1:
+                    chunks = asyncio.run(collect(number.anotate_chunks(grouped, block=block)))
+                    self.assertEqual("".join(chunks), number.notate(grouped))
+
+        self.assertEqual(asyncio.run(collect(digitint(0).anotate_chunks())), ["0"])
+        self.assertEqual("".join(asyncio.run(collect(digitint(-3, 1).anotate_chunks()))), "-111")
+
+    def test_executors(self):
+        """
+        `test_executors`
+
+        Tests that the streams match when their largest steps are run in thread and process pools.
+        """
+        number = digitint(randrange(10 ** 5000), 10)
+        with ThreadPoolExecutor(2) as executor:
+            digits = asyncio.run(collect(number.aiter_digits(block=100, executor=executor)))
+            self.assertEqual(digits, list(number.iter_digits()))
+        with ProcessPoolExecutor(2) as executor:
+            chunks = asyncio.run(collect(number.anotate_chunks(block=100, executor=executor)))
+            self.assertEqual("".join(chunks), number.notate())
+
+    def test_executor_stall(self):
+        """
+        `test_executor_stall`
+
+        Tests that with a process pool, the event loop is never held up for as long as
+        finding the power of the base that the first split is made by takes.
+        """
+        value = randrange(10 ** 300000)
+        top = 64 * 4096
+
+        async def largest_stall(executor):
+            stall = 0.0
+            done = False
+
+            async def tick():
+                nonlocal stall
+                last = perf_counter()
+                while not done:
+                    await asyncio.sleep(0)
+                    now = perf_counter()
+                    stall = max(stall, now - last)
+                    last = now
+
+            ticker = asyncio.ensure_future(tick())
+            blocks = await collect(digit_blocks(value, 10, block=4096, executor=executor))
+            done = True
+            await ticker
+            return stall, blocks
+
+        power.cache_clear()
+        with ProcessPoolExecutor(1) as executor:
+            stall, blocks = asyncio.run(largest_stall(executor))
+        start = perf_counter()
+        power(10, top)
+        self.assertLess(stall, perf_counter() - start)
+        self.assertEqual([d for b in blocks for d in b], list(int_to_digits(value, 10)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+batch_tests
+
+Holds test cases that specifically test the batch conversions defined in `batch`,
+along with the notation parsing and format registry they use.
+"""
+
+from unittest import TestCase, main
+from random import randrange, choice
+from ..batch import notate_many, parse_many, parallel_int_to_digits, parallel_notate
+from ..batch import convert_many, count_digits_many
+from ..conversion import int_to_digits
+from ..digint import digitint
+from ..notation_format import NotationFormat, NotationError, DEFAULT_FORMAT
+from ..notation_format import FORMATS, register_format, get_format, format_name
+
+
+class NotationParsingTests(TestCase):
+    """
+    `NotationParsingTests`
+
+    Tests reading notations back into digits, and the registry of notation formats.
+    """
+
+    def test_parse_digits(self):
+        """
+        `test_parse_digits`
+
+        Tests that parsing a notation gives back the digits and sign it was notated from.
+        """
+        formats = (DEFAULT_FORMAT,
+                   NotationFormat(*DEFAULT_FORMAT.value_symbols,
+                                  negative_symbol="-",
+                                  positive_symbol="+",
+                                  group_split_symbol="_",
+                                  group_split_count=3),
+                   NotationFormat("zero", "one", "two", "three",
+                                  negative_symbol="~",
+                                  group_split_symbol=" ",
+                                  group_split_count=2,
+                                  implicit_positive=True))
+        for notation_format in formats:
+            for _ in range(50):
+                base = randrange(2, len(notation_format) + 1)
+                digits = [randrange(base) for _ in range(randrange(1, 40))]
+                sign = choice((-1, 1))
+                notated = notation_format.notate_digits(digits, sign)
+                parsed, parsed_sign = notation_format.parse_digits(notated)
+                self.assertEqual(list(parsed), digits)
+                self.assertEqual(parsed_sign, sign)
+
+        with self.assertRaises(NotationError):
+            DEFAULT_FORMAT.parse_digits("12#4")
+        with self.assertRaises(NotationError):
+            DEFAULT_FORMAT.parse_digits("-")
+
+    def test_registry(self):
+        """
+        `test_registry`
+
+        Tests registering and looking up notation formats by name.
+        """
+        self.assertIs(get_format("default"), DEFAULT_FORMAT)
+        self.assertEqual(format_name(DEFAULT_FORMAT), "default")
+
+        notation_format = NotationFormat("a", "b")
+        self.assertIsNone(format_name(notation_format))
+        try:
+            register_format("batch_tests", notation_format)
+            self.assertIs(get_format("batch_tests"), notation_format)
+            self.assertEqual(format_name(notation_format), "batch_tests")
+            with self.assertRaises(ValueError):
+                register_format("batch_tests", DEFAULT_FORMAT)
+            register_format("batch_tests", DEFAULT_FORMAT, replace=True)
+            self.assertIs(get_format("batch_tests"), DEFAULT_FORMAT)
+        finally:
+            FORMATS.pop("batch_tests", None)
+
+        with self.assertRaises(ValueError):
+            get_format("batch_tests")
+
+
+class BatchTests(TestCase):
+    """
+    `BatchTests`
+
+    Tests notating and parsing many intigers at once, in and out of the current process.
+    """
+
+    def test_notate_many(self):
+        """
+        `test_notate_many`
+
+        Tests that notating in a batch matches notating each value on its own.
+        """
+        for base in (1, 2, 7, 10, 16, 36, -2, -10):
+            limit = 50 if base == 1 else 10 ** 40
+            values = [randrange(-limit, limit) for _ in range(200)]
+            expected = [digitint(v, base).notate() for v in values]
+            self.assertEqual(list(notate_many(values, base, workers=1)), expected)
+            self.assertEqual(list(notate_many(iter(values), base)), expected)
+
+        # chunks of small values have their digits found together, unlike chunks holding
+        # a larger value, which are notated a value at a time
+        symbols = NotationFormat(*(f"<{i}>" for i in range(300)),
+                                 negative_symbol="-",
+                                 implicit_positive=True)
+        grouped = NotationFormat(*DEFAULT_FORMAT.value_symbols,
+                                 negative_symbol="-",
+                                 group_split_symbol=",",
+                                 group_split_count=3,
+                                 implicit_positive=True)
+        small = [0] + [randrange(-2 ** 64, 2 ** 64) for _ in range(100)]
+        for notation_format, bases in ((symbols, (3, 7, 200, 256, 300)), (grouped, (3, 7, 36))):
+            for base in bases:
+                for values in ([0, 0], small, small + [2 ** 1024]):
+                    expected = [digitint(v, base, notation_format=notation_format).notate()
+                                for v in values]
+                    self.assertEqual(list(notate_many(values, base, notation_format, workers=1)),
+                                     expected)
+
+    def test_parse_many(self):
+        """
+        `test_parse_many`
+
+        Tests that parsing a batch gives back the values it was notated from.
+        """
+        notation_format = NotationFormat(*DEFAULT_FORMAT.value_symbols,
+                                         negative_symbol="-",
+                                         group_split_symbol=",",
+                                         group_split_count=3,
+                                         implicit_positive=True)
+        for base in (1, 2, 7, 10, 16, 36, -2, -10):
+            limit = 50 if base == 1 else 10 ** 40
+            values = [randrange(0 if base == 1 else -limit, limit) for _ in range(200)]
+            notated = list(notate_many(values, base, notation_format, workers=1))
+            self.assertEqual(list(parse_many(notated, base, notation_format, workers=1)), values)
+
+        with self.assertRaises(NotationError):
+            list(parse_many(["12", "1z"], 10, workers=1))
+        # a newline within a notation must not split it into two values
+        with self.assertRaises(NotationError):
+            list(parse_many(["1\n2", "3"], 10, workers=1))
+        with self.assertRaises(ValueError):
+            parse_many([], 0)
+        with self.assertRaises(ValueError):
+            notate_many([], 10, chunk_size=0)
+
+    def test_convert_many(self):
+        """
+        `test_convert_many`
+
+        Tests that converting between bases and formats matches parsing and then notating,
+        including for values too long for the builtin conversions.
+        """
+        grouped = NotationFormat(*DEFAULT_FORMAT.value_symbols,
+                                 negative_symbol="~",
+                                 positive_symbol="+",
+                                 group_split_symbol="_",
+                                 group_split_count=4)
+        for base, new_base in ((10, 16), (16, 10), (2, 36), (7, 8), (10, -3), (36, 1)):
+            limit = 50 if new_base == 1 else 10 ** 30
+            values = [randrange(-limit, limit) for _ in range(300)]
+            if new_base != 1:
+                values.append(randrange(10 ** 5000))
+            notated = list(notate_many(values, base, workers=1))
+            converted = list(convert_many(notated, base, new_base, new_format=grouped,
+                                          workers=1, chunk_size=64))
+            self.assertEqual(converted, list(notate_many(values, new_base, grouped, workers=1)))
+            self.assertEqual(list(convert_many(converted, new_base, base, grouped, workers=1)),
+                             notated)
+
+        with self.assertRaises(NotationError):
+            list(convert_many(["12", "1 2"], 10, 16, workers=1))
+        with self.assertRaises(NotationError):
+            list(convert_many(["12", "-"], 10, 16, workers=1))
+        with self.assertRaises(ValueError):
+            convert_many([], 10, 0)
+
+    def test_count_digits_many(self):
+        """
+        `test_count_digits_many`
+
+        Tests that the counted digits match counting the digits of each value.
+        """
+        values = [randrange(-10 ** 30, 10 ** 30) for _ in range(300)] + [0, 10 ** 400]
+        notated = list(notate_many(values, 10, workers=1))
+        for count_base in (2, 7, 10, 36, 256, 300, -10):
+            total, counts, leading = count_digits_many(notated, 10, count_base=count_base,
+                                                       workers=1, chunk_size=64)
+            digits = [list(int_to_digits(v, count_base)) or [0] for v in values]
+            self.assertEqual(total, len(values))
+            self.assertEqual(sum(counts.values()), sum(len(d) for d in digits))
+            self.assertEqual(counts[0], sum(d.count(0) for d in digits))
+            self.assertEqual(counts[1], sum(d.count(1) for d in digits))
+            self.assertEqual(leading[0], sum(d[-1] == 0 for d in digits))
+            self.assertEqual(leading[1], sum(d[-1] == 1 for d in digits))
+
+    def test_process_pool(self):
+        """
+        `test_process_pool`
+
+        Tests that batches split across a pool of processes keep their order,
+        including with a notation format that was never registered.
+        """
+        notation_format = NotationFormat(*"0123456789",
+                                         negative_symbol="~",
+                                         implicit_positive=True)
+        values = [randrange(-10 ** 30, 10 ** 30) for _ in range(2000)]
+        expected = [digitint(v, 10, notation_format=notation_format).notate() for v in values]
+        notated = list(notate_many(values, 10, notation_format,
+                                   workers=2, chunk_size=100, threshold=500))
+        self.assertEqual(notated, expected)
+        self.assertEqual(list(parse_many(notated, 10, notation_format,
+                                         workers=2, chunk_size=100, threshold=500)), values)
+        converted = list(convert_many(notated, 10, 16, notation_format,
+                                      workers=2, chunk_size=100, threshold=500))
+        self.assertEqual(converted, list(notate_many(values, 16, workers=1)))
+        self.assertEqual(count_digits_many(notated, 10, notation_format,
+                                           workers=2, chunk_size=100, threshold=500),
+                         count_digits_many(notated, 10, notation_format, workers=1))
+
+    def test_parallel_int_to_digits(self):
+        """
+        `test_parallel_int_to_digits`
+
+        Tests that converting a single value across a pool of processes,
+        split into small parts, matches converting it in the current process.
+        """
+        for base in (3, 10, 36, 1000, -3, -10, 16, 1):
+            limit = 50 if base == 1 else 10 ** 3000
+            value = randrange(-limit, limit)
+            digits = parallel_int_to_digits(value, base, 10, workers=2, threshold=64)
+            self.assertEqual(list(digits), list(int_to_digits(value, base, 10)))
+            if abs(base) <= 36:
+                self.assertEqual(parallel_notate(value, base, workers=2, threshold=64),
+                                 digitint(value, base).notate())
+
+        with self.assertRaises(ValueError):
+            parallel_int_to_digits(10, 10, threshold=1)
+        with self.assertRaises(ValueError):
+            parallel_notate(10, -1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+benchmarks_tests
+
+Holds test cases that specifically test the benchmark runner defined in `benchmarks`.
+"""
+
+import json
+import subprocess
+import sys
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from ..benchmarks import CASES, run_benchmarks, results_markdown, compare_results, load_results
+from ..benchmarks import run_memory_benchmarks, memory_markdown, instance_report, traced_allocation
+from ..benchmarks import run_import_benchmark, imports_markdown
+from ..benchmarks.imports import parse_importtime
+from ..benchmarks.__main__ import main as benchmarks_main
+
+
+class BenchmarkTests(TestCase):
+    """
+    `BenchmarkTests`
+
+    Tests running, reporting and comparing benchmarks at small sizes.
+    """
+
+    def test_run(self):
+        """
+        `test_run`
+
+        Tests that every case runs (or is reported as unsupported) in every base,
+        and that the results are tabulated.
+        """
+        results = run_benchmarks(bases=(1, 10, 60), lengths=(10, ), repeat=1,
+                                 budget=0.01, minimum=0.001)
+        self.assertEqual(len(results["results"]), len(CASES) * 3)
+        for result in results["results"]:
+            if result["status"] == "ok":
+                self.assertGreater(result["seconds"], 0)
+            else:
+                self.assertTrue(result["status"].startswith("unsupported"), result)
+                self.assertNotEqual(result["base"], 10, result)
+
+        markdown = results_markdown(results)
+        self.assertTrue(markdown.startswith("# BENCHMARK"))
+        self.assertIn("| notate | 10 |", markdown)
+
+    def test_compare(self):
+        """
+        `test_compare`
+
+        Tests that results slower than the baseline by more than the threshold are flagged,
+        and that the command line writes its results and fails on regressions.
+        """
+        results = run_benchmarks(CASES[:2], (10, ), (10, 100), repeat=1, minimum=0.001)
+        baseline = {"results" : [dict(r, seconds = r["seconds"] / 2) for r in results["results"]]}
+        compared = compare_results(results, baseline, 1.5)
+        self.assertEqual(len(compared), 4)
+        self.assertTrue(all(c["regressed"] for c in compared))
+        self.assertFalse(any(c["regressed"] for c in compare_results(results, results)))
+
+        with TemporaryDirectory() as directory:
+            json_path = path.join(directory, "BENCHMARK.json")
+            markdown_path = path.join(directory, "BENCHMARK.md")
+            args = ["--cases", "digit_length", "--bases", "10", "--digits", "10", "--repeat", "1",
+                    "--min-time", "0.001",
+                    "--json", json_path, "--markdown", markdown_path, "--quiet"]
+            self.assertEqual(benchmarks_main(args), 0)
+            self.assertTrue(path.exists(markdown_path))
+            saved = load_results(json_path)
+            self.assertEqual(len(saved["results"]), 1)
+            saved["results"][0]["seconds"] /= 1000
+            baseline_path = path.join(directory, "BASELINE.json")
+            with open(baseline_path, "w", encoding="utf-8") as file:
+                json.dump(saved, file)
+            self.assertEqual(benchmarks_main(args + ["--compare", baseline_path]), 1)
+
+    def test_memory(self):
+        """
+        `test_memory`
+
+        Tests that memory is measured for instances, caches and cases,
+        and that the command line measures memory when asked.
+        """
+        peak, retained = traced_allocation(lambda: bytearray(1 << 16))
+        self.assertGreaterEqual(peak, 1 << 16)
+        self.assertLess(retained, 1 << 16)
+
+        short = instance_report(10, 10, 100)
+        long = instance_report(10, 1000, 100)
+        self.assertGreater(long["bytes"], short["bytes"])
+        self.assertGreater(long["cached_bytes"], long["bytes"])
+        self.assertEqual(long["attributes"]["notation_format"], 0)
+        self.assertGreater(long["attributes"]["_digit_cache"], 1000)
+
+        results = run_memory_benchmarks(CASES[:3], (10, ), (10, 1000), instances=10)
+        self.assertEqual(len(results["instances"]), 2)
+        self.assertIn("power_cache_entries", results["caches"])
+        for result in results["results"]:
+            if result["status"] == "ok":
+                self.assertGreater(result["peak"], 0)
+        self.assertIn("| construct_iterable | 10 |", memory_markdown(results))
+
+        with TemporaryDirectory() as directory:
+            json_path = path.join(directory, "MEMORY.json")
+            args = ["--memory", "--cases", "notate", "--bases", "10", "--digits", "10",
+                    "--instances", "10", "--json", json_path, "--markdown", "", "--quiet"]
+            self.assertEqual(benchmarks_main(args), 0)
+            self.assertIsNotNone(load_results(json_path)["results"][0]["peak"])
+            self.assertEqual(benchmarks_main(args + ["--compare", json_path]), 0)
+
+    def test_imports(self):
+        """
+        `test_imports`
+
+        Tests that import times are parsed and measured,
+        and that the optional subsystems are only imported once used.
+        """
+        parsed = parse_importtime("import time: self [us] | cumulative | imported package\n"
+                                  "import time:       120 |        120 |   digint.tools\n"
+                                  "import time:      1500 |       2000 | digint\n")
+        self.assertEqual(parsed, {"digint.tools" : (0.00012, 0.00012), "digint" : (0.0015, 0.002)})
+
+        results = run_import_benchmark(repeat=1)
+        names = [r["case"] for r in results["results"]]
+        self.assertIn("digint.digint", names)
+        self.assertNotIn("digint.benchmarks", names)
+        self.assertGreater(results["total"], 0)
+        self.assertIn("| digint.digint |", imports_markdown(results))
+
+        code = ("import sys, digint; "
+                "assert 'digint.stats' not in sys.modules; "
+                "assert digint.stats.COUNTS is sys.modules['digint.stats'].COUNTS; "
+                "assert 'search' in dir(digint)")
+        subprocess.run([sys.executable, "-c", code], check=True)
+        with self.assertRaises(AttributeError):
+            getattr(__import__("digint"), "not_a_submodule")
+
+
+if __name__ == '__main__':
+    main()
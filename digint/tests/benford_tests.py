@@ -0,0 +1,106 @@
+"""
+benford_tests
+
+Holds test cases that specifically test the leading digit analysis defined in `benford`.
+"""
+
+from unittest import TestCase, main
+from random import randrange
+from array import array
+from collections import Counter
+from ..benford import LeadingDigitAnalyzer
+from ..digint import digitint
+
+
+def naive_leading(value:int, base:int, digits:int):
+    """
+    `naive_leading`
+
+    Finds the leading digits of the given value by removing digits one at a time, for reference.
+    Returns `None` for values with less than the given amount of digits.
+    """
+    value = abs(value)
+    if value < base ** (digits - 1):
+        return None
+    while value >= base ** digits:
+        value //= base
+    return value
+
+
+class LeadingDigitTests(TestCase):
+    """
+    `LeadingDigitTests`
+
+    Tests the counting of leading digits.
+    """
+
+    def test_update(self):
+        """
+        `test_update`
+
+        Tests that the leading digits of streams of values are counted like they are found naively.
+        """
+        for base in (2, 3, 10, 16, 60, 1000):
+            for digits in (1, 2, 3):
+                values = [randrange(-(1 << 300), 1 << 300) >> randrange(0, 300)
+                          for _ in range(300)] + [0, 1, -1, base - 1, base, base ** digits]
+                analyzer = LeadingDigitAnalyzer(base, digits).update(values)
+
+                expected = Counter(naive_leading(v, base, digits) for v in values if v != 0)
+                short = expected.pop(None, 0)
+                self.assertEqual(dict(analyzer.counts), dict(expected))
+                self.assertEqual(analyzer.zeros, values.count(0))
+                self.assertEqual(analyzer.short, short)
+                self.assertEqual(analyzer.total + analyzer.zeros + analyzer.short, len(values))
+
+    def test_columns(self):
+        """
+        `test_columns`
+
+        Tests that compact arrays and `digitint`s are counted like plain intigers.
+        """
+        values = array("Q", (randrange(0, 1 << 64) >> randrange(0, 64) for _ in range(200)))
+        analyzer = LeadingDigitAnalyzer(10, 2).update(values)
+        self.assertEqual(analyzer.counts, LeadingDigitAnalyzer(10, 2).update(list(values)).counts)
+        analyzer = LeadingDigitAnalyzer(7).update(digitint(v, 7) for v in values)
+        self.assertEqual(analyzer.counts, LeadingDigitAnalyzer(7).update(list(values)).counts)
+
+    def test_merge(self):
+        """
+        `test_merge`
+
+        Tests that merging the analyzers of separate parts of a stream matches analyzing it whole.
+        """
+        values = [randrange(0, 1 << 128) >> randrange(0, 128) for _ in range(500)]
+        whole = LeadingDigitAnalyzer(16, 2).update(values)
+        merged = LeadingDigitAnalyzer(16, 2)
+        for start in range(0, len(values), 100):
+            merged.merge(LeadingDigitAnalyzer(16, 2).update(values[start:start + 100]))
+        self.assertEqual(merged.counts, whole.counts)
+        self.assertEqual((merged.zeros, merged.short), (whole.zeros, whole.short))
+
+        with self.assertRaises(ValueError):
+            merged.merge(LeadingDigitAnalyzer(16, 1))
+        with self.assertRaises(ValueError):
+            LeadingDigitAnalyzer(1)
+
+    def test_distributions(self):
+        """
+        `test_distributions`
+
+        Tests the frequencies, expected frequencies and notated counts.
+        """
+        # powers of 2 are known to follow Benford's law
+        analyzer = LeadingDigitAnalyzer(10).update(1 << i for i in range(5000))
+        expected = analyzer.expected()
+        self.assertEqual(list(expected), list(range(1, 10)))
+        self.assertAlmostEqual(sum(expected.values()), 1)
+        for leading, frequency in analyzer.frequencies().items():
+            self.assertAlmostEqual(frequency, expected[leading], places=2)
+
+        notated = LeadingDigitAnalyzer(16).update((0xA0, 0xA1, 0xF)).notated()
+        self.assertEqual(notated, {"A" : 2, "F" : 1})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+checkdigit_tests
+
+Holds test cases that specifically test the check digit schemes defined in `checkdigit`.
+"""
+
+from unittest import TestCase, main, skipIf
+from importlib import import_module
+from random import randrange
+from array import array
+from ..checkdigit import get_scheme, register_scheme, WeightedSumScheme, TableScheme, SCHEMES
+from ..digint import digitint
+from ..typings import Any
+
+try:
+    numpy:Any = import_module("numpy")
+except ImportError:
+    numpy = None # pylint:disable=invalid-name
+
+
+class CheckDigitTests(TestCase):
+    """
+    `CheckDigitTests`
+
+    Tests computing and verifying check digits.
+    """
+
+    def test_known_codes(self):
+        """
+        `test_known_codes`
+
+        Tests the schemes against published example codes.
+        """
+        self.assertEqual(get_scheme("luhn").compute(7992739871), 3)
+        self.assertEqual(get_scheme("isbn10").compute(30640615), 2)
+        self.assertEqual(get_scheme("isbn10").compute(80442957), 10)
+        self.assertTrue(get_scheme("isbn10").verify([10, 7, 5, 9, 2, 4, 4, 0, 8, 0]))
+        self.assertEqual(get_scheme("ean13").compute(400638133393), 1)
+        self.assertEqual(get_scheme("damm").compute(572), 4)
+        self.assertEqual(get_scheme("verhoeff").compute(236), 3)
+        # GB82 WEST 1234 5698 7654 32, with its letters converted and moved to the end
+        self.assertEqual(get_scheme("mod97").compute(3214282912345698765432161100 // 100), 82)
+        self.assertTrue(get_scheme("mod97").verify(3214282912345698765432161182))
+
+    def test_round_trip(self):
+        """
+        `test_round_trip`
+
+        Tests that every scheme verifies the codes it computes check digits for,
+        for intigers, `digitint`s and compact digits,
+        and rejects the codes when a single digit is changed.
+        """
+        for name, scheme in SCHEMES.items():
+            for _ in range(200):
+                code = randrange(1, 10 ** randrange(1, 40))
+                check = scheme.compute(code)
+                place = 10 ** scheme.check_length
+                full = (code * place) + check
+                self.assertEqual(scheme.compute(digitint(code)), check)
+                if check < place:
+                    self.assertTrue(scheme.verify(full), name)
+                    self.assertTrue(scheme.verify(digitint(full)), name)
+                    digits = array("B", (int(c) for c in reversed(str(full))))
+                    self.assertTrue(scheme.verify(digits), name)
+                    if name != "mod11":
+                        # every other scheme here catches every single digit error
+                        index = randrange(0, len(digits))
+                        digits[index] = (digits[index] + randrange(1, 10)) % 10
+                        self.assertFalse(scheme.verify(digits), name)
+
+            codes = [randrange(0, 10 ** 12) for _ in range(50)]
+            self.assertEqual(scheme.compute_many(codes), [scheme.compute(c) for c in codes])
+
+    def test_register(self):
+        """
+        `test_register`
+
+        Tests building and registering a in-house weighted sum scheme.
+        """
+        scheme = register_scheme("test-mod7", WeightedSumScheme(7, (3, 5, 2), check_weight=4))
+        for _ in range(100):
+            code = randrange(0, 10 ** 20)
+            self.assertTrue(scheme.verify([scheme.compute(code)] + list(map(int, str(code)[::-1]))))
+        self.assertIs(get_scheme("test-mod7"), scheme)
+        with self.assertRaises(ValueError):
+            register_scheme("test-mod7", scheme)
+        with self.assertRaises(ValueError):
+            WeightedSumScheme(10, (1, 3), check_weight=2)
+        del SCHEMES["test-mod7"]
+
+    def test_abstract(self):
+        """
+        `test_abstract`
+
+        Tests that a table scheme missing any of its steps cannot be made.
+        """
+        class Incomplete(TableScheme): # pylint:disable=abstract-method
+            """
+            `Incomplete`
+
+            A table scheme with no check digit from its final state.
+            """
+
+            def _step(self, state:int, digit:int, position:int) -> int:
+                return state
+
+            def _step_matrix(self, state, digits, position:int):
+                return state
+
+        incomplete:Any = Incomplete
+        with self.assertRaises(TypeError):
+            incomplete() # pylint:disable=abstract-class-instantiated
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class NumpyCheckDigitTests(TestCase):
+    """
+    `NumpyCheckDigitTests`
+
+    Tests that batches of check digits given as `numpy` arrays match computing each on its own.
+    """
+
+    def test_values(self):
+        """
+        `test_values`
+
+        Tests batches of values of mixed digit lengths, with and without a set length,
+        including values too large for `numpy.int64`.
+        """
+        for name, scheme in SCHEMES.items():
+            codes = [randrange(0, 10 ** randrange(1, 17)) for _ in range(200)] + [0, 236]
+            for length in (0, 20):
+                checks = [scheme.compute(c, length) for c in codes]
+                self.assertEqual(list(scheme.compute_many(numpy.array(codes), length)),
+                                 checks, name)
+                full = [(c * (10 ** scheme.check_length)) + check
+                        for c, check in zip(codes, checks) if check < 10 ** scheme.check_length]
+                full_length = length + scheme.check_length if length != 0 else 0
+                self.assertEqual(list(scheme.verify_many(numpy.array(full), full_length)),
+                                 scheme.verify_many(full, full_length), name)
+                self.assertTrue(all(scheme.verify_many(numpy.array(full), full_length)), name)
+
+            large = [(1 << 64) - 1, (1 << 63) + 5, 12345]
+            self.assertEqual(list(scheme.compute_many(numpy.array(large, dtype=numpy.uint64))),
+                             [scheme.compute(c) for c in large], name)
+
+        verhoeff = get_scheme("verhoeff")
+        self.assertEqual(list(verhoeff.compute_many(numpy.array([236, 12345678901]))), [3, 0])
+        self.assertEqual(list(verhoeff.verify_many(numpy.array([2363, 123456789010]))),
+                         [True, True])
+
+    def test_matrix(self):
+        """
+        `test_matrix`
+
+        Tests batches given as a matrix with a row of digits for each code.
+        """
+        for name, scheme in SCHEMES.items():
+            rows = [[randrange(10) for _ in range(12)] for _ in range(100)]
+            self.assertEqual(list(scheme.compute_many(numpy.array(rows))),
+                             [scheme.compute(r) for r in rows], name)
+            self.assertEqual(list(scheme.verify_many(numpy.array(rows))),
+                             [scheme.verify(r) for r in rows], name)
+
+
+if __name__ == '__main__':
+    main()
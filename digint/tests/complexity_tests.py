@@ -0,0 +1,277 @@
+"""
+complexity_tests
+
+Holds test cases that check the growth of the cost of operations as values get longer,
+so that operations that are accidentally quadratic (or worse) are caught.
+
+Wall clock time is never used, as it is too noisy to fit reliably.
+Instead, the values of a `digitint` are wrapped in an intiger type that counts
+every big intiger opperation done with it (weighted by the amount of machine words involved),
+keeping divisions and powers apart from the rest, along with every write to the value.
+Each operation is counted at doubling digit lengths, and the exponent of its growth is fitted
+from those counts, failing when it is above the exponent of its declared complexity class.
+"""
+
+from unittest import TestCase, main
+from random import Random
+from math import log
+from ..typings import * # pylint:disable=unused-wildcard-import, wildcard-import
+from ..digint import ExtendedBasedIntiger
+from ..conversion import power
+
+
+COUNTS:Dict[str, int] = {"arithmetic" : 0, "divisions" : 0, "powers" : 0, "writes" : 0}
+"""
+`COUNTS`
+
+The opperations counted since the last `reset_counts`, weighted by the machine words involved.
+"""
+
+LINEAR = 1.25
+LINEARITHMIC = 1.45
+QUADRATIC = 2.25
+"""
+The highest fitted growth exponents allowed for each complexity class.
+These are a little above the exponent of the class itself, to allow for the lower order terms
+that are still significant at the lengths that are measured.
+"""
+
+LENGTHS = (256, 512, 1024, 2048)
+"""
+`LENGTHS`
+
+The digit lengths each operation is counted at.
+"""
+
+
+def reset_counts():
+    """
+    `reset_counts`
+
+    Resets all counts to 0, along with the cached powers so they are counted again.
+    """
+    for key in COUNTS:
+        COUNTS[key] = 0
+    power.cache_clear()
+
+
+def total_cost() -> int:
+    """
+    `total_cost`
+
+    Returns:
+        The total weighted cost of every opperation counted since the last `reset_counts`.
+    """
+    return sum(COUNTS.values())
+
+
+def _words(*values:int) -> int:
+    return (max(abs(int.__int__(v)).bit_length() for v in values) >> 6) + 1
+
+
+def _counted(name:str, kind:str, reflected:bool = False) -> Callable[..., Any]:
+    method = getattr(int, name)
+
+    def counted(self, *args):
+        result = method(self, *args)
+        if len(args) == 0:
+            COUNTS[kind] += _words(self)
+        else:
+            if result is NotImplemented:
+                return result
+            COUNTS[kind] += _words(self, args[0]) if kind != "powers" \
+                else _words(*(result if isinstance(result, tuple) else (result, )))
+        if isinstance(result, tuple):
+            return tuple(CountingInt(r) for r in result)
+        if isinstance(result, int) and not isinstance(result, bool):
+            return CountingInt(result)
+        return result
+
+    counted.__name__ = name
+    counted.__doc__ = f"Counted `{name}`{' (reflected)' if reflected else ''}."
+    return counted
+
+
+class CountingInt(int):
+    """
+    `CountingInt`
+
+    A intiger that counts every opperation done with it in `COUNTS`,
+    returning its results as `CountingInt`s so that whole calculations are counted.
+    """
+
+    __add__ = _counted("__add__", "arithmetic")
+    __radd__ = _counted("__radd__", "arithmetic", True)
+    __sub__ = _counted("__sub__", "arithmetic")
+    __rsub__ = _counted("__rsub__", "arithmetic", True)
+    __mul__ = _counted("__mul__", "arithmetic")
+    __rmul__ = _counted("__rmul__", "arithmetic", True)
+    __lshift__ = _counted("__lshift__", "arithmetic")
+    __rshift__ = _counted("__rshift__", "arithmetic")
+    __and__ = _counted("__and__", "arithmetic")
+    __rand__ = _counted("__rand__", "arithmetic", True)
+    __or__ = _counted("__or__", "arithmetic")
+    __ror__ = _counted("__ror__", "arithmetic", True)
+    __xor__ = _counted("__xor__", "arithmetic")
+    __rxor__ = _counted("__rxor__", "arithmetic", True)
+    __neg__ = _counted("__neg__", "arithmetic")
+    __abs__ = _counted("__abs__", "arithmetic")
+    __floordiv__ = _counted("__floordiv__", "divisions")
+    __rfloordiv__ = _counted("__rfloordiv__", "divisions", True)
+    __mod__ = _counted("__mod__", "divisions")
+    __rmod__ = _counted("__rmod__", "divisions", True)
+    __divmod__ = _counted("__divmod__", "divisions")
+    __rdivmod__ = _counted("__rdivmod__", "divisions", True)
+    __pow__ = _counted("__pow__", "powers")
+    __rpow__ = _counted("__rpow__", "powers", True)
+
+
+class CountingDigitint(ExtendedBasedIntiger):
+    """
+    `CountingDigitint`
+
+    A `digitint` that counts every write to its value,
+    and keeps its value as a `CountingInt`.
+    """
+
+    @property
+    def x(self) -> int:
+        """
+        `x`
+
+        The explicit value of the intiger.
+        """
+        return cast(property, ExtendedBasedIntiger.x).fget(self) # type:ignore[misc]
+
+    @x.setter
+    def x(self, value:int):
+        COUNTS["writes"] += 1
+        cast(property, ExtendedBasedIntiger.x).fset(self, CountingInt(value)) # type:ignore[misc]
+
+    # `int` itself must be given exactly an `int`
+    def __int__(self) -> int:
+        return int.__int__(self.x)
+    __index__ = __int__
+
+
+def growth_exponent(lengths:Sequence[int], costs:Sequence[int]) -> float:
+    """
+    `growth_exponent`
+
+    Fits `cost = c * (length ** k)` to the measurements with least squares on their logarithms.
+
+    Returns:
+        The fitted exponent `k`.
+    """
+    xs = [log(v) for v in lengths]
+    ys = [log(max(v, 1)) for v in costs]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def random_digits(rng:Random, base:int, length:int) -> List[int]:
+    """
+    `random_digits`
+
+    Returns:
+        A list of random digits in the given base, starting at the greatest place value,
+        that never starts with a `0`.
+    """
+    return [rng.randrange(1, base)] + [rng.randrange(0, base) for _ in range(length - 1)]
+
+
+class ComplexityTests(TestCase):
+    """
+    `ComplexityTests`
+
+    Tests that the counted cost of each operation grows no faster than its complexity class.
+    """
+
+    def assert_growth(self,
+                      name:str,
+                      operation:Callable[[CountingDigitint, int], Any],
+                      bound:float,
+                      bases:Iterable[int] = (2, 10, 36)):
+        """
+        `assert_growth`
+
+        Counts the given operation on random values of every digit length in `LENGTHS`,
+        and checks the fitted growth exponent is at most `bound`.
+        """
+        for base in bases:
+            rng = Random(base)
+            costs = []
+            for length in LENGTHS:
+                value = CountingDigitint(0, CountingInt(base))
+                value.x = int(CountingDigitint(random_digits(rng, base, length), base))
+                reset_counts()
+                operation(value, length)
+                costs.append(total_cost())
+            exponent = growth_exponent(LENGTHS, costs)
+            with self.subTest(operation=name, base=base):
+                self.assertLessEqual(exponent, bound, f"costs {costs} grow with {exponent:.2f}")
+
+    def test_counting(self):
+        """
+        `test_counting`
+
+        Tests that opperations are counted by kind, and that the harness itself fits exponents.
+        """
+        value = CountingDigitint(0, CountingInt(10))
+        reset_counts()
+        value.x = 12345
+        value.x = value.x // 10
+        self.assertEqual(int(value), 1234)
+        self.assertEqual(COUNTS["writes"], 2)
+        self.assertEqual(COUNTS["divisions"], 1)
+        self.assertIsInstance(value.x, CountingInt)
+        self.assertAlmostEqual(growth_exponent((1, 2, 4), (3, 12, 48)), 2)
+        self.assertAlmostEqual(growth_exponent((1, 2, 4), (5, 10, 20)), 1)
+
+    def test_conversion(self):
+        """
+        `test_conversion`
+
+        Tests that converting to and from digits is at most linearithmic.
+        """
+        self.assert_growth("constructor",
+                           lambda v, _: CountingDigitint(list(v.reversed_iter_digits()), v.base),
+                           LINEARITHMIC)
+        self.assert_growth("iter_digits", lambda v, _: list(v.iter_digits()), LINEARITHMIC)
+        self.assert_growth("notate", lambda v, _: v.notate(), LINEARITHMIC)
+
+    def test_single_digits(self):
+        """
+        `test_single_digits`
+
+        Tests that working with a single digit is at most linear.
+        """
+        self.assert_growth("get_digit", lambda v, n: v.get_digit(n // 2), LINEAR)
+        self.assert_growth("set_digit", lambda v, n: v.set_digit(n // 2, 1), LINEAR)
+        self.assert_growth("pop", lambda v, n: v.pop(n // 2), LINEAR)
+        self.assert_growth("insert", lambda v, n: v.insert(n // 2, 1), LINEAR)
+        self.assert_growth("digit_length", lambda v, _: v.digit_length(), LINEAR)
+
+    def test_many_digits(self):
+        """
+        `test_many_digits`
+
+        Tests that working with runs of digits is at most linear,
+        with a constant amount of big intiger opperations rather than one per digit.
+        """
+        self.assert_growth("unset_digit", lambda v, n: v.unset_digit(range(n // 4, n // 2)), LINEAR)
+        self.assert_growth("digit_rotate_left", lambda v, n: v.digit_rotate_left(n // 3), LINEAR)
+        self.assert_growth("digit_rotate_right", lambda v, n: v.digit_rotate_right(n // 3), LINEAR)
+        self.assert_growth("pop_leading_digits", lambda v, n: v.pop_leading_digits(n // 2), LINEAR)
+
+        def strip(value:CountingDigitint, length:int):
+            # a long run of the greatest digit is put in front of the value to be stripped
+            value.x += (power(value.base, length) - 1) * power(value.base, length)
+            value.lstrip(value.base - 1)
+        self.assert_growth("lstrip", strip, LINEARITHMIC)
+
+
+if __name__ == "__main__":
+    main()
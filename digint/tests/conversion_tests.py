@@ -0,0 +1,200 @@
+"""
+conversion_tests
+
+Holds test cases that specifically test the functions defined in `conversion`.
+"""
+
+from unittest import TestCase, main
+from random import randrange
+from ..conversion import int_to_digits, digits_to_int, int_digit_length, regroup_digits
+from ..conversion import digits_many, notate_many, reverse_int_digits
+from ..conversion import repunit, counted_digits_to_int, split_divmod
+from ..notation_format import NotationFormat
+
+
+BASES = (2, 3, 7, 8, 10, 16, 36, 60, 256, 1000, 2 ** 16, 2 ** 20, 3 ** 50)
+
+
+def naive_digits(value:int, base:int):
+    """
+    `naive_digits`
+
+    Finds the digits of the given value one at a time, for reference.
+    """
+    digits = []
+    value = abs(value)
+    while value != 0:
+        value, digit = divmod(value, base)
+        digits.append(digit)
+    return digits
+
+
+class ConversionTests(TestCase):
+    """
+    `ConversionTests`
+
+    Tests the conversion of values to and from digits.
+    """
+
+    def test_int_to_digits(self):
+        """
+        `test_int_to_digits`
+
+        Tests that `int_to_digits` matches digits found one at a time with random values,
+        including values large enough to be split many times.
+        """
+        for base in BASES:
+            for length in (0, 1, 5, 64, 65, 300, 2000):
+                value = randrange(-(base ** length), base ** length) if length else 0
+                self.assertEqual(list(int_to_digits(value, base)), naive_digits(value, base))
+                self.assertEqual(int_digit_length(value, base), len(naive_digits(value, base)))
+
+    def test_round_trip(self):
+        """
+        `test_round_trip`
+
+        Tests that `digits_to_int` is the inverse of `int_to_digits`,
+        with both compact and `list` digit sequences.
+        """
+        for base in BASES:
+            for length in (1, 5, 64, 65, 300, 2000):
+                value = randrange(base ** length)
+                digits = int_to_digits(value, base, length + 3)
+                self.assertEqual(len(digits), length + 3)
+                self.assertEqual(digits_to_int(digits, base), value)
+                self.assertEqual(digits_to_int(list(digits), base), value)
+
+    def test_regroup_digits(self):
+        """
+        `test_regroup_digits`
+
+        Tests that `regroup_digits` matches a direct conversion between related bases.
+        """
+        for base, new_base in ((2, 16), (16, 2), (10, 1000), (1000, 10), (3, 27), (9, 3), (4, 256)):
+            value = randrange(10 ** 500)
+            regrouped = regroup_digits(int_to_digits(value, base), base, new_base)
+            self.assertEqual(list(regrouped), list(int_to_digits(value, new_base)))
+
+        with self.assertRaises(ValueError):
+            regroup_digits(int_to_digits(100, 10), 10, 16)
+
+    def test_negative_bases(self):
+        """
+        `test_negative_bases`
+
+        Tests that `int_to_digits` and `digits_to_int` match digits found one at a time
+        in negative bases, for both positive and negative random values.
+        """
+        for base in (-2, -3, -4, -10, -16, -256, -1000, -(3 ** 20)):
+            for length in (0, 1, 5, 64, 65, 300):
+                value = randrange(-(abs(base) ** length), abs(base) ** length) if length else 0
+                expected = []
+                remaining = value
+                while remaining != 0:
+                    remaining, digit = divmod(remaining, base)
+                    if digit < 0:
+                        remaining += 1
+                        digit -= base
+                    expected.append(digit)
+                digits = int_to_digits(value, base)
+                self.assertEqual(list(digits), expected)
+                self.assertEqual(digits_to_int(digits, base), value)
+                self.assertEqual(digits_to_int(list(digits), base), value)
+
+    def test_reverse_int_digits(self):
+        """
+        `test_reverse_int_digits`
+
+        Tests that reversing the digits of random values matches reversing the naive digits,
+        including when padding them with leading zeros first.
+        """
+        for base in BASES + (4, 256):
+            for _ in range(100):
+                value = randrange(-(10 ** randrange(1, 300)), 10 ** randrange(1, 300))
+                length = randrange(0, 200)
+                digits = naive_digits(value, base)
+                digits += [0] * (length - len(digits))
+                expected = sum(d * (base ** i) for i, d in enumerate(reversed(digits)))
+                expected *= -1 if value < 0 else 1
+                self.assertEqual(reverse_int_digits(value, base, length), expected)
+        self.assertEqual(reverse_int_digits(9, -2), 15)
+
+    def test_split_divmod(self):
+        """
+        `test_split_divmod`
+
+        Tests that the recursive division matches the builtin `divmod`,
+        including with divisors large enough to be split, and round trips values that large.
+        """
+        for _ in range(100):
+            value = randrange(0, 1 << randrange(1, 60000))
+            divisor = randrange(1, 1 << randrange(1, 30000))
+            self.assertEqual(split_divmod(value, divisor), divmod(value, divisor))
+        mask = (1 << 10000) - 1
+        self.assertEqual(split_divmod((1 << 20000) - 1, 1 << 10000), (mask, mask))
+
+        for base in (3, 10, 1000):
+            value = randrange(0, base ** 20000)
+            self.assertEqual(digits_to_int(int_to_digits(value, base), base), value)
+
+    def test_counted_digits_to_int(self):
+        """
+        `test_counted_digits_to_int`
+
+        Tests that combining runs of repeated digits matches combining every digit.
+        """
+        for base in BASES:
+            counted = [(randrange(0, base), randrange(0, 50)) for _ in range(randrange(0, 20))]
+            digits = [d for d, count in counted for _ in range(count)][::-1]
+            self.assertEqual(counted_digits_to_int(counted, base), digits_to_int(digits, base))
+            self.assertEqual(repunit(base, 5), digits_to_int([1] * 5, base))
+
+
+class MultiBaseTests(TestCase):
+    """
+    `MultiBaseTests`
+
+    Tests finding the digits and notation of a value in several bases at once.
+    """
+
+    def test_digits_many(self):
+        """
+        `test_digits_many`
+
+        Tests that `digits_many` matches converting to each base on its own with random values,
+        mixing power of two bases, bases with a common root and unrelated bases.
+        """
+        bases = (2, 4, 8, 16, 32, 128, 256, 2 ** 16, 3, 9, 27, 10, 1000, 36, 60)
+        for length in (0, 1, 20, 500):
+            value = randrange(-(10 ** length), 10 ** length) if length else 0
+            many = digits_many(value, bases)
+            self.assertEqual(set(many), set(bases))
+            for base in bases:
+                self.assertEqual(list(many[base]), list(int_to_digits(value, base)))
+
+    def test_notate_many(self):
+        """
+        `test_notate_many`
+
+        Tests that `notate_many` matches the builtin notations of random values,
+        and that formats can be given per base.
+        """
+        for _ in range(500):
+            value = randrange(-(10 ** 50), 10 ** 50)
+            notated = notate_many(value, (2, 8, 10, 16))
+            self.assertEqual(notated[2], format(value, "b"))
+            self.assertEqual(notated[8], format(value, "o"))
+            self.assertEqual(notated[10], str(value))
+            self.assertEqual(notated[16], format(value, "X"))
+
+        grouped = NotationFormat(*tuple("0123456789"),
+                                 group_split_symbol=",",
+                                 group_split_count=3,
+                                 implicit_positive=True
+                                 )
+        notated = notate_many(1234567, (10, 16), (grouped, None))
+        self.assertEqual(notated, {10 : "1,234,567", 16 : "12D687"})
+
+
+if __name__ == '__main__':
+    main()
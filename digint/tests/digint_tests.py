@@ -4,10 +4,14 @@ digint_tests
 Holds test cases that specifically test the `digitint` class and it's capabilities.
 """
 
+import pickle
+from copy import copy, deepcopy
 from unittest import TestCase, main
 from random import randrange
 from ..digint import digitint
-from ..tools import absindex
+from ..errors import BaseValueError, BaseInvalidOpperationError
+from ..notation_format import NotationFormat, DEFAULT_FORMAT
+from ..tools import absindex, iter_to_slices
 
 
 class DigitintPreset(TestCase):
@@ -173,6 +177,533 @@ class DigitintPreset(TestCase):
             for content in contents:
                 self.assertTrue(sequence.contains(content))
 
+    def test_copy(self):
+        """
+        `test_copy`
+
+        Tests that the `digitint` class's `copy`, `__copy__` and `__deepcopy__`
+        produce independent copies that keep the base and notation format
+        using the tests case's contant examples.
+        """
+
+        for test_set in self.CONSTS:
+            original = digitint(test_set["whole"], test_set["base"])
+            original.on_changed = lambda *_: self.fail("Callback carried over to a copy")
+            for duplicate in (original.copy(), copy(original), deepcopy(original)):
+                self.assertEqual(duplicate, original)
+                self.assertEqual(duplicate.base, original.base)
+                self.assertIs(duplicate.notation_format, original.notation_format)
+                duplicate[0] = (duplicate[0] + 1) % duplicate.base
+                self.assertNotEqual(duplicate, original)
+
+            fmt = NotationFormat(*tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            override = original.copy(notation_format_override=fmt)
+            self.assertIs(override.notation_format, fmt)
+            self.assertEqual(fmt.copy(), fmt)
+            self.assertEqual(hash(fmt.copy()), hash(fmt))
+            self.assertNotEqual(fmt, original.notation_format)
+            self.assertEqual(original.copy(base=2).base, 2)
+            self.assertEqual(original.copy(7), 7)
+
+    def test_pickle(self):
+        """
+        `test_pickle`
+
+        Tests that pickled `digitint`s and notation formats are restored with the same state,
+        sharing the module's own notation formats by reference and leaving out cached digits,
+        using the tests case's contant examples.
+        """
+
+        for test_set in self.CONSTS:
+            original = digitint(test_set["whole"], test_set["base"])
+            original.notate()
+            restored = pickle.loads(pickle.dumps(original))
+            self.assertEqual(restored, original)
+            self.assertEqual(restored.base, original.base)
+            self.assertIs(restored.notation_format, DEFAULT_FORMAT)
+            self.assertIsNone(restored._digit_cache) # pylint:disable=protected-access
+            self.assertEqual(restored.notate(), original.notate())
+            self.assertLess(len(pickle.dumps(original)), len(pickle.dumps(DEFAULT_FORMAT.copy())))
+
+        for value, base in ((-7, 1), (123, -3), (-(10 ** 40), -10)):
+            original = digitint(value, base)
+            restored = pickle.loads(pickle.dumps(original))
+            self.assertEqual((restored.x, restored.base), (original.x, original.base))
+            self.assertEqual(restored.notate(), original.notate())
+
+        fmt = NotationFormat(*tuple("01"), negative_symbol="~", group_split_symbol=" ",
+                             group_split_count=4)
+        original = digitint(-12345, 2, notation_format=fmt)
+        original.limit_high = 0
+        restored = pickle.loads(pickle.dumps(original))
+        self.assertEqual(restored.notation_format, fmt)
+        self.assertEqual(restored.notate(), original.notate())
+        self.assertEqual(restored.limit_high, 0)
+        self.assertIs(pickle.loads(pickle.dumps(DEFAULT_FORMAT)), DEFAULT_FORMAT)
+
+
+class DigitintRebase(TestCase):
+    """
+    `DigitintRebase`
+
+    Tests the `digitint` class's `rebase` using randomly generated example values.
+    """
+    def test_rebase(self):
+        """
+        `test_rebase`
+
+        Tests that `rebase` keeps the value and produces the same digits as a direct conversion,
+        both between related bases (where known digits are regrouped) and unrelated bases.
+        """
+        for base, new_base in ((10, 1000), (1000, 10), (2, 16), (16, 2), (3, 9), (10, 3), (7, 1)):
+            for _ in range(50):
+                val = randrange(-(10 ** 300), 10 ** 300)
+                dintobj = digitint(val, base)
+                list(dintobj)
+                dintobj.rebase(new_base)
+                self.assertEqual(dintobj.base, new_base)
+                self.assertEqual(int(dintobj), val)
+                if new_base != 1:
+                    self.assertEqual(list(dintobj), list(digitint(val, new_base)))
+                    self.assertEqual(str(dintobj), str(digitint(val, new_base)))
+
+
+class DigitintDigitwise(TestCase):
+    """
+    `DigitintDigitwise`
+
+    Tests the `digitint` class's carry-less digit-wise opperations using random values.
+    """
+    BASES = (2, 3, 10, 16, 60, 127, 128, 129, 256, 1000, 2 ** 16 + 1, 2 ** 40, 2 ** 64 + 7)
+
+    @staticmethod
+    def naive(a:int, b:int, base:int, func) -> int:
+        """
+        `naive`
+
+        Applies the given function to each pair of digits one at a time, for reference.
+        """
+        a_digits = list(digitint(a, base).iter_digits())
+        b_digits = list(digitint(b, base).iter_digits())
+        count = max(len(a_digits), len(b_digits))
+        a_digits += [0] * (count - len(a_digits))
+        b_digits += [0] * (count - len(b_digits))
+        return sum(func(x, y) * (base ** i) for i, (x, y) in enumerate(zip(a_digits, b_digits)))
+
+    def test_digitwise(self):
+        """
+        `test_digitwise`
+
+        Tests that each digit-wise opperation matches working through the digits one at a time,
+        including values with mismatched digit lengths and negative values.
+        """
+        for base in self.BASES:
+            for _ in range(20):
+                a = randrange(1, base ** randrange(1, 100))
+                b = randrange(base ** randrange(0, 100))
+                scalar = randrange(1000)
+                dintobj = digitint(a, base)
+                self.assertEqual(dintobj.digitwise_add(b),
+                                 self.naive(a, b, base, lambda x, y, base=base: (x + y) % base))
+                self.assertEqual(dintobj.digitwise_sub(b),
+                                 self.naive(a, b, base, lambda x, y, base=base: (x - y) % base))
+                self.assertEqual(dintobj.digitwise_min(b), self.naive(a, b, base, min))
+                self.assertEqual(dintobj.digitwise_max(b), self.naive(a, b, base, max))
+                self.assertEqual(dintobj.digitwise_mul(scalar),
+                                 self.naive(a, 0, base,
+                                            lambda x, _, base=base, s=scalar: (x * s) % base))
+                self.assertEqual(digitint(-a, base).digitwise_add(digitint(b, base)),
+                                 -self.naive(a, b, base, lambda x, y, base=base: (x + y) % base))
+
+
+class DigitintDistance(TestCase):
+    """
+    `DigitintDistance`
+
+    Tests the `digitint` class's `digit_distance` and `digit_diff` using random values.
+    """
+    BASES = (1, 2, 4, 8, 16, 256, 2 ** 40, 3, 10, 60, 1000, 2 ** 64 + 7)
+
+    def test_distance(self):
+        """
+        `test_distance`
+
+        Tests that `digit_distance` and `digit_diff` match comparing the digits one at a time,
+        including values with mismatched digit lengths and values that differ in only a few spots.
+        """
+        for base in self.BASES:
+            for _ in range(30):
+                a = randrange(base ** randrange(0, 60)) if base != 1 else randrange(100)
+                if randrange(2):
+                    b = randrange(base ** randrange(0, 60)) if base != 1 else randrange(100)
+                else:
+                    b = a + randrange(3) * (base ** randrange(30) if base != 1 else 1)
+                dintobj = digitint(a, base)
+                a_digits = list(dintobj.iter_digits())
+                b_digits = list(digitint(b, base).iter_digits())
+                count = max(len(a_digits), len(b_digits))
+                a_digits += [0] * (count - len(a_digits))
+                b_digits += [0] * (count - len(b_digits))
+                differing = [i for i in range(count) if a_digits[i] != b_digits[i]]
+
+                self.assertEqual(dintobj.digit_distance(-b), len(differing))
+                self.assertEqual(dintobj.digit_diff(b), iter_to_slices(differing, count))
+
+
+class DigitintNegativeBase(TestCase):
+    """
+    `DigitintNegativeBase`
+
+    Tests the `digitint` class's support for negative bases using random values.
+    """
+    def test_negative_base(self):
+        """
+        `test_negative_base`
+
+        Tests that getting, setting, notating and measuring digits in negative bases
+        matches working with the digits one at a time, for both positive and negative values.
+        """
+        for base in (-2, -3, -10, -16):
+            for _ in range(100):
+                val = randrange(-(10 ** 30), 10 ** 30)
+                dintobj = digitint(val, base)
+                digits = list(dintobj)
+                self.assertEqual(sum(d * (base ** i) for i, d in enumerate(digits)), val)
+                self.assertTrue(all(0 <= d < -base for d in digits))
+                self.assertEqual(dintobj.digit_length(), len(digits))
+                self.assertEqual(int(digitint(str(dintobj), base)), val)
+                self.assertNotIn("-", str(dintobj))
+
+                index = randrange(len(digits))
+                self.assertEqual(dintobj[index], digits[index])
+                new_digit = randrange(-base)
+                dintobj[index] = new_digit
+                digits[index] = new_digit
+                while len(digits) != 0 and digits[-1] == 0:
+                    digits.pop()
+                self.assertEqual(list(dintobj), digits)
+
+        self.assertEqual(str(digitint(9, -2)), "11001")
+        self.assertEqual(str(digitint(-3, -2)), "1101")
+        for base in (0, -1):
+            with self.assertRaises(BaseValueError):
+                digitint(1, base)
+
+
+class DigitintRecoding(TestCase):
+    """
+    `DigitintRecoding`
+
+    Tests the `digitint` class's signed digit recodings using random values.
+    """
+    def test_recoding(self):
+        """
+        `test_recoding`
+
+        Tests that `naf`, `wnaf` and `balanced_digits` follow the rules of their recodings,
+        and that `from_signed_digits` reconstructs the original value from each of them.
+        """
+        for _ in range(200):
+            val = randrange(-(2 ** randrange(1, 2000)), 2 ** randrange(1, 2000))
+            dintobj = digitint(val, 10)
+
+            naf = dintobj.naf()
+            self.assertTrue(all(d in (-1, 0, 1) for d in naf))
+            self.assertFalse(any(a != 0 and b != 0 for a, b in zip(naf, naf[1:])))
+            self.assertEqual(digitint.from_signed_digits(naf, 2), val)
+
+            width = randrange(2, 12)
+            wnaf = dintobj.wnaf(width)
+            nonzero = [i for i, d in enumerate(wnaf) if d != 0]
+            self.assertTrue(all(wnaf[i] % 2 == 1 and abs(wnaf[i]) < 2 ** (width - 1)
+                                for i in nonzero))
+            self.assertTrue(all(b - a >= width for a, b in zip(nonzero, nonzero[1:])))
+            self.assertEqual(digitint.from_signed_digits(wnaf, 2), val)
+
+            for base in (3, 5, 11, 3 ** 30):
+                balanced = digitint(val, base).balanced_digits()
+                self.assertTrue(all(abs(d) <= (base - 1) // 2 for d in balanced))
+                self.assertEqual(digitint.from_signed_digits(balanced, base, 16), val)
+
+        self.assertEqual(list(digitint(5, 3).balanced_digits()), [-1, -1, 1])
+        with self.assertRaises(BaseInvalidOpperationError):
+            digitint(5, 10).balanced_digits()
+
+
+class DigitintChunks(TestCase):
+    """
+    `DigitintChunks`
+
+    Tests the `digitint` class's `iter_chunks` using random values.
+    """
+    def test_chunks(self):
+        """
+        `test_chunks`
+
+        Tests that `iter_chunks` matches slicing the digits one chunk at a time,
+        with and without overlap, in both directions.
+        """
+        for base in (2, 16, 256, 3, 10, 60, -2, -10):
+            for _ in range(20):
+                val = randrange(-(10 ** randrange(0, 100)), 10 ** randrange(0, 100))
+                dintobj = digitint(val, base)
+                digits = list(dintobj)
+                for k in range(1, 6):
+                    for overlap in range(k):
+                        step = k - overlap
+                        starts = [0] if len(digits) > 0 else []
+                        while starts and starts[-1] + k < len(digits):
+                            starts.append(starts[-1] + step)
+                        expected = [sum(d * (abs(base) ** i) for i, d in enumerate(digits[s:s + k]))
+                                    for s in starts]
+                        self.assertEqual(list(dintobj.iter_chunks(k, overlap=overlap)), expected)
+                        self.assertEqual(list(dintobj.iter_chunks(k, True, overlap)),
+                                         expected[::-1])
+
+        with self.assertRaises(ValueError):
+            digitint(10, 10).iter_chunks(2, overlap=2)
+
+
+class DigitintSearch(TestCase):
+    """
+    `DigitintSearch`
+
+    Tests the `digitint` class's searching for patterns of digits using random values.
+    """
+    def test_search(self):
+        """
+        `test_search`
+
+        Tests that `find`, `rfind`, `count`, `index` and `in` match searching the digits directly,
+        for both compact and plain digits.
+        """
+        for base in (2, 10, 16, 2 ** 16, 2 ** 40, 7 ** 30, -10):
+            for _ in range(20):
+                dintobj = digitint(randrange(1, 10 ** randrange(1, 300)), base)
+                digits = list(dintobj)
+                # patterns are written greatest place value first, like they are notated
+                start = randrange(0, len(digits))
+                pattern = digits[start:start + randrange(1, 4)][::-1]
+                written = tuple(pattern[::-1])
+                matches = [i for i in range(len(digits) - len(pattern) + 1)
+                           if tuple(digits[i:i + len(pattern)]) == written]
+
+                self.assertEqual(dintobj.find(pattern), matches[0])
+                self.assertEqual(dintobj.index(pattern), matches[0])
+                self.assertEqual(dintobj.rfind(pattern), matches[-1])
+                self.assertIn(pattern, dintobj)
+                counted = 0
+                last = -len(pattern)
+                for i in matches:
+                    if i >= last + len(pattern):
+                        counted += 1
+                        last = i
+                self.assertEqual(dintobj.count(pattern), counted)
+                self.assertEqual(dintobj.find(pattern, matches[-1] + 1), -1)
+                self.assertEqual(dintobj.rfind(pattern, 0, matches[0] + len(pattern) - 1), -1)
+
+        dintobj = digitint(3141592653589793238462643383279)
+        self.assertEqual(dintobj.find("14"), 28)
+        self.assertEqual(dintobj.count("3"), 7)
+        self.assertNotIn(0, dintobj)
+        self.assertEqual(dintobj.find(10), -1)
+        self.assertIn("0", digitint(0))
+        self.assertEqual(digitint(5, 1).count(1), 5)
+        with self.assertRaises(ValueError):
+            dintobj.index("00")
+
+
+class DigitintReverse(TestCase):
+    """
+    `DigitintReverse`
+
+    Tests the `digitint` class's reversal of its digits using random values.
+    """
+    def test_reverse(self):
+        """
+        `test_reverse`
+
+        Tests that `reversed_value`, `reverse_digits` and `is_palindrome`
+        match reversing the notation of the value.
+        """
+        for _ in range(500):
+            val = randrange(-(10 ** randrange(1, 100)), 10 ** randrange(1, 100))
+            notated = str(abs(val))
+            if randrange(0, 2) == 0:
+                notated = notated + notated[::-1][randrange(0, 2):]
+                val = int(notated) * (-1 if val < 0 else 1)
+            expected = int(notated[::-1]) * (-1 if val < 0 else 1)
+
+            dintobj = digitint(val)
+            self.assertEqual(dintobj.reversed_value(), expected)
+            self.assertEqual(dintobj.is_palindrome(), val == 0 or notated == notated[::-1])
+            dintobj.reverse_digits()
+            self.assertEqual(int(dintobj), expected)
+
+        self.assertEqual(digitint(0b110100, 2).reversed_value(), 0b1011)
+        self.assertTrue(digitint(0xABBA, 16).is_palindrome())
+        self.assertTrue(digitint(randrange(1, 100), 1).is_palindrome())
+
+
+class DigitintRotate(TestCase):
+    """
+    `DigitintRotate`
+
+    Tests the `digitint` class's rotation and removal of digits using random values.
+    """
+    def test_rotate(self):
+        """
+        `test_rotate`
+
+        Tests that `digit_rotate_left` and `digit_rotate_right` match rotating the notation.
+        """
+        for _ in range(500):
+            val = randrange(-(10 ** randrange(1, 60)), 10 ** randrange(1, 60))
+            notated = str(abs(val)) if val != 0 else ""
+            amount = randrange(-100, 100)
+            shift = amount % len(notated) if notated else 0
+            rotated = notated[shift:] + notated[:shift]
+            expected = int(rotated or "0") * (-1 if val < 0 else 1)
+
+            dintobj = digitint(val)
+            dintobj.digit_rotate_left(amount)
+            self.assertEqual(int(dintobj), expected)
+            dintobj = digitint(val)
+            dintobj.digit_rotate_right(-amount)
+            self.assertEqual(int(dintobj), expected)
+
+        dintobj = digitint(1234)
+        dintobj.digit_rotate_right()
+        self.assertEqual(int(dintobj), 4123)
+        dintobj = digitint(6, -2)
+        dintobj.digit_rotate_left()
+        self.assertEqual(list(dintobj), [1, 0, 1, 0, 1])
+
+    def test_unset(self):
+        """
+        `test_unset`
+
+        Tests that `unset_digit`, `pop` and `insert` match editing the notation.
+        """
+        for base in (2, 10):
+            for _ in range(300):
+                val = randrange(1, base ** randrange(2, 80))
+                digits = list(digitint(val, base))
+                start = randrange(0, len(digits))
+                stop = randrange(start, len(digits) + 1)
+                unset = digits[:start] + ([0] * (stop - start)) + digits[stop:]
+
+                dintobj = digitint(val, base)
+                dintobj.unset_digit(range(start, stop))
+                self.assertEqual(list(dintobj.iter_digits(len(digits))), unset)
+
+                dintobj = digitint(val, base)
+                self.assertEqual(dintobj.pop(start), digits[start])
+                self.assertEqual(list(dintobj.iter_digits(len(digits) - 1)),
+                                 digits[:start] + digits[start + 1:])
+                dintobj.insert(start, digits[start])
+                self.assertEqual(int(dintobj), val)
+
+        dintobj = digitint(0b101101, 2)
+        dintobj.unset_digit(3)
+        self.assertEqual(int(dintobj), 0b100101)
+
+
+class DigitintPermutation(TestCase):
+    """
+    `DigitintPermutation`
+
+    Tests the `digitint` class's sorting and permuting of its digits using random values.
+    """
+    def test_permutation(self):
+        """
+        `test_permutation`
+
+        Tests that `sorted_digits`, `max_permutation`, `min_permutation`
+        and `next_digit_permutation` match working with the notated digits.
+        """
+        for _ in range(500):
+            val = randrange(-(10 ** randrange(1, 60)), 10 ** randrange(1, 60))
+            sign = -1 if val < 0 else 1
+            notated = str(abs(val))
+            dintobj = digitint(val)
+
+            self.assertEqual(dintobj.sorted_digits(), sign * int("".join(sorted(notated))))
+            self.assertEqual(dintobj.max_permutation(),
+                             sign * int("".join(sorted(notated, reverse=True))))
+            if val != 0:
+                leading = min(c for c in notated if c != "0")
+                rest = list(notated)
+                rest.remove(leading)
+                self.assertEqual(dintobj.min_permutation(),
+                                 sign * int(leading + "".join(sorted(rest))))
+
+            # the next permutation, found by swapping and sorting the notated digits directly
+            chars = list(notated)
+            pivot = len(chars) - 2
+            while pivot >= 0 and chars[pivot] >= chars[pivot + 1]:
+                pivot -= 1
+            if pivot < 0:
+                self.assertIsNone(dintobj.next_digit_permutation())
+            else:
+                swap = len(chars) - 1
+                while chars[swap] <= chars[pivot]:
+                    swap -= 1
+                chars[pivot], chars[swap] = chars[swap], chars[pivot]
+                chars[pivot + 1:] = reversed(chars[pivot + 1:])
+                self.assertEqual(dintobj.next_digit_permutation(), sign * int("".join(chars)))
+
+        self.assertEqual(digitint(0b1011, 2).next_digit_permutation(), 0b1101)
+        self.assertEqual(digitint([3, 0, 2], 16).sorted_digits(), 0x23)
+        with self.assertRaises(BaseInvalidOpperationError):
+            digitint(9, -2).max_permutation()
+
+
+class DigitintLeading(TestCase):
+    """
+    `DigitintLeading`
+
+    Tests the `digitint` class's access to its leading (greatest place value) digits
+    using random values.
+    """
+    def test_leading(self):
+        """
+        `test_leading`
+
+        Tests that `get_leading_digits`, `pop_leading_digits`, `pop(-1)` and `lstrip`
+        match working with the digits one at a time, as the value is changed between calls.
+        """
+        for base in (2, 3, 10, 16, 1000, -10):
+            for _ in range(50):
+                val = randrange(-(10 ** randrange(1, 200)), 10 ** randrange(1, 200))
+                if val == 0:
+                    continue
+                dintobj = digitint(val, base)
+                digits = list(dintobj)
+                sign = -1 if val < 0 and base > 0 else 1
+
+                count = randrange(1, len(digits) + 1)
+                leading = sum(d * (abs(base) ** i) for i, d in enumerate(digits[-count:]))
+                self.assertEqual(dintobj.get_leading_digits(count), leading)
+                self.assertEqual(dintobj.pop_leading_digits(count), leading)
+                digits = digits[:-count]
+                while len(digits) != 0 and digits[-1] == 0:
+                    digits.pop()
+                self.assertEqual(dintobj.digit_length(), len(digits))
+                self.assertEqual(int(dintobj), sign * sum(d * (base ** i)
+                                                          for i, d in enumerate(digits)))
+
+                if len(digits) != 0:
+                    self.assertEqual(dintobj[-1], digits[-1])
+                    self.assertEqual(dintobj.pop(-1), digits.pop())
+                    while len(digits) != 0 and digits[-1] == 0:
+                        digits.pop()
+                    self.assertEqual(list(dintobj), digits)
+
+        dintobj = digitint(int("9" * 2000 + "8" * 1000 + "12345"), 10)
+        dintobj.lstrip([8, 9])
+        self.assertEqual(dintobj, 12345)
+
 
 class DigitintRandom(TestCase):
     """
@@ -0,0 +1,95 @@
+"""
+main_tests
+
+Holds test cases that specifically test the command line converter defined in `__main__`.
+"""
+
+import subprocess
+import sys
+from os import path
+from random import randrange
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from ..batch import notate_many
+
+
+def run_digint(args, text:str = ""):
+    """
+    `run_digint`
+
+    Runs ``python -m digint`` with the given arguments and stdin, in a new interpreter.
+    """
+    return subprocess.run([sys.executable, "-m", "digint"] + args,
+                          input=text,
+                          stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE,
+                          universal_newlines=True,
+                          cwd=path.dirname(path.dirname(path.dirname(path.abspath(__file__)))),
+                          check=False)
+
+
+class CommandLineTests(TestCase):
+    """
+    `CommandLineTests`
+
+    Tests converting values read one per line with ``python -m digint``.
+    """
+
+    def test_convert(self):
+        """
+        `test_convert`
+
+        Tests converting values from stdin and files between bases, in and out of the process.
+        """
+        values = [randrange(-10 ** 30, 10 ** 30) for _ in range(500)]
+        decimal = "\n".join(str(v) for v in values) + "\n"
+        expected = "\n".join(notate_many(values, 16, workers=1)) + "\n"
+
+        converted = run_digint(["convert", "10", "16"], decimal)
+        self.assertEqual(converted.returncode, 0)
+        self.assertEqual(converted.stdout, expected)
+
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, "values.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(decimal.replace("\n", "\r\n\n"))
+            converted = run_digint(["convert", "10", "16", file_path, "--workers", "2",
+                                    "--chunk-size", "50", "--stats"])
+            self.assertEqual(converted.stdout, expected)
+            self.assertIn("500 values", converted.stderr)
+
+            # files may also follow options that are given after the bases
+            converted = run_digint(["convert", "10", "16", "--stats", file_path, "-"], "255\n")
+            self.assertEqual(converted.stdout, expected + "FF\n")
+            counted = run_digint(["stats", "10", "--count-base", "7", file_path])
+            self.assertIn("values\t500", counted.stdout)
+            unknown = run_digint(["convert", "10", "16", "--stats", file_path, "--unknown"])
+            self.assertEqual(unknown.returncode, 2)
+            self.assertIn("--unknown", unknown.stderr)
+
+        lowered = run_digint(["convert", "16", "10", "--input-case", "lower"], expected.lower())
+        self.assertEqual(lowered.stdout, decimal)
+
+        invalid = run_digint(["convert", "10", "2"], "12\n1x\n")
+        self.assertEqual(invalid.returncode, 1)
+        self.assertIn("error", invalid.stderr)
+
+    def test_reformat_and_stats(self):
+        """
+        `test_reformat_and_stats`
+
+        Tests reformatting values in the same base, and counting their digits.
+        """
+        reformatted = run_digint(["reformat", "10", "--group", ",", "--explicit-positive"],
+                                 "1234567\n-1000\n0\n")
+        self.assertEqual(reformatted.stdout, "+1,234,567\n-1,000\n0\n")
+
+        counted = run_digint(["stats", "10"], "1234567\n-1000\n0\n")
+        lines = counted.stdout.splitlines()
+        self.assertEqual(lines[:2], ["values\t3", "digits\t12"])
+        self.assertIn("1\t2\t0.166667\t2", lines)
+        self.assertIn("0\t4\t0.333333\t1", lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+search_tests
+
+Holds test cases that specifically test the searches defined in `search`.
+"""
+
+from unittest import TestCase, main
+from random import randrange
+from functools import partial
+from ..search import palindromes, digit_sums, is_palindrome_in, palindromic_in, digit_sum
+from ..search import search_range, _palindrome_chunks
+
+
+def naive_digits(value:int, base:int):
+    """
+    `naive_digits`
+
+    Finds the digits of the given value one at a time, for reference.
+    """
+    digits = []
+    while value != 0:
+        value, digit = divmod(value, base)
+        digits.append(digit)
+    return digits
+
+
+class SearchTests(TestCase):
+    """
+    `SearchTests`
+
+    Tests the generation and searching of values with digit properties.
+    """
+
+    def test_palindromes(self):
+        """
+        `test_palindromes`
+
+        Tests that the generated palindromes are exactly the palindromes found naively.
+        """
+        for base in (2, 3, 10, 16):
+            for _ in range(5):
+                start = randrange(0, 5000)
+                stop = start + randrange(0, 5000)
+                expected = [v for v in range(start, stop)
+                            if naive_digits(v, base) == naive_digits(v, base)[::-1]]
+                self.assertEqual(list(palindromes(base, start, stop)), expected)
+                self.assertTrue(all(is_palindrome_in(v, base) for v in expected))
+
+        generated = palindromes(10, 10 ** 30)
+        self.assertEqual(next(generated), (10 ** 30) + 1)
+        self.assertEqual(next(generated), (10 ** 30) + (10 ** 15) + 1)
+        with self.assertRaises(ValueError):
+            next(palindromes(1))
+
+    def test_digit_sums(self):
+        """
+        `test_digit_sums`
+
+        Tests that the digit sums kept while counting match summing the digits of each value.
+        """
+        for base in (2, 7, 10, 256):
+            start = randrange(0, 10 ** 6)
+            for value, total in digit_sums(base, start, start + 3000):
+                self.assertEqual(total, sum(naive_digits(value, base)))
+                self.assertEqual(total, digit_sum(value, base))
+
+    def test_search_range(self):
+        """
+        `test_search_range`
+
+        Tests searching for values palindromic in both base 2 and base 10,
+        both in the current process and across processes.
+        """
+        expected = [0, 1, 3, 5, 7, 9, 33, 99, 313, 585, 717, 7447, 9009, 15351, 32223, 39993,
+                    53235, 53835, 73737, 585585]
+        predicate = partial(palindromic_in, bases=(2, 10))
+        self.assertEqual(list(search_range(predicate, 0, 10 ** 6, palindrome_base=10)), expected)
+        self.assertEqual(list(search_range(predicate, 0, 10 ** 5)), expected[:-1])
+        self.assertEqual(list(search_range(predicate, 0, 10 ** 6, palindrome_base=2,
+                                           workers=2, chunk_size=50)), expected)
+
+    def test_palindrome_chunks(self):
+        """
+        `test_palindrome_chunks`
+
+        Tests that the chunks palindrome searches are split into cover the range in order,
+        each holding at most the chunk size in palindromes, rather than in values.
+        """
+        for base in (2, 3, 10, 16):
+            for _ in range(20):
+                start = randrange(0, 10 ** 6)
+                stop = start + randrange(0, 10 ** 6)
+                size = randrange(1, 50)
+                chunks = list(_palindrome_chunks(base, start, stop, size))
+                found = [list(palindromes(base, s, e)) for s, e in chunks]
+                self.assertEqual(sum(found, []), list(palindromes(base, start, stop)))
+                self.assertTrue(all(len(f) <= size for f in found))
+                self.assertEqual([s for s, _ in chunks[1:]], [e for _, e in chunks[:-1]])
+        self.assertEqual(len(list(_palindrome_chunks(10, 10 ** 9, 10 ** 10, 1 << 16))), 2)
+
+
+if __name__ == '__main__':
+    main()
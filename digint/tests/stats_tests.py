@@ -0,0 +1,118 @@
+"""
+stats_tests
+
+Holds test cases that specifically test the hot path instrumentation defined in `stats`.
+"""
+
+import asyncio
+from unittest import TestCase, main
+from random import randrange
+from .. import stats
+from .. import digint as digint_module
+from ..digint import digitint, PositionalBasedIntiger
+from ..conversion import power
+from ..aio import digit_blocks
+from ..userint import ExtendedUserInt
+
+
+class StatsTests(TestCase):
+    """
+    `StatsTests`
+
+    Tests the enabling, counting and exporting of the instrumentation.
+    """
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+
+    def test_swapping(self):
+        """
+        `test_swapping`
+
+        Tests that enabling swaps in the instrumented hot paths,
+        and disabling swaps back the originals.
+        """
+        originals = (PositionalBasedIntiger.__dict__["digit_length"],
+                     PositionalBasedIntiger.__dict__["__len__"],
+                     ExtendedUserInt.__dict__["x"],
+                     digint_module.power)
+        stats.enable()
+        self.assertTrue(stats.is_enabled())
+        self.assertIsNot(PositionalBasedIntiger.__dict__["digit_length"], originals[0])
+        self.assertIs(PositionalBasedIntiger.__dict__["__len__"],
+                      PositionalBasedIntiger.__dict__["digit_length"])
+        stats.enable(True)
+        stats.disable()
+        self.assertFalse(stats.is_enabled())
+        self.assertEqual((PositionalBasedIntiger.__dict__["digit_length"],
+                          PositionalBasedIntiger.__dict__["__len__"],
+                          ExtendedUserInt.__dict__["x"],
+                          digint_module.power), originals)
+
+    def test_counting(self):
+        """
+        `test_counting`
+
+        Tests that calls are counted once each, even through overrides calling `super()`,
+        and that nothing is counted while disabled.
+        """
+        changes = []
+        val = randrange(10 ** 50, 10 ** 60)
+        with stats.collecting() as counts:
+            dintobj = digitint(val)
+            dintobj.on_changed = lambda s, old: changes.append(old)
+            for i in range(10):
+                dintobj.get_digit(i)
+            len(dintobj)
+            list(dintobj)
+            list(dintobj)
+            dintobj.x += 1
+        self.assertEqual(counts["get_single_digit"], 10)
+        self.assertEqual(counts["on_changed"], 1)
+        self.assertEqual(changes, [val])
+        self.assertEqual(counts["digit_cache_misses"], 1)
+        self.assertEqual(counts["digit_cache_hits"], 1)
+        self.assertEqual(counts["x_writes"], 3)
+        self.assertEqual(stats.TIMES, {})
+
+        before = dict(stats.COUNTS)
+        digitint(val).get_digit(3)
+        self.assertEqual(dict(stats.COUNTS), before)
+
+        with stats.collecting(timing=True) as counts:
+            power.cache_clear()
+            digint_module.power(7, 100)
+            digint_module.power(7, 100)
+        self.assertEqual((counts["power_cache_misses"], counts["power_cache_hits"]), (1, 1))
+        self.assertEqual(set(stats.TIMES), {"power"})
+
+        async def stream(value:int):
+            return [block async for block in digit_blocks(value, 10, block=64)]
+
+        # the asynchronous streams split values through their own imports of the hot paths
+        with stats.collecting() as counts:
+            asyncio.run(stream(randrange(10 ** 3000)))
+        self.assertGreater(counts["split_divmod"], 0)
+        self.assertGreater(counts["power"], 0)
+
+    def test_exporting(self):
+        """
+        `test_exporting`
+
+        Tests the snapshots and Prometheus text of the counts.
+        """
+        with stats.collecting(timing=True):
+            digitint(12345).notate()
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["counts"]["notate"], 1)
+        self.assertGreaterEqual(snapshot["seconds"]["notate"], 0)
+
+        text = stats.prometheus_text("test")
+        self.assertIn("# TYPE test_calls_total counter\n", text)
+        self.assertIn('test_calls_total{path="notate"} 1\n', text)
+        self.assertIn('test_seconds_total{path="notate"} ', text)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ Holds test cases that specifically test the functions defined in `tools`.
 
 from unittest import TestCase, main
 from random import randrange
-from ..tools import absindex
+from itertools import count
+from concurrent.futures import ThreadPoolExecutor
+from ..tools import absindex, submit_in_order
 
 
 class AbsIndexTests(TestCase):
@@ -111,5 +113,29 @@ class AbsIndexTests(TestCase):
             self.assertEqual(absind, length + index)
 
 
+class SubmitInOrderTests(TestCase):
+    """
+    `SubmitInOrderTests`
+
+    Tests the `submit_in_order` tool function.
+    """
+
+    def test_order(self):
+        """
+        `test_order`
+
+        Tests that results come back in the order of their arguments,
+        and that endless arguments are only taken as results are.
+        """
+        with ThreadPoolExecutor(4) as executor:
+            self.assertEqual(list(submit_in_order(executor, pow, ((i, 2) for i in range(100)), 3)),
+                             [i ** 2 for i in range(100)])
+
+            taken = count()
+            results = submit_in_order(executor, abs, ((next(taken), ) for _ in count()), 3)
+            self.assertEqual([next(results) for _ in range(10)], list(range(10)))
+            self.assertLessEqual(next(taken), 14)
+
+
 if __name__ == '__main__':
     main()
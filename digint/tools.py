@@ -4,8 +4,14 @@ tools
 Holds common tool functions and classes used in the `dint` module.
 """
 
+from collections import deque
+from typing import TYPE_CHECKING
 from .typings import * # pylint:disable=unused-wildcard-import, wildcard-import
 
+if TYPE_CHECKING:
+    # only imported for type checkers, as importing it slows down importing this module
+    from concurrent.futures import Executor
+
 
 def absindex(index:int, reference_length:Union[Sized, int]) -> int:
     """
@@ -103,8 +109,39 @@ def iter_to_slices(i:Iterable[int], reference_length:Union[Sized, int]) -> Tuple
             current_slice = slice(current_slice.start, v+1, 1)
         else:
             slices.append(current_slice)
-            current_slice = None
+            current_slice = slice(v, v+1, 1)
     if current_slice is not None:
         slices.append(current_slice)
 
     return tuple(slices)
+
+
+def submit_in_order(executor:'Executor',
+                    func:Callable[..., Any],
+                    arguments:Iterable[Tuple[Any, ...]],
+                    queued:int
+                    ) -> Iterator[Any]:
+    """
+    `submit_in_order`
+
+    Calls the function with each of the given arguments in the executor,
+    yielding the results in the same order as the arguments.
+    Only `queued` calls are submitted at once, with the next one submitted as each result is
+    taken, so long (or endless) arguments are never consumed up front.
+
+    Arguments:
+        executor -- The executor to call the function in (ie. a `ProcessPoolExecutor`).
+        func -- The function to call.
+        arguments -- The positional arguments of each call.
+        queued -- The most calls submitted but not yet taken at once, at least 1.
+
+    Yields:
+        The result of each call, in order.
+    """
+    pending:deque = deque()
+    for args in arguments:
+        if len(pending) >= queued:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, *args))
+    while len(pending) != 0:
+        yield pending.popleft().result()
@@ -342,6 +342,34 @@ class ExtendedUserInt(UserInt):
         When set to `None` (as by default), no callback will be triggered.
         """
 
+    # sets the raw state of this instance directly, skipping the `x` setter entirely,
+    # with no limits or `on_changed` callback
+    # subclasses extend this (taking any more of their own state) to set their own state
+    def _set_raw(self, x:int):
+        super().__init__(x)
+        self.__x = x
+        self.__high = None
+        self.__low = None
+        self.on_changed = None
+
+    # duplicates the raw state of this instance directly,
+    # skipping `__init__` and the `x` setter entirely
+    # the limits and `on_changed` callback are not carried over,
+    # just as they would not be when constructing a new instance
+    def _clone(self, x:Optional[int] = None) -> 'ExtendedUserInt':
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        ExtendedUserInt._set_raw(clone, self.x if x is None else x)
+        return clone
+
+    # makes an instance holding the given raw state directly, skipping `__init__` and its checks
+    # (ie. when unpickling), where the state is as taken by `_set_raw`
+    @classmethod
+    def _from_raw(cls, *state:Any) -> 'ExtendedUserInt':
+        raw = object.__new__(cls)
+        cls._set_raw(raw, *state)
+        return raw
+
     @property
     def x(self) -> int:
         """